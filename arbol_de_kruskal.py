@@ -1,24 +1,66 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import time
+from array import array
+
+from kruskal_red_electrica import invertir_orden, ordenar_por_metros
+
+# networkx / matplotlib se importan sólo al dibujar: calcular no los necesita
+SPRING_LIMIT = 2000      # nodos máximos para spring_layout (arriba: posiciones al azar)
+LABEL_LIMIT = 150        # aristas máximas con etiqueta de peso
+NODE_LABEL_LIMIT = 200   # nodos máximos dibujados grandes y con su número
 
 class KruskalSimulator:
     def __init__(self, vertices):
         self.V = vertices
         self.edges = [] # Lista de aristas: [peso, u, v]
+        self._sorted = None # Orden ascendente en caché (None = hay que reordenar)
+        self._layout = None # Posiciones para dibujar en caché (None = recalcular)
         
-        # Estructuras para Union-Find
-        self.parent = list(range(vertices))
-        self.rank = [0] * vertices
+        # Estructuras para Union-Find (buffers compactos de enteros)
+        self.parent = array('l', range(vertices))
+        self.rank = array('B', bytes(vertices))
 
     def add_edge(self, u, v, w):
         self.edges.append([w, u, v])
+        self._sorted = None
+        self._layout = None
+
+    def sorted_edges(self, mode='min'):
+        """Aristas en orden de Kruskal; se ordena una sola vez hasta el próximo add_edge"""
+        if self._sorted is None:
+            self._sorted = ordenar_por_metros(self.edges, 'min', indice=0)
+        if mode == 'max':
+            return invertir_orden(self._sorted, peso=lambda item: item[0])
+        return self._sorted
 
     # --- FUNCIONES DE UNION-FIND ---
     def find(self, i):
-        """Encuentra la raíz de un nodo con compresión de ruta"""
-        if self.parent[i] != i:
-            self.parent[i] = self.find(self.parent[i])
-        return self.parent[i]
+        """Encuentra la raíz de un nodo con compresión de ruta (iterativa, a la mitad)"""
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def find_measured(self, i, stats):
+        """find que además anota el largo del camino en stats (EstadisticasKruskal)"""
+        parent = self.parent
+        length = 0
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+            length += 1
+        stats.anotar_find(length)
+        return i
+
+    def union_measured(self, i, j, stats):
+        """union que cuenta finds, uniones y ciclos en stats"""
+        root_i = self.find_measured(i, stats)
+        root_j = self.find_measured(j, stats)
+        if root_i == root_j:
+            stats.ciclos += 1
+            return False
+        stats.uniones += 1
+        return self.union(root_i, root_j)
 
     def union(self, i, j):
         """Une dos subconjuntos (árboles) basándose en el rango"""
@@ -37,80 +79,185 @@ class KruskalSimulator:
         return False # Ya estaban conectados (formaría ciclo)
 
     # --- VISUALIZACIÓN ---
-    def show_results(self, result_edges, mode):
-        G = nx.Graph()
-        G.add_nodes_from(range(self.V))
-        
-        # Agregamos TODAS las aristas para el fondo
-        for w, u, v in self.edges:
-            G.add_edge(u, v, weight=w)
+    def layout(self):
+        """
+        Posiciones (V×2) de los nodos, calculadas una sola vez hasta el próximo add_edge.
+        Hasta SPRING_LIMIT nodos usa spring_layout; arriba (o si networkx no puede
+        con ese tamaño, p. ej. sin SciPy desde 500 nodos), posiciones al azar (O(V)).
+        """
+        if self._layout is None:
+            import numpy as np
+            self._layout = np.random.default_rng(42).uniform(-1, 1, (self.V, 2))
+            if self.V <= SPRING_LIMIT:
+                import networkx as nx
+                G = nx.Graph()
+                G.add_nodes_from(range(self.V))
+                for w, u, v in self.edges:
+                    G.add_edge(u, v, weight=w)
+                try:
+                    pos = nx.spring_layout(G, seed=42)
+                    self._layout = np.array([pos[n] for n in range(self.V)], dtype=float)
+                except ImportError:
+                    pass
+        return self._layout
 
-        pos = nx.spring_layout(G, seed=42)
-        plt.figure(figsize=(10, 7))
+    def show_results(self, result_edges, mode, output=None, pos=None):
+        """
+        Dibuja la red (gris, punteada) y el árbol resultado encima.
+        output: ruta .png/.svg/... para guardar sin ventana (headless);
+                None abre la ventana interactiva con plt.show().
+        pos: posiciones propias (dict nodo → (x, y) o arreglo V×2);
+             por defecto, self.layout().
+        Las etiquetas se recortan arriba de LABEL_LIMIT aristas y NODE_LABEL_LIMIT nodos.
+        """
+        import numpy as np
+        from matplotlib.collections import LineCollection
 
-        # Dibujar todo el grafo en gris
-        nx.draw_networkx_nodes(G, pos, node_size=700, node_color='lightgreen', edgecolors='black')
-        nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold')
-        nx.draw_networkx_edges(G, pos, style='dashed', alpha=0.3, edge_color='gray')
-        
-        # Dibujar aristas del resultado en Azul (Max) o Rojo (Min)
-        mst_style_edges = [(u, v) for w, u, v in result_edges]
+        if pos is None:
+            pos = self.layout()
+        elif isinstance(pos, dict):
+            pos = np.array([pos[n] for n in range(self.V)], dtype=float)
+        pos = np.asarray(pos, dtype=float)
+
+        if output is None:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(10, 7))
+        else:
+            # Figure sin pyplot: no toca el backend ni necesita pantalla
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(10, 7))
+        ax = fig.add_subplot()
+
+        # Todo el grafo en gris, en una sola colección de líneas
+        big = len(self.edges) > LABEL_LIMIT
+        if self.edges:
+            ends = np.array([(u, v) for _, u, v in self.edges])
+            ax.add_collection(LineCollection(pos[ends], colors='gray', alpha=0.3,
+                                             linestyles='solid' if big else 'dashed',
+                                             linewidths=0.5 if big else 1.0, zorder=1))
+
+        # Aristas del resultado en Azul (Max) o Rojo (Min)
         color = 'blue' if mode == 'max' else 'red'
-        nx.draw_networkx_edges(G, pos, edgelist=mst_style_edges, width=3, edge_color=color)
-        
-        # Etiquetas de peso
-        labels = nx.get_edge_attributes(G, 'weight')
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=labels)
+        if result_edges:
+            ends = np.array([(u, v) for _, u, v in result_edges])
+            ax.add_collection(LineCollection(pos[ends], colors=color,
+                                             linewidths=1.5 if big else 3, zorder=2))
+
+        # Nodos
+        few = self.V <= NODE_LABEL_LIMIT
+        ax.scatter(pos[:, 0], pos[:, 1], s=700 if few else max(2, 20000 / self.V),
+                   c='lightgreen', edgecolors='black' if few else 'none', zorder=3)
+        if few:
+            for n, (x, y) in enumerate(pos):
+                ax.text(x, y, str(n), fontsize=12, fontweight='bold',
+                        ha='center', va='center', zorder=4)
+
+        # Etiquetas de peso: todas si caben; si no, sólo las del resultado, salteadas
+        if not big:
+            labeled = self.edges
+        else:
+            step = max(1, -(-len(result_edges) // LABEL_LIMIT))
+            labeled = result_edges[::step]
+        for w, u, v in labeled:
+            x, y = (pos[u] + pos[v]) / 2
+            ax.text(x, y, str(w), fontsize=10 if not big else 7, ha='center', va='center',
+                    bbox=dict(boxstyle='round', ec='none', fc='white', alpha=0.8), zorder=4)
 
         title_mode = "MÁXIMO Coste" if mode == 'max' else "MÍNIMO Coste"
-        plt.title(f"Resultado Kruskal: Árbol de {title_mode}", fontsize=15)
-        plt.axis('off')
-        plt.show()
+        ax.set_title(f"Resultado Kruskal: Árbol de {title_mode}", fontsize=15)
+        ax.autoscale()
+        ax.margins(0.08)
+        ax.axis('off')
+
+        if output is None:
+            plt.show()
+        else:
+            fig.savefig(output, bbox_inches='tight')
 
     # --- ALGORITMO PRINCIPAL ---
-    def ejecutar_kruskal(self, mode='min'):
+    def ejecutar_kruskal(self, mode='min', verbosity='full', on_step=None, show=True, stats=None,
+                         output=None):
+        """
+        verbosity: 'off' (nada), 'summary' (aceptadas + resultado) o 'full' (todo).
+        on_step: callback opcional (evento, w, u, v) con evento en
+                 'accepted' | 'rejected'; no formatea nada por su cuenta.
+        stats: EstadisticasKruskal opcional (kruskal_red_electrica) a llenar
+               con contadores y tiempos (acumulados) de 'orden', 'bucle' y 'render'.
+        output: ruta de imagen (.png/.svg) para dibujar sin ventana; implica dibujar.
+        """
+        summary = verbosity in ('summary', 'full')
+        full = verbosity == 'full'
+
         # Reiniciar Union-Find para cada ejecución
-        self.parent = list(range(self.V))
-        self.rank = [0] * self.V
+        self.parent = array('l', range(self.V))
+        self.rank = array('B', bytes(self.V))
         
         result = []
         i = 0 # Índice para aristas ordenadas
         e = 0 # Contador de aristas en el árbol
 
         # 1. ORDENAR ARISTAS
-        # Si es min: ascendente. Si es max: descendente (reverse=True)
-        is_reverse = True if mode == 'max' else False
-        self.edges = sorted(self.edges, key=lambda item: item[0], reverse=is_reverse)
+        # Si es min: ascendente. Si es max: el mismo orden recorrido hacia atrás
+        start = time.perf_counter()
+        edges = self.sorted_edges(mode)
+        if full:
+            edges = list(edges)
+        if stats is not None:
+            stats.tiempos['orden'] = stats.tiempos.get('orden', 0.0) + time.perf_counter() - start
+            start = time.perf_counter()
+        union = self.union if stats is None else (lambda a, b: self.union_measured(a, b, stats))
 
-        print(f"\n--- INICIO KRUSKAL (Modo: {mode.upper()}) ---")
-        print(f"Aristas ordenadas por peso: {[(w, u, v) for w, u, v in self.edges]}")
+        if summary:
+            print(f"\n--- INICIO KRUSKAL (Modo: {mode.upper()}) ---")
+        if full:
+            print(f"Aristas ordenadas por peso: {[(w, u, v) for w, u, v in edges]}")
 
         # Iterar sobre las aristas ordenadas
-        for w, u, v in self.edges:
+        rejected = 0
+        for w, u, v in edges:
             if e >= self.V - 1: # Ya tenemos V-1 aristas, terminamos
                 break
                 
-            print(f"-> Analizando arista {u}-{v} con peso {w}...")
+            if full:
+                print(f"-> Analizando arista {u}-{v} con peso {w}...")
             
             # 2. VERIFICAR CICLOS (FIND & UNION)
-            if self.union(u, v):
-                print(f"   [ACEPTADA] No forma ciclo. Se agrega al árbol.")
+            if union(u, v):
+                if full:
+                    print(f"   [ACEPTADA] No forma ciclo. Se agrega al árbol.")
+                if on_step is not None:
+                    on_step('accepted', w, u, v)
                 result.append([w, u, v])
                 e += 1
             else:
-                print(f"   [RECHAZADA] Los nodos {u} y {v} ya están conectados. Formaría un ciclo.")
+                if full:
+                    print(f"   [RECHAZADA] Los nodos {u} y {v} ya están conectados. Formaría un ciclo.")
+                if on_step is not None:
+                    on_step('rejected', w, u, v)
+                rejected += 1
+
+        if stats is not None:
+            stats.tiempos['bucle'] = stats.tiempos.get('bucle', 0.0) + time.perf_counter() - start
 
         # Mostrar resultados
-        print("\n" + "="*40)
-        print(f"RESULTADO FINAL ({mode.upper()})")
-        print("="*40)
-        total_cost = 0
-        for w, u, v in result:
-            print(f"{u} -- {v} == {w}")
-            total_cost += w
-        print(f"Costo Total: {total_cost}")
+        total_cost = sum(w for w, u, v in result)
+        if summary:
+            print("\n" + "="*40)
+            print(f"RESULTADO FINAL ({mode.upper()})")
+            print("="*40)
+            for w, u, v in result:
+                print(f"{u} -- {v} == {w}")
+            if not full:
+                print(f"Aristas rechazadas (ciclo): {rejected}")
+            print(f"Costo Total: {total_cost}")
         
-        self.show_results(result, mode)
+        if show or output:
+            start = time.perf_counter()
+            self.show_results(result, mode, output=output)
+            if stats is not None:
+                stats.tiempos['render'] = (stats.tiempos.get('render', 0.0)
+                                           + time.perf_counter() - start)
+        return result, total_cost
 
 # --- EJECUCIÓN ---
 if __name__ == '__main__': 
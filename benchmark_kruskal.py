@@ -0,0 +1,399 @@
+"""
+═══════════════════════════════════════════════
+Benchmarks de Kruskal sobre fraccionamientos sintéticos
+
+Generadores:
+  cuadricula  → manzanas en rejilla (cada punto con su vecino
+                derecho e inferior)
+  geometrico  → puntos al azar unidos si están a menos de un radio
+  completo    → todos contra todos
+  palmas      → copias de "Las Palmas" unidas por cables troncales
+
+Mide por separado orden, Union-Find y log, más el pico de memoria,
+en modo MIN y MAX, y escribe los resultados en JSON para comparar
+corridas entre commits.
+
+Uso:
+  python benchmark_kruskal.py --aristas 10 1000 100000 --salida bench.json
+═══════════════════════════════════════════════
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from kruskal_red_electrica import (UnionFind, Verbosidad, cargar_ejemplo, ejecutar_kruskal,
+                                   ordenar_por_metros)
+
+
+TAMANOS = [10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+# ═══════════════════════════════════════════════
+#  GENERADORES DE FRACCIONAMIENTOS
+# ═══════════════════════════════════════════════
+# Todos reciben el número aproximado de aristas deseado y una semilla,
+# y devuelven (nodos, aristas, tipos) como las estructuras clásicas.
+
+def _tipos_por_defecto(nodos, cada=25):
+    """Un transformador cada `cada` puntos, el resto casas."""
+    return {n: ("transformador" if i % cada == 0 else "casa")
+            for i, n in enumerate(nodos)}
+
+
+def generar_cuadricula(aristas, semilla=0):
+    """Rejilla lado × lado: ~2·lado² cables entre vecinos de manzana."""
+    rng  = random.Random(semilla)
+    lado = max(2, int(math.sqrt(aristas / 2)) + 1)
+    nodos = [f"P{f}_{c}" for f in range(lado) for c in range(lado)]
+    cables = []
+    for f in range(lado):
+        for c in range(lado):
+            if c + 1 < lado:
+                cables.append((f"P{f}_{c}", f"P{f}_{c+1}", rng.randint(5, 60)))
+            if f + 1 < lado:
+                cables.append((f"P{f}_{c}", f"P{f+1}_{c}", rng.randint(5, 60)))
+    return nodos, cables, _tipos_por_defecto(nodos)
+
+
+def generar_geometrico(aristas, semilla=0, grado=8):
+    """
+    Grafo geométrico aleatorio: V puntos en un terreno de 1000×1000 m,
+    unidos si están a menos del radio que da ~`grado` vecinos por punto.
+    """
+    rng = random.Random(semilla)
+    V   = max(grado, 2 * aristas // grado)
+    lado  = 1000.0
+    radio = math.sqrt(grado * lado * lado / (math.pi * V))
+    puntos = [(rng.uniform(0, lado), rng.uniform(0, lado)) for _ in range(V)]
+
+    # Cubetas de tamaño `radio` para no comparar todos contra todos
+    cubetas = {}
+    for i, (x, y) in enumerate(puntos):
+        cubetas.setdefault((int(x // radio), int(y // radio)), []).append(i)
+
+    nodos  = [f"G{i}" for i in range(V)]
+    cables = []
+    for (cx, cy), miembros in cubetas.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in cubetas.get((cx + dx, cy + dy), ()):
+                    for i in miembros:
+                        if i < j:
+                            d = math.dist(puntos[i], puntos[j])
+                            if d <= radio:
+                                cables.append((nodos[i], nodos[j], max(1, round(d))))
+    return nodos, cables, _tipos_por_defecto(nodos)
+
+
+def generar_completo(aristas, semilla=0):
+    """Grafo completo con V(V-1)/2 ≈ aristas."""
+    rng = random.Random(semilla)
+    V   = max(2, int((1 + math.sqrt(1 + 8 * aristas)) / 2))
+    nodos  = [f"K{i}" for i in range(V)]
+    cables = [(nodos[i], nodos[j], rng.randint(1, 500))
+              for i in range(V) for j in range(i + 1, V)]
+    return nodos, cables, _tipos_por_defecto(nodos)
+
+
+def generar_palmas(aristas, semilla=0):
+    """
+    "Las Palmas" replicado: cada copia aporta 17 cables y se enlaza
+    con la anterior por un cable troncal entre transformadores.
+    """
+    rng  = random.Random(semilla)
+    base = cargar_ejemplo()
+    copias = max(1, aristas // (len(base.aristas) + 1))
+    nodos, cables, tipos = [], [], {}
+    for k in range(copias):
+        for n in base.nodos:
+            nodos.append(f"{n} #{k}")
+            tipos[f"{n} #{k}"] = base.tipos[n]
+        for u, v, m in base.aristas:
+            cables.append((f"{u} #{k}", f"{v} #{k}", m + rng.randint(-3, 3)))
+        if k:
+            cables.append((f"Transf. Sur #{k-1}", f"Transf. Norte #{k}", rng.randint(80, 200)))
+    return nodos, cables, tipos
+
+
+GENERADORES = {
+    "cuadricula": generar_cuadricula,
+    "geometrico": generar_geometrico,
+    "completo":   generar_completo,
+    "palmas":     generar_palmas,
+}
+
+
+# ═══════════════════════════════════════════════
+#  MEDICIONES
+# ═══════════════════════════════════════════════
+
+def _cronometrar(funcion, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcion(*args, **kwargs)
+    return time.perf_counter() - inicio, resultado
+
+
+def _pico_memoria(funcion, *args, **kwargs):
+    """Pico de memoria (bytes) asignada por Python durante la llamada."""
+    tracemalloc.start()
+    try:
+        funcion(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def medir_kruskal(nodos, aristas, modo):
+    """
+    Tiempos por fase de `ejecutar_kruskal`:
+        orden       → sólo `ordenar_por_metros`
+        union_find  → corrida sin log menos el orden
+        log         → costo extra de registrar y formatear el log completo
+    """
+    t_orden, _ = _cronometrar(ordenar_por_metros, aristas, modo)
+    t_nada, (mst, total, _) = _cronometrar(ejecutar_kruskal, nodos, aristas, modo,
+                                           Verbosidad.NADA)
+
+    def con_log():
+        _, _, pasos = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.COMPLETO)
+        for _ in pasos:
+            pass
+    t_log, _ = _cronometrar(con_log)
+
+    return {
+        "orden_s":      t_orden,
+        "union_find_s": max(0.0, t_nada - t_orden),
+        "log_s":        max(0.0, t_log - t_nada),
+        "total_s":      t_nada,
+        "pico_bytes":   _pico_memoria(ejecutar_kruskal, nodos, aristas, modo, Verbosidad.NADA),
+        "aristas_mst":  len(mst),
+        "costo":        total,
+    }
+
+
+def medir_union_find(nodos, semilla=0):
+    """Uniones y búsquedas al azar sobre los puntos de la red."""
+    rng = random.Random(semilla)
+    t_crear, uf = _cronometrar(UnionFind, nodos)
+    V = len(uf)
+    pares = [(rng.randrange(V), rng.randrange(V)) for _ in range(V)]
+
+    def operar():
+        for a, b in pares:
+            uf.union_id(a, b)
+        for a, _ in pares:
+            uf.find_id(a)
+    t_ops, _ = _cronometrar(operar)
+    return {"crear_s": t_crear, "operaciones": 2 * V, "operaciones_s": t_ops}
+
+
+def medir_simulador(nodos, aristas, modo):
+    """Tiempo de `KruskalSimulator` sin log ni gráfica (si se puede importar)."""
+    try:
+        from arbol_de_kruskal import KruskalSimulator
+    except ImportError as e:
+        return {"omitido": str(e)}
+
+    ids = {n: i for i, n in enumerate(nodos)}
+    sim = KruskalSimulator(len(nodos))
+    for u, v, m in aristas:
+        sim.add_edge(ids[u], ids[v], m)
+    t, _ = _cronometrar(sim.ejecutar_kruskal, mode=modo, verbosity="off", show=False)
+    return {"total_s": t}
+
+
+def medir_orden(tamanos, anchos, semilla=0, repeticiones=5):
+    """
+    `sorted` contra el paso por cubetas de `ordenar_por_metros` (con el
+    rango garantizado, como lo pasa RedElectrica) para E cables con
+    metros enteros en [1, W]. Sirve para fijar MIN_CUBETAS y
+    ARISTAS_POR_CUBETA.
+    """
+    from itertools import chain
+    from operator import itemgetter
+
+    def cubetas(aristas, ancho):
+        # El mismo paso que ordenar_por_metros, sin sus umbrales
+        grupos  = [[] for _ in range(ancho)]
+        agregar = [g.append for g in grupos]
+        for arista in aristas:
+            agregar[arista[2] - 1](arista)
+        return list(chain.from_iterable(grupos))
+
+    rng   = random.Random(semilla)
+    casos = []
+    for E in tamanos:
+        for W in anchos:
+            aristas = [(f"P{rng.randrange(1000)}", "Q", rng.randint(1, W)) for _ in range(E)]
+            t_sorted = min(_cronometrar(sorted, aristas, key=itemgetter(2))[0]
+                           for _ in range(repeticiones))
+            t_cubetas = min(_cronometrar(cubetas, aristas, W)[0] for _ in range(repeticiones))
+            t_usado = min(_cronometrar(ordenar_por_metros, aristas, rango=(1, W))[0]
+                          for _ in range(repeticiones))
+            casos.append({"aristas": E, "ancho": W, "sorted_s": t_sorted,
+                          "cubetas_s": t_cubetas, "ordenar_por_metros_s": t_usado})
+    return casos
+
+
+def _red_con_densidad(V, densidad, semilla=0):
+    """V puntos con cada par unido con probabilidad `densidad` (1.0 = completo)."""
+    rng = random.Random(semilla)
+    nodos  = [f"D{i}" for i in range(V)]
+    cables = [(nodos[i], nodos[j], rng.randint(1, 500))
+              for i in range(V) for j in range(i + 1, V)
+              if densidad >= 1.0 or rng.random() < densidad]
+    return nodos, cables
+
+
+def medir_motores(vertices, densidades, modo="min", semilla=0, repeticiones=3):
+    """
+    Mejor de `repeticiones` para cada motor de prim.py contra Kruskal,
+    con la red como lista de tuplas (la entrada de `resolver_con_motor`).
+    prim_denso incluye armar la matriz. Respalda que no haya selección
+    automática de motor (Kruskal gana en todas las densidades).
+    """
+    import prim
+
+    motores = {"kruskal": lambda n, a: ejecutar_kruskal(n, a, modo, Verbosidad.NADA),
+               "prim_heap": lambda n, a: prim.prim_heap(n, a, modo, Verbosidad.NADA)}
+    if prim.np is not None:
+        def denso(n, a):
+            nombres, W, existe = prim.matriz_desde_aristas(n, a, modo)
+            return prim.prim_denso(nombres, W, modo, existe, Verbosidad.NADA)
+        motores["prim_denso"] = denso
+
+    casos = []
+    for V in vertices:
+        for densidad in densidades:
+            nodos, aristas = _red_con_densidad(V, densidad, semilla)
+            caso = {"nodos": V, "aristas": len(aristas), "densidad": densidad}
+            for nombre, motor in motores.items():
+                caso[nombre + "_s"] = min(_cronometrar(motor, nodos, aristas)[0]
+                                          for _ in range(repeticiones))
+            caso["mejor"] = min(motores, key=lambda m: caso[m + "_s"])
+            casos.append(caso)
+    return casos
+
+
+def _commit_actual():
+    """Commit del código medido (el de este archivo, no el del directorio actual)."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def correr(tamanos, generadores, modos, semilla=0, simulador=True, al_caso=None):
+    """
+    Corre la batería completa y devuelve un dict serializable a JSON.
+    `al_caso(caso)` se llama tras cada medición (para ir mostrando avance).
+    """
+    casos = []
+    for nombre in generadores:
+        for tam in tamanos:
+            t_gen, (nodos, aristas, _) = _cronometrar(GENERADORES[nombre], tam, semilla)
+            for modo in modos:
+                caso = {
+                    "generador": nombre,
+                    "aristas_objetivo": tam,
+                    "nodos": len(nodos),
+                    "aristas": len(aristas),
+                    "modo": modo,
+                    "generar_s": t_gen,
+                    "kruskal": medir_kruskal(nodos, aristas, modo),
+                }
+                if modo == modos[0]:
+                    caso["union_find"] = medir_union_find(nodos, semilla)
+                if simulador:
+                    caso["simulador"] = medir_simulador(nodos, aristas, modo)
+                casos.append(caso)
+                if al_caso is not None:
+                    al_caso(caso)
+    return {
+        "commit":     _commit_actual(),
+        "python":     sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "fecha":      time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "casos":      casos,
+    }
+
+
+# ═══════════════════════════════════════════════
+#  PROGRAMA PRINCIPAL
+# ═══════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de Kruskal")
+    parser.add_argument("--aristas", type=int, nargs="+", default=TAMANOS[:5],
+                        help="tamaños (aristas aproximadas); hasta 10^7")
+    parser.add_argument("--generadores", nargs="+", default=list(GENERADORES),
+                        choices=list(GENERADORES))
+    parser.add_argument("--modos", nargs="+", default=["min", "max"], choices=["min", "max"])
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--sin-simulador", action="store_true",
+                        help="no medir KruskalSimulator")
+    parser.add_argument("--orden", action="store_true",
+                        help="comparar sorted contra las cubetas de ordenar_por_metros")
+    parser.add_argument("--motores", action="store_true",
+                        help="comparar Kruskal contra los motores Prim por densidad")
+    parser.add_argument("--salida", help="archivo JSON (por defecto, stdout)")
+    args = parser.parse_args(argv)
+
+    if args.orden:
+        reporte = {"commit": _commit_actual(), "python": sys.version.split()[0],
+                   "casos": medir_orden([10_000, 100_000, 200_000, 1_000_000],
+                                        [60, 200, 1_000, 5_000, 60_000], args.semilla)}
+        for caso in reporte["casos"]:
+            print(f"  E={caso['aristas']:<8} W={caso['ancho']:<6} "
+                  f"sorted {caso['sorted_s'] * 1e3:8.2f}ms  "
+                  f"cubetas {caso['cubetas_s'] * 1e3:8.2f}ms  "
+                  f"→ ordenar_por_metros {caso['ordenar_por_metros_s'] * 1e3:8.2f}ms",
+                  file=sys.stderr)
+        _escribir(reporte, args.salida)
+        return
+
+    if args.motores:
+        reporte = {"commit": _commit_actual(), "python": sys.version.split()[0],
+                   "casos": medir_motores([200, 500, 1_000, 1_500],
+                                          [0.01, 0.05, 0.1, 0.3, 0.6, 1.0],
+                                          args.modos[0], args.semilla)}
+        for caso in reporte["casos"]:
+            tiempos = "  ".join(f"{k[:-2]} {v:.4f}s" for k, v in caso.items() if k.endswith("_s"))
+            print(f"  V={caso['nodos']:<5} densidad {caso['densidad']:<4} "
+                  f"E={caso['aristas']:<8} {tiempos}  → {caso['mejor']}", file=sys.stderr)
+        _escribir(reporte, args.salida)
+        return
+
+    def avance(caso):
+        k = caso["kruskal"]
+        print(f"  {caso['generador']:<11} E={caso['aristas']:<9} {caso['modo']}  "
+              f"orden {k['orden_s']:.4f}s  uf {k['union_find_s']:.4f}s  "
+              f"log {k['log_s']:.4f}s  pico {k['pico_bytes'] / 2**20:.1f} MiB",
+              file=sys.stderr)
+
+    reporte = correr(args.aristas, args.generadores, args.modos, args.semilla,
+                     simulador=not args.sin_simulador, al_caso=avance)
+    _escribir(reporte, args.salida)
+
+
+def _escribir(reporte, salida):
+    texto = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if salida:
+        with open(salida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
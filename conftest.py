@@ -0,0 +1,25 @@
+"""Fixtures compartidas por las pruebas (redes chicas al azar, deterministas)."""
+
+import pytest
+
+
+def generar_red(rng, V, E, max_metros=10, multiples=False):
+    """
+    V puntos "p0".."p{V-1}" y E cables con metros en [1, max_metros].
+
+    Sin `multiples` los pares son distintos (a lo más V(V-1)/2 cables);
+    con `multiples` se sortean con reemplazo, así hay cables repetidos
+    entre el mismo par. Con `max_metros` chico abundan los empates.
+    """
+    nodos = [f"p{i}" for i in range(V)]
+    if multiples:
+        pares = [tuple(rng.sample(nodos, 2)) for _ in range(E)] if V >= 2 else []
+    else:
+        pares = [(nodos[i], nodos[j]) for i in range(V) for j in range(i + 1, V)]
+        rng.shuffle(pares)
+    return nodos, [(u, v, rng.randint(1, max_metros)) for u, v in pares[:E]]
+
+
+@pytest.fixture
+def red_al_azar():
+    return generar_red
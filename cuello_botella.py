@@ -0,0 +1,161 @@
+"""
+═══════════════════════════════════════════════
+Índice de cuellos de botella (eslabón más débil)
+En modo MAX el árbol de Kruskal es la red de máxima capacidad:
+el cable más corto de su camino entre dos puntos es el eslabón
+más débil, y ningún otro camino de la red tiene uno mejor
+(maximin). En modo MIN, simétrico: el cable más largo del camino
+es el menor "peor cable" posible (minimax).
+
+Construcción (O(V log V)):
+  1. Árbol de reconstrucción de Kruskal: cada unión crea un nodo
+     interno con el cable que la hizo; los puntos son las hojas.
+  2. Recorrido en orden: entre cada par de hojas consecutivas
+     queda el cable de su ancestro común, así que el eslabón entre
+     dos puntos es el peor cable del rango entre sus posiciones.
+  3. Tabla dispersa (sparse table) de NumPy sobre ese arreglo.
+
+Consulta: O(1), y en lote vectorizada sobre arreglos de pares.
+═══════════════════════════════════════════════
+"""
+
+import numpy as np
+
+from kruskal_red_electrica import UnionFind
+
+
+class IndiceCuelloBotella:
+    """
+    Responde "¿cuál es el cable más débil entre a y b?" sobre un árbol
+    (o bosque) ya calculado por `ejecutar_kruskal` en el mismo modo.
+
+    Atributos:
+        modo     : 'min' | 'max'
+        cables   : list[(u, v, metros)]  → el árbol recibido
+        posicion : dict[nombre] → posición de la hoja en el recorrido
+        brecha   : np.ndarray float64    → metros entre hojas consecutivas
+                   (±∞ entre zonas sin conexión)
+        cable_de : np.ndarray int        → cable (posición en `cables`) de cada brecha
+        tabla    : list[np.ndarray]      → tabla[k][i] = brecha peor en [i, i + 2^k)
+    """
+
+    def __init__(self, nodos, mst, modo="max"):
+        self.modo   = modo
+        self.cables = list(mst)
+        # Peor = el más corto en MAX, el más largo en MIN; entre zonas, peor que todo
+        self._sin_camino = -np.inf if modo == "max" else np.inf
+
+        uf = UnionFind(nodos)
+        V  = len(uf)
+
+        # ── 1. Árbol de reconstrucción: hojas 0..V-1, internos V.. ──
+        orden = sorted(range(len(self.cables)), key=lambda i: self.cables[i][2],
+                       reverse=(modo == "max"))
+        hijos   = []               # por nodo interno: (izquierdo, derecho, cable)
+        nodo_de = list(range(V))   # raíz de Union-Find → nodo del árbol de reconstrucción
+        for i in orden:
+            u, v, _ = self.cables[i]
+            ru, rv = uf.find_id(uf.indice[u]), uf.find_id(uf.indice[v])
+            if ru == rv:
+                raise ValueError(f"El cable '{u}' — '{v}' cierra un ciclo: no es un árbol.")
+            hijos.append((nodo_de[ru], nodo_de[rv], i))
+            uf.union_id(ru, rv)
+            nodo_de[ru if uf.parent[ru] == ru else rv] = V + len(hijos) - 1
+
+        # ── 2. Recorrido en orden de cada zona ──
+        raices = sorted(nodo_de[x] for x in range(V) if uf.parent[x] == x)
+        hojas, brechas = [], []
+        for num, raiz in enumerate(raices):
+            if num:
+                brechas.append(-1)   # salto entre zonas
+            pila, x = [], raiz
+            while pila or x is not None:
+                while x is not None:
+                    pila.append(x)
+                    x = hijos[x - V][0] if x >= V else None
+                x = pila.pop()
+                if x < V:
+                    hojas.append(x)
+                    x = None
+                else:
+                    _, derecho, cable = hijos[x - V]
+                    brechas.append(cable)
+                    x = derecho
+
+        self.posicion = {uf.nombres[h]: p for p, h in enumerate(hojas)}
+        self.cable_de = np.array(brechas, dtype=np.int64)
+        # metros por cable; la última casilla (índice -1) es el salto entre zonas
+        self._metros = np.array([m for _, _, m in self.cables] + [self._sin_camino],
+                                dtype=np.float64)
+        self.brecha = self._metros[self.cable_de]
+
+        # ── 3. Tabla dispersa de posiciones de la peor brecha ──
+        elegir = np.less if modo == "max" else np.greater
+        self.tabla = [np.arange(len(self.brecha), dtype=np.int64)]
+        salto = 1
+        while 2 * salto <= len(self.brecha):
+            previa = self.tabla[-1]
+            a, b = previa[:-salto], previa[salto:]
+            self.tabla.append(np.where(elegir(self.brecha[b], self.brecha[a]), b, a))
+            salto *= 2
+
+    @classmethod
+    def desde_red(cls, red, modo="max"):
+        """Índice sobre el árbol memorizado de una RedElectrica."""
+        return cls(red.nodos, red.resolver(modo)[0], modo)
+
+    # ── Consultas ──
+    def _peor_en_rango(self, l, r):
+        """Posición de la peor brecha en [l, r) (l < r)."""
+        k = (r - l).bit_length() - 1
+        a, b = self.tabla[k][l], self.tabla[k][r - (1 << k)]
+        if self.modo == "max":
+            return b if self.brecha[b] < self.brecha[a] else a
+        return b if self.brecha[b] > self.brecha[a] else a
+
+    def consultar(self, a, b):
+        """
+        Cable más débil (u, v, metros) del camino entre a y b, o None si
+        es el mismo punto o están en zonas sin conexión.
+        """
+        pa, pb = self.posicion[a], self.posicion[b]
+        if pa == pb:
+            return None
+        l, r = min(pa, pb), max(pa, pb)
+        cable = int(self.cable_de[self._peor_en_rango(l, r)])
+        return self.cables[cable] if cable >= 0 else None
+
+    def metros_lote_ids(self, pa, pb):
+        """
+        Versión vectorizada sobre posiciones de hoja (ver `posicion`).
+        Retorna (metros, cable): float64 (NaN = sin camino) y la posición
+        del cable en `cables` (-1 = sin camino) para cada par.
+        """
+        pa, pb = np.asarray(pa, dtype=np.int64), np.asarray(pb, dtype=np.int64)
+        l, r = np.minimum(pa, pb), np.maximum(pa, pb)
+        largo = np.maximum(r - l, 1)
+        k = np.log2(largo).astype(np.int64)
+        k -= (1 << k) > largo            # corrige redondeos de log2
+        metros = np.full(len(l), np.nan)
+        cable  = np.full(len(l), -1, dtype=np.int64)   # -1 también para a == b
+        for nivel in np.unique(k[r > l]):
+            sel = np.nonzero((k == nivel) & (r > l))[0]
+            tabla = self.tabla[nivel]
+            x, y = tabla[l[sel]], tabla[r[sel] - (1 << int(nivel))]
+            peor = (np.where(self.brecha[y] < self.brecha[x], y, x) if self.modo == "max" else
+                    np.where(self.brecha[y] > self.brecha[x], y, x))
+            cable[sel] = self.cable_de[peor]
+        con_camino = cable >= 0
+        metros[con_camino] = self._metros[cable[con_camino]]
+        return metros, cable
+
+    def consultar_lote(self, pares):
+        """
+        Muchas consultas de una vez: lista de (a, b) → lista de cables
+        (u, v, metros) o None, en el mismo orden.
+        """
+        posicion = self.posicion
+        pa = np.fromiter((posicion[a] for a, _ in pares), dtype=np.int64, count=len(pares))
+        pb = np.fromiter((posicion[b] for _, b in pares), dtype=np.int64, count=len(pares))
+        _, cable = self.metros_lote_ids(pa, pb)
+        return [self.cables[i] if i >= 0 else None for i in cable.tolist()]
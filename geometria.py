@@ -0,0 +1,172 @@
+"""
+═══════════════════════════════════════════════
+Modo geométrico — cables candidatos desde coordenadas
+Si los puntos tienen (x, y) en metros, no hace falta capturar los
+cables a mano ni probar todos contra todos (O(V²)): basta con unir
+cada punto con sus vecinos cercanos.
+
+  knn       → cada punto con sus k vecinos más cercanos (árbol k-d).
+              Es O(V·k) cables; en la práctica contiene el árbol
+              mínimo euclidiano, aunque con k chico puede dejar zonas
+              sueltas (el modo bosque de Kruskal las reporta).
+  delaunay  → triangulación de Delaunay (requiere SciPy). Siempre
+              contiene el árbol mínimo euclidiano, con ≤ 3V cables.
+
+Con `max_metros` se descartan cables más largos que ese tope.
+═══════════════════════════════════════════════
+"""
+
+import heapq
+import math
+from itertools import islice
+
+try:
+    from scipy.spatial import Delaunay, cKDTree
+except ImportError:   # SciPy es opcional: sin él se usa el árbol k-d propio
+    Delaunay = cKDTree = None
+
+from kruskal_red_electrica import clave_cable
+
+
+# ═══════════════════════════════════════════════
+#  ÁRBOL K-D (2D)
+# ═══════════════════════════════════════════════
+
+class ArbolKD:
+    """
+    Árbol k-d implícito sobre una lista de puntos (x, y): los índices
+    se reordenan en sitio y cada sub-rango [lo, hi) es un nodo cuyo
+    punto de corte es la mediana.
+    """
+
+    def __init__(self, puntos):
+        self.puntos = puntos
+        self.idx    = list(range(len(puntos)))
+        pila = [(0, len(puntos), 0)]
+        while pila:
+            lo, hi, eje = pila.pop()
+            if hi - lo <= 1:
+                continue
+            self.idx[lo:hi] = sorted(self.idx[lo:hi], key=lambda i: puntos[i][eje])
+            m = (lo + hi) // 2
+            pila.append((lo, m, 1 - eje))
+            pila.append((m + 1, hi, 1 - eje))
+
+    def vecinos(self, q, k):
+        """Los k puntos más cercanos a q como lista de (distancia, índice)."""
+        if k <= 0:
+            return []
+        puntos, idx = self.puntos, self.idx
+        mejores = []   # max-heap de (-d², índice)
+
+        def buscar(lo, hi, eje):
+            if lo >= hi:
+                return
+            m = (lo + hi) // 2
+            p = puntos[idx[m]]
+            d2 = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2
+            if len(mejores) < k:
+                heapq.heappush(mejores, (-d2, idx[m]))
+            elif d2 < -mejores[0][0]:
+                heapq.heapreplace(mejores, (-d2, idx[m]))
+
+            diff = q[eje] - p[eje]
+            cerca, lejos = ((lo, m), (m + 1, hi)) if diff < 0 else ((m + 1, hi), (lo, m))
+            buscar(*cerca, 1 - eje)
+            if len(mejores) < k or diff * diff < -mejores[0][0]:
+                buscar(*lejos, 1 - eje)
+
+        buscar(0, len(idx), 0)
+        return sorted((math.sqrt(-d2), i) for d2, i in mejores)
+
+
+# ═══════════════════════════════════════════════
+#  GENERACIÓN DE CABLES CANDIDATOS
+# ═══════════════════════════════════════════════
+
+def _metros(d, redondear):
+    return max(1, round(d)) if redondear else d
+
+
+def _pares_knn(puntos, k):
+    """
+    Pares (i, j, distancia) de cada punto con sus k vecinos. Se piden
+    k + 1 para saltar al propio punto, pero con puntos repetidos puede
+    venir un gemelo en su lugar: por eso se corta en k tras filtrar.
+    """
+    k = min(k, len(puntos) - 1)
+    if k <= 0:
+        return
+    if cKDTree is not None:
+        distancias, vecinos = cKDTree(puntos).query(puntos, k + 1)
+        filas = (zip(fila_d, fila_j)
+                 for fila_d, fila_j in zip(distancias.tolist(), vecinos.tolist()))
+    else:
+        arbol = ArbolKD(puntos)
+        filas = (arbol.vecinos(p, k + 1) for p in puntos)
+    for i, fila in enumerate(filas):
+        for d, j in islice(((d, j) for d, j in fila if j != i), k):
+            yield i, j, d
+
+
+def _pares_delaunay(puntos):
+    """Pares (i, j, distancia) de las aristas de la triangulación."""
+    if Delaunay is None:
+        raise ImportError("El método 'delaunay' requiere SciPy (pip install scipy).")
+    vistos = set()
+    for a, b, c in Delaunay(puntos).simplices.tolist():
+        for i, j in ((a, b), (b, c), (a, c)):
+            par = (min(i, j), max(i, j))
+            if par not in vistos:
+                vistos.add(par)
+                yield i, j, math.dist(puntos[i], puntos[j])
+
+
+def cables_candidatos(coordenadas, k=8, max_metros=None, metodo="knn", redondear=True):
+    """
+    Cables candidatos entre puntos con coordenadas.
+
+    Parámetros:
+        coordenadas : dict[nombre] → (x, y) en metros
+        k           : vecinos por punto (método 'knn')
+        max_metros  : descarta cables más largos (None = sin tope)
+        metodo      : 'knn' | 'delaunay'
+        redondear   : metros enteros (≥ 1), como los captura el menú
+
+    Retorna:
+        list[tuple(u, v, metros)] sin duplicados, lista para `ejecutar_kruskal`
+    """
+    nombres = list(coordenadas)
+    puntos  = [tuple(coordenadas[n]) for n in nombres]
+    if len(puntos) < 2:
+        return []
+
+    if metodo == "knn":
+        pares = _pares_knn(puntos, k)
+    elif metodo == "delaunay":
+        pares = _pares_delaunay(puntos)
+    else:
+        raise ValueError(f"Método desconocido: {metodo!r}")
+
+    cables = {}
+    for i, j, d in pares:
+        if max_metros is not None and d > max_metros:
+            continue
+        clave = clave_cable(nombres[i], nombres[j])
+        if clave not in cables:
+            cables[clave] = (nombres[i], nombres[j], _metros(d, redondear))
+    return list(cables.values())
+
+
+def agregar_cables_geometricos(red, k=8, max_metros=None, metodo="knn"):
+    """
+    Agrega a una RedElectrica los cables candidatos entre sus puntos
+    con coordenadas, sin tocar los cables que ya existían.
+    Retorna cuántos cables se agregaron.
+    """
+    nuevos = 0
+    for u, v, metros in cables_candidatos(red.coordenadas, k, max_metros, metodo):
+        if not red.tiene_cable(u, v):
+            red.agregar_cable(u, v, metros)
+            nuevos += 1
+    return nuevos
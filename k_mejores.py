@@ -0,0 +1,98 @@
+"""
+═══════════════════════════════════════════════
+Los k mejores árboles de expansión (planes alternativos)
+Si el árbol óptimo no se puede tender (un cable bloqueado en obra),
+¿cuál es el 2º, 3º… k-ésimo mejor plan?
+
+Partición de Lawler (como Katoh–Ibaraki–Mine / Murty): cada
+subproblema es la red con cables forzados dentro y cables
+prohibidos. Al sacar el mejor de la cola de prioridad, su árbol
+e1..en (sin contar los forzados) se parte en n subproblemas:
+
+    i-ésimo → forzados + {e1..e(i-1)},  prohibidos + {ei}
+
+que cubren, sin repetir, todos los árboles restantes de ese
+subproblema. Cada uno se resuelve con `ejecutar_kruskal`
+(forzados al frente del orden, prohibidos fuera) sobre el orden
+compartido de `ordenar_por_metros`.
+
+Con k fijo la cola se recorta a los k pendientes cada vez que
+pasa de 2k (más los hijos del último): los que quedan detrás
+del k-ésimo nunca se van a entregar.
+═══════════════════════════════════════════════
+"""
+
+import heapq
+
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal, ordenar_por_metros
+
+
+def _resolver_restringido(nodos, aristas, orden, forzados, prohibidos, modo):
+    """
+    Mejor árbol con `forzados` dentro y sin `prohibidos` (posiciones
+    en `aristas`). Retorna (total, posiciones del árbol en orden de
+    aceptación) o None si no se puede armar (forzados con ciclo).
+    """
+    fuera = prohibidos | forzados
+    secuencia = list(forzados) + [i for i in orden if i not in fuera]
+    mst, total, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA,
+                                     ordenadas=[aristas[i] for i in secuencia])
+
+    # Kruskal devuelve los cables en orden de aceptación: se recuperan sus
+    # posiciones avanzando por la secuencia (un cable idéntico rechazado
+    # antes que otro aceptado es imposible: tienen los mismos extremos).
+    elegidos, j = [], 0
+    for cable in mst:
+        while tuple(aristas[secuencia[j]]) != cable:
+            j += 1
+        elegidos.append(secuencia[j])
+        j += 1
+    if not forzados <= set(elegidos):
+        return None
+    return total, elegidos
+
+
+def k_mejores_arboles(nodos, aristas, k=None, modo="min"):
+    """
+    Generador de árboles de expansión en orden de costo (MIN: del más
+    barato al más caro; MAX: de mayor a menor capacidad).
+
+    Parámetros:
+        k : cuántos árboles a lo más (None = hasta agotarlos; entonces
+            la cola no tiene tope de memoria)
+
+    Produce (mst, total) con mst como lista de (u, v, metros); el
+    primero es el mismo árbol que da `ejecutar_kruskal`. Si la red no
+    es conexa, enumera bosques de expansión (un árbol por zona).
+    """
+    pesos = [(i, m) for i, (_, _, m) in enumerate(aristas)]
+    orden = [i for i, _ in ordenar_por_metros(pesos, modo, indice=1)]
+    signo = 1 if modo == "min" else -1
+
+    inicial = _resolver_restringido(nodos, aristas, orden, frozenset(), frozenset(), modo)
+    tamano     = len(inicial[1])
+    cola       = [(signo * inicial[0], 0, inicial[1], frozenset(), frozenset())]
+    turno      = 1
+    entregados = 0
+
+    while cola and (k is None or entregados < k):
+        _, _, elegidos, forzados, prohibidos = heapq.heappop(cola)
+        total = sum(aristas[i][2] for i in elegidos)
+        yield [tuple(aristas[i]) for i in elegidos], total
+        entregados += 1
+
+        # ── Partición de Lawler ──
+        libres = [i for i in elegidos if i not in forzados]
+        for n, cable in enumerate(libres):
+            sub_forzados = forzados | frozenset(libres[:n])
+            sub_prohibidos = prohibidos | {cable}
+            hijo = _resolver_restringido(nodos, aristas, orden, sub_forzados, sub_prohibidos, modo)
+            if hijo is None or len(hijo[1]) < tamano:
+                continue
+            heapq.heappush(cola, (signo * hijo[0], turno, hijo[1], sub_forzados, sub_prohibidos))
+            turno += 1
+
+        # Memoria acotada por k: sólo hacen falta los k - entregados mejores
+        if k is not None and len(cola) > 2 * (k - entregados):
+            cola = heapq.nsmallest(k - entregados, cola)
+            heapq.heapify(cola)
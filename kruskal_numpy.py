@@ -0,0 +1,181 @@
+"""
+═══════════════════════════════════════════════
+Motor Kruskal vectorizado con NumPy
+Pensado para listas de millones de cables candidatos.
+
+Las aristas llegan como arreglos paralelos u / v / w (ids enteros
+de nodo y metros). El orden se obtiene con `argsort` estable y el
+filtrado de ciclos se hace por bloques: toda arista cuyos extremos
+ya comparten raíz al inicio del bloque se descarta en lote, y sólo
+las candidatas restantes pasan por el bucle de Python.
+═══════════════════════════════════════════════
+"""
+
+import numpy as np
+
+from kruskal_red_electrica import Paso, RegistroPasos, Verbosidad
+
+
+# ═══════════════════════════════════════════════
+#  CONVERSIÓN DE LA RED A ARREGLOS
+# ═══════════════════════════════════════════════
+
+def aristas_a_arreglos(nodos, aristas):
+    """
+    Convierte la red clásica (nombres + tuplas) en arreglos paralelos.
+
+    Retorna:
+        nombres : list[str]    → id → nombre
+        u, v    : np.ndarray   → ids de los extremos (int32/int64)
+        w       : np.ndarray   → metros de cada cable
+    """
+    indice  = {}
+    nombres = []
+    for n in nodos:
+        if n not in indice:
+            indice[n] = len(nombres)
+            nombres.append(n)
+
+    tipo_id = np.int32 if len(nombres) < 2**31 else np.int64
+    u = np.fromiter((indice[a] for a, _, _ in aristas), dtype=tipo_id, count=len(aristas))
+    v = np.fromiter((indice[b] for _, b, _ in aristas), dtype=tipo_id, count=len(aristas))
+    w = np.array([m for _, _, m in aristas])
+    return nombres, u, v, w
+
+
+# ═══════════════════════════════════════════════
+#  ORDEN Y UNION-FIND VECTORIZADOS
+# ═══════════════════════════════════════════════
+
+def orden_aristas(w, modo="min"):
+    """
+    Permutación que ordena las aristas por peso.
+    Es estable, así que los empates conservan el orden de entrada
+    igual que `sorted(..., reverse=...)` en `ejecutar_kruskal`.
+    """
+    if modo == "max":
+        clave = -w.astype(np.float64) if w.dtype.kind == "u" else -w
+        return np.argsort(clave, kind="stable")
+    return np.argsort(w, kind="stable")
+
+
+def _comprimir(parent):
+    """Salto de punteros hasta que cada nodo apunta directo a su raíz."""
+    while True:
+        abuelo = parent[parent]
+        if np.array_equal(abuelo, parent):
+            return parent
+        parent = abuelo
+
+
+def unir_bloque(parent, us, vs, etiquetas, elegidas, meta):
+    """
+    Procesa en orden un bloque de aristas ya ordenado.
+
+    `parent` debe llegar comprimido (cada nodo apunta a su raíz) y se
+    actualiza en sitio. Las aristas cuyos extremos ya comparten raíz
+    se descartan en lote; las demás pasan por un Union-Find local
+    sobre las raíces tocadas. La etiqueta de cada aceptada se agrega
+    a `elegidas`. Retorna cuántas aristas se rechazaron.
+    """
+    ru = parent[us]
+    rv = parent[vs]
+
+    # ── Filtrado en lote: extremos que ya comparten raíz ──
+    candidatas = np.flatnonzero(ru != rv)
+    rechazadas = len(us) - len(candidatas)
+
+    # ── Union-Find local sobre las raíces tocadas en el bloque ──
+    local = {}
+
+    def raiz(x):
+        while local.get(x, x) != x:
+            local[x] = local.get(local[x], local[x])
+            x = local[x]
+        return x
+
+    uniones = []
+    for k, a, b in zip(candidatas.tolist(),
+                       ru[candidatas].tolist(),
+                       rv[candidatas].tolist()):
+        if len(elegidas) >= meta:
+            break
+        ra, rb = raiz(a), raiz(b)
+        if ra == rb:
+            rechazadas += 1
+            continue
+        local[rb] = ra
+        uniones.append((rb, ra))
+        elegidas.append(etiquetas[k])
+
+    if uniones:
+        hijos, padres = zip(*uniones)
+        parent[list(hijos)] = list(padres)
+        parent[:] = _comprimir(parent)
+
+    return rechazadas
+
+
+# ═══════════════════════════════════════════════
+#  ALGORITMO DE KRUSKAL (NumPy)
+# ═══════════════════════════════════════════════
+
+def ejecutar_kruskal_numpy(nombres, u, v, w, modo="min", bloque=None,
+                           verbosidad=Verbosidad.RESUMEN, al_paso=None):
+    """
+    Kruskal sobre arreglos paralelos con filtrado de ciclos por lotes.
+
+    Parámetros:
+        nombres : list[str]    → id → nombre del punto
+        u, v    : array-like   → ids de los extremos de cada cable
+        w       : array-like   → metros de cada cable
+        modo    : 'min' | 'max'
+        bloque  : aristas por lote (por defecto ~V, mínimo 1024)
+        verbosidad, al_paso : como en `ejecutar_kruskal`
+
+    Retorna el mismo contrato que `ejecutar_kruskal`:
+        mst   : list[tuple(u, v, metros)]  → aristas seleccionadas
+        total : int                         → costo total
+        pasos : RegistroPasos               → log del proceso
+
+    El log a lo más es de nivel RESUMEN (aceptadas + conteo de
+    rechazadas): las descartadas en lote nunca pasan por Python.
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    w = np.asarray(w)
+
+    V    = len(nombres)
+    meta = V - 1
+    if bloque is None:
+        bloque = max(1024, V)
+
+    orden = orden_aristas(w, modo)
+    us, vs, ws = u[orden], v[orden], w[orden]
+
+    parent = np.arange(V, dtype=np.int64)
+    elegidas   = []   # posiciones (en el orden) de las aristas aceptadas
+    rechazadas = 0
+
+    for inicio in range(0, len(orden), bloque):
+        if len(elegidas) >= meta:
+            break
+        fin = min(inicio + bloque, len(orden))
+        rechazadas += unir_bloque(parent, us[inicio:fin], vs[inicio:fin],
+                                  range(inicio, fin), elegidas, meta)
+
+    # ── Resultado por nombre ──
+    sel   = np.asarray(elegidas, dtype=np.int64)
+    mst   = [(nombres[a], nombres[b], m)
+             for a, b, m in zip(us[sel].tolist(), vs[sel].tolist(), ws[sel].tolist())]
+    total = sum(m for _, _, m in mst)
+
+    pasos = RegistroPasos(al_paso)
+    if verbosidad >= Verbosidad.RESUMEN:
+        pasos.registrar(Paso.INICIO, modo)
+        pasos.registrar(Paso.ORDEN, len(orden))
+        for a, b, m in mst:
+            pasos.registrar(Paso.ACEPTADA, a, b, m)
+        pasos.registrar(Paso.RECHAZADAS, rechazadas)
+
+    return mst, total, pasos
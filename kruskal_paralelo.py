@@ -0,0 +1,232 @@
+"""
+═══════════════════════════════════════════════
+Motor Filter-Kruskal multinúcleo
+Reparte el particionado y el filtrado de aristas entre procesos
+de un pool. Las aristas (u, v, w), la lista de candidatas y el
+Union-Find viven en memoria compartida, así que a los procesos
+sólo se les mandan rangos de índices, nunca listas de cables.
+
+Filter-Kruskal:
+  1. Elegir un pivote de peso y partir las candidatas en
+     "livianas" (antes del pivote en el orden) y "pesadas".
+  2. Resolver las livianas recursivamente.
+  3. Filtrar de las pesadas las que ya cierran ciclo y recursar.
+
+Con entradas chicas se usa el motor serial directamente.
+El resultado coincide exactamente con `ejecutar_kruskal`, empates
+incluidos: el orden total es (peso, posición original).
+═══════════════════════════════════════════════
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from kruskal_red_electrica import (Paso, RegistroPasos, Verbosidad,
+                                   ejecutar_kruskal)
+from kruskal_numpy import (aristas_a_arreglos, ejecutar_kruskal_numpy,
+                           unir_bloque)
+
+
+UMBRAL_PARALELO = 200_000   # por debajo de esto no compensa el pool
+UMBRAL_BASE     = 65_536    # candidatas que se resuelven sin partir
+
+
+# ═══════════════════════════════════════════════
+#  MEMORIA COMPARTIDA
+# ═══════════════════════════════════════════════
+
+class _ArregloCompartido:
+    """Arreglo NumPy respaldado por un bloque de `shared_memory`."""
+
+    def __init__(self, forma, dtype, nombre=None):
+        dtype = np.dtype(dtype)
+        tam   = max(1, int(np.prod(forma)) * dtype.itemsize)
+        if nombre is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=tam)
+        else:
+            self.shm = shared_memory.SharedMemory(name=nombre)
+        self.arr = np.ndarray(forma, dtype=dtype, buffer=self.shm.buf)
+        self.meta = (forma, dtype.str, self.shm.name)
+
+    def cerrar(self, borrar=False):
+        del self.arr
+        self.shm.close()
+        if borrar:
+            self.shm.unlink()
+
+
+# Estado de cada proceso trabajador (se llena en el inicializador)
+_compartido = {}
+
+
+def _inicializar(metas):
+    for clave, (forma, dtype, nombre) in metas.items():
+        _compartido[clave] = _ArregloCompartido(forma, dtype, nombre)
+
+
+def _tarea_particion(args):
+    """Marca en `mascara` las candidatas [a, b) cuya clave es ≤ pivote."""
+    a, b, pivote = args
+    cand  = _compartido["cand"].arr[a:b]
+    clave = _compartido["clave"].arr
+    _compartido["mascara"].arr[a:b] = clave[cand] <= pivote
+
+
+def _tarea_filtro(args):
+    """Marca en `mascara` las candidatas [a, b) que aún unen componentes."""
+    a, b = args
+    cand   = _compartido["cand"].arr[a:b]
+    parent = _compartido["parent"].arr
+    u, v   = _compartido["u"].arr, _compartido["v"].arr
+    _compartido["mascara"].arr[a:b] = parent[u[cand]] != parent[v[cand]]
+
+
+# ═══════════════════════════════════════════════
+#  FILTER-KRUSKAL
+# ═══════════════════════════════════════════════
+
+class _FilterKruskal:
+
+    def __init__(self, pool, workers, arreglos, meta):
+        self.pool     = pool
+        self.workers  = workers
+        self.a        = {k: x.arr for k, x in arreglos.items()}
+        self.meta     = meta
+        self.elegidas = []
+        self.rechazadas = 0
+
+    def _en_paralelo(self, tarea, cand, *extra):
+        """Copia las candidatas a memoria compartida y reparte la máscara."""
+        n = len(cand)
+        self.a["cand"][:n] = cand
+        trozo = -(-n // (self.workers * 4))
+        rangos = [(i, min(i + trozo, n)) + extra for i in range(0, n, trozo)]
+        list(self.pool.map(tarea, rangos))
+        return self.a["mascara"][:n].copy()
+
+    def _base(self, cand):
+        """Ordena las candidatas por (clave, posición) y las une en orden."""
+        orden = cand[np.argsort(self.a["clave"][cand], kind="stable")]
+        u, v, parent = self.a["u"], self.a["v"], self.a["parent"]
+        bloque = max(1024, len(parent))
+        for i in range(0, len(orden), bloque):
+            if len(self.elegidas) >= self.meta:
+                return
+            trozo = orden[i:i + bloque]
+            self.rechazadas += unir_bloque(parent, u[trozo], v[trozo],
+                                           trozo.tolist(), self.elegidas, self.meta)
+
+    def resolver(self, cand):
+        # `cand` siempre queda en orden creciente de posición original,
+        # así el argsort estable de la base respeta los empates.
+        if len(self.elegidas) >= self.meta or len(cand) == 0:
+            return
+        clave = self.a["clave"]
+        if len(cand) <= UMBRAL_BASE:
+            return self._base(cand)
+
+        muestra = clave[cand[np.random.default_rng(len(cand)).integers(0, len(cand), 1024)]]
+        pivote  = np.median(muestra)
+        livianas = self._en_paralelo(_tarea_particion, cand, pivote)
+        if livianas.all():
+            # Todos los pesos ≤ pivote (p. ej. muchos empates): sin progreso
+            return self._base(cand)
+
+        self.resolver(cand[livianas])
+        if len(self.elegidas) >= self.meta:
+            return
+
+        pesadas = cand[~livianas]
+        vivas   = self._en_paralelo(_tarea_filtro, pesadas)
+        self.rechazadas += len(pesadas) - int(vivas.sum())
+        self.resolver(pesadas[vivas])
+
+
+# ═══════════════════════════════════════════════
+#  PUNTOS DE ENTRADA
+# ═══════════════════════════════════════════════
+
+def kruskal_paralelo_arreglos(nombres, u, v, w, modo="min", workers=None,
+                              umbral=UMBRAL_PARALELO,
+                              verbosidad=Verbosidad.RESUMEN, al_paso=None):
+    """
+    Filter-Kruskal multinúcleo sobre arreglos paralelos u / v / w.
+
+    Parámetros:
+        workers : procesos del pool (por defecto os.cpu_count())
+        umbral  : con menos aristas se usa `ejecutar_kruskal_numpy`
+
+    Retorna el mismo contrato que `ejecutar_kruskal`.
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    w = np.asarray(w)
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(w) < umbral:
+        return ejecutar_kruskal_numpy(nombres, u, v, w, modo,
+                                      verbosidad=verbosidad, al_paso=al_paso)
+
+    # Clave de orden: en MAX se niega el peso para ordenar siempre ascendente
+    clave = w.astype(np.float64) if w.dtype.kind in "ub" else w
+    if modo == "max":
+        clave = -clave
+
+    E, V = len(w), len(nombres)
+    arreglos = {
+        "u":       _ArregloCompartido((E,), u.dtype),
+        "v":       _ArregloCompartido((E,), v.dtype),
+        "clave":   _ArregloCompartido((E,), clave.dtype),
+        "cand":    _ArregloCompartido((E,), np.int64),
+        "mascara": _ArregloCompartido((E,), np.bool_),
+        "parent":  _ArregloCompartido((V,), np.int64),
+    }
+    try:
+        arreglos["u"].arr[:]      = u
+        arreglos["v"].arr[:]      = v
+        arreglos["clave"].arr[:]  = clave
+        arreglos["parent"].arr[:] = np.arange(V)
+
+        metas = {k: x.meta for k, x in arreglos.items()}
+        with ProcessPoolExecutor(workers, initializer=_inicializar,
+                                 initargs=(metas,)) as pool:
+            fk = _FilterKruskal(pool, workers, arreglos, V - 1)
+            fk.resolver(np.arange(E, dtype=np.int64))
+        elegidas, rechazadas = fk.elegidas, fk.rechazadas
+    finally:
+        fk = None   # suelta las vistas antes de cerrar la memoria compartida
+        for x in arreglos.values():
+            x.cerrar(borrar=True)
+
+    mst   = [(nombres[a], nombres[b], m) for a, b, m in
+             zip(u[elegidas].tolist(), v[elegidas].tolist(), w[elegidas].tolist())]
+    total = sum(m for _, _, m in mst)
+
+    pasos = RegistroPasos(al_paso)
+    if verbosidad >= Verbosidad.RESUMEN:
+        pasos.registrar(Paso.INICIO, modo)
+        pasos.registrar(Paso.ORDEN, E)
+        for a, b, m in mst:
+            pasos.registrar(Paso.ACEPTADA, a, b, m)
+        pasos.registrar(Paso.RECHAZADAS, rechazadas)
+
+    return mst, total, pasos
+
+
+def ejecutar_kruskal_paralelo(nodos, aristas, modo="min", workers=None,
+                              umbral=UMBRAL_PARALELO,
+                              verbosidad=Verbosidad.RESUMEN, al_paso=None):
+    """
+    Igual que `ejecutar_kruskal` pero repartido entre `workers` procesos.
+    Con pocas aristas (o un solo worker) delega en el motor serial.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(aristas) < umbral:
+        return ejecutar_kruskal(nodos, aristas, modo, verbosidad, al_paso)
+
+    nombres, u, v, w = aristas_a_arreglos(nodos, aristas)
+    return kruskal_paralelo_arreglos(nombres, u, v, w, modo, workers, umbral=0,
+                                     verbosidad=verbosidad, al_paso=al_paso)
@@ -11,8 +11,13 @@ Interfaz terminal interactiva ·
 ═══════════════════════════════════════════════
 """
 
-import os
 import sys
+import time
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import chain, islice
+from operator import itemgetter
 
 
 # ═══════════════════════════════════════════════
@@ -43,113 +48,795 @@ class UnionFind:
     """
     Estructura Union-Find con compresión de ruta y unión por rango.
     Permite detectar ciclos eficientemente — clave en Kruskal.
+
+    Los nombres de los nodos se convierten una sola vez en ids enteros
+    densos (0..V-1); padre y rango viven en buffers `array` en lugar de
+    diccionarios, y `find` es iterativo (división de ruta a la mitad),
+    así que no hay RecursionError en cadenas largas.
     """
 
     def __init__(self, nodos):
-        # Cada nodo es su propio padre al inicio
-        self.parent = {n: n for n in nodos}
-        self.rank   = {n: 0 for n in nodos}
+        # Internado: nombre → id entero, id → nombre
+        self.indice  = {}
+        self.nombres = []
+        for n in nodos:
+            if n not in self.indice:
+                self.indice[n] = len(self.nombres)
+                self.nombres.append(n)
 
-    def find(self, i):
+        # Cada nodo es su propio padre al inicio
+        total = len(self.nombres)
+        self.parent = array("l", range(total))
+        self.rank   = array("B", bytes(total))
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def agregar(self, nombre):
+        """Interna un nodo nuevo (o devuelve su id si ya existía)."""
+        if nombre not in self.indice:
+            self.indice[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+            self.parent.append(len(self.parent))
+            self.rank.append(0)
+        return self.indice[nombre]
+
+    def reiniciar(self):
+        """Vuelve a conjuntos separados sin repetir el internado de nombres."""
+        total = len(self.nombres)
+        self.parent = array("l", range(total))
+        self.rank   = array("B", bytes(total))
+
+    def find_id(self, x):
         """
-        Encuentra la raíz del conjunto al que pertenece i.
-        Aplica compresión de ruta: aplana el árbol para futuras búsquedas.
+        Encuentra la raíz (como id entero) del conjunto al que pertenece x.
+        Aplica división de ruta: cada nodo visitado salta a su abuelo.
         """
-        if self.parent[i] != i:
-            self.parent[i] = self.find(self.parent[i])  # compresión
-        return self.parent[i]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # compresión
+            x = parent[x]
+        return x
 
-    def union(self, i, j):
+    def union_id(self, a, b):
         """
-        Une los conjuntos de i y j.
+        Une los conjuntos de los ids a y b.
         Retorna True si se unieron (no había ciclo),
                 False si ya estaban en el mismo conjunto (formaría ciclo).
         """
-        raiz_i = self.find(i)
-        raiz_j = self.find(j)
+        raiz_a = self.find_id(a)
+        raiz_b = self.find_id(b)
 
-        if raiz_i == raiz_j:
+        if raiz_a == raiz_b:
             return False  # Ya conectados → ciclo detectado
 
         # Unión por rango: el árbol más pequeño cuelga del más grande
-        if self.rank[raiz_i] < self.rank[raiz_j]:
-            self.parent[raiz_i] = raiz_j
-        elif self.rank[raiz_i] > self.rank[raiz_j]:
-            self.parent[raiz_j] = raiz_i
+        rank = self.rank
+        if rank[raiz_a] < rank[raiz_b]:
+            self.parent[raiz_a] = raiz_b
+        elif rank[raiz_a] > rank[raiz_b]:
+            self.parent[raiz_b] = raiz_a
         else:
-            self.parent[raiz_j] = raiz_i
-            self.rank[raiz_i] += 1
+            self.parent[raiz_b] = raiz_a
+            rank[raiz_a] += 1
 
         return True  # Unión exitosa
 
+    def find(self, i):
+        """Encuentra la raíz (por nombre) del conjunto al que pertenece i."""
+        return self.nombres[self.find_id(self.indice[i])]
+
+    def union(self, i, j):
+        """Une los conjuntos de los nodos i y j (por nombre)."""
+        return self.union_id(self.indice[i], self.indice[j])
+
+    # ── Variantes medidas (sólo se usan si hay estadísticas) ──
+    def find_id_medido(self, x, stats):
+        """Como `find_id`, pero anota en `stats` el largo del camino recorrido."""
+        parent = self.parent
+        largo  = 0
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+            largo += 1
+        stats.anotar_find(largo)
+        return x
+
+    def union_id_medido(self, a, b, stats):
+        """Como `union_id`, pero cuenta finds, uniones y ciclos en `stats`."""
+        raiz_a = self.find_id_medido(a, stats)
+        raiz_b = self.find_id_medido(b, stats)
+        if raiz_a == raiz_b:
+            stats.ciclos += 1
+            return False
+        stats.uniones += 1
+        return self.union_id(raiz_a, raiz_b)
+
+
+def etiqueta_modo(modo):
+    """Texto del modo para los logs del proceso."""
+    return "MENOR costo (MIN)" if modo == "min" else "MAYOR capacidad (MAX)"
+
+
+# ═══════════════════════════════════════════════
+#  REGISTRO DE PASOS (log perezoso por niveles)
+# ═══════════════════════════════════════════════
+
+class Verbosidad:
+    NADA     = 0   # sin log: sólo el resultado
+    RESUMEN  = 1   # encabezado, aceptadas y conteo de rechazadas
+    COMPLETO = 2   # lista ordenada completa y cada decisión
+
+
+class Paso:
+    """Tipos de evento que emite Kruskal durante el proceso."""
+    INICIO     = "inicio"       # (INICIO, modo)
+    ORDEN      = "orden"        # (ORDEN, aristas_ord | cantidad)
+    ACEPTADA   = "aceptada"     # (ACEPTADA, u, v, metros)
+    RECHAZADA  = "rechazada"    # (RECHAZADA, u, v, metros)
+    RECHAZADAS = "rechazadas"   # (RECHAZADAS, cantidad)
+    MOTOR      = "motor"        # (MOTOR, descripción) cuando no se usa Kruskal
+
+
+def formatear_evento(evento):
+    """Genera las líneas de texto de un evento (sólo cuando se piden)."""
+    tipo = evento[0]
+    if tipo == Paso.INICIO:
+        yield f"▶  Modo {etiqueta_modo(evento[1])}"
+    elif tipo == Paso.ORDEN:
+        ordenadas = evento[1]
+        if isinstance(ordenadas, int):
+            yield f"   Aristas ordenadas ({ordenadas})"
+        else:
+            yield f"   Aristas ordenadas ({len(ordenadas)}):"
+            for u, v, m in ordenadas:
+                yield f"      {u} ↔ {v}  =  {m} m"
+        yield ""
+    elif tipo == Paso.ACEPTADA:
+        _, u, v, metros = evento
+        yield (f"   ✔  ACEPTADA  {u} ↔ {v}  ({metros} m)  "
+               f"— sin ciclo, se añade al árbol")
+    elif tipo == Paso.RECHAZADA:
+        _, u, v, metros = evento
+        yield (f"   ✘  RECHAZADA {u} ↔ {v}  ({metros} m)  "
+               f"— formaría ciclo")
+    elif tipo == Paso.RECHAZADAS:
+        yield f"   ✘  {evento[1]} aristas rechazadas por formar ciclo"
+    elif tipo == Paso.MOTOR:
+        yield f"   Motor: {evento[1]}"
+        yield ""
+
+
+class RegistroPasos:
+    """
+    Log del proceso guardado como eventos compactos (tuplas).
+    Las líneas de texto se formatean sólo al recorrerlo, así que un
+    log que nadie lee no cuesta f-strings. Se comporta como la lista
+    de strings de siempre: se puede iterar, medir e indexar.
+
+    al_paso : callback opcional que recibe cada evento al emitirse.
+    """
+
+    def __init__(self, al_paso=None):
+        self.eventos = []
+        self.al_paso = al_paso
+        self._hasta  = [0]   # _hasta[k] = líneas de los primeros k eventos
+
+    def registrar(self, *evento):
+        self.eventos.append(evento)
+        if self.al_paso is not None:
+            self.al_paso(evento)
+
+    @staticmethod
+    def _lineas_de(evento):
+        """Cuántas líneas da `formatear_evento(evento)`, sin formatearlas."""
+        if evento[0] == Paso.ORDEN and not isinstance(evento[1], int):
+            return len(evento[1]) + 2
+        if evento[0] in (Paso.ORDEN, Paso.MOTOR):
+            return 2
+        return 1
+
+    def _acumulado(self):
+        """Suma de líneas por evento, extendida sólo con los eventos nuevos."""
+        hasta = self._hasta
+        for evento in self.eventos[len(hasta) - 1:]:
+            hasta.append(hasta[-1] + self._lineas_de(evento))
+        return hasta
+
+    def __iter__(self):
+        for evento in self.eventos:
+            yield from formatear_evento(evento)
+
+    def __len__(self):
+        return self._acumulado()[-1]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        hasta = self._acumulado()
+        if i < 0:
+            i += hasta[-1]
+        if not 0 <= i < hasta[-1]:
+            raise IndexError("índice de línea fuera de rango")
+        k = bisect_right(hasta, i) - 1           # evento que contiene la línea i
+        return next(islice(formatear_evento(self.eventos[k]), i - hasta[k], None))
+
+    def __bool__(self):
+        return bool(self.eventos)
+
+    def lineas(self, maximo=None, cada=1):
+        """
+        Recorre el log muestreando una de cada `cada` líneas y
+        cortando tras `maximo`; al cortar avisa cuántas de las que se
+        habrían mostrado (con el mismo muestreo) se omitieron.
+        """
+        emitidas = 0
+        for i, linea in enumerate(self):
+            if i % cada:
+                continue
+            if maximo is not None and emitidas >= maximo:
+                restantes = -(-(len(self) - i) // cada)
+                yield f"   … {restantes} líneas más omitidas"
+                return
+            emitidas += 1
+            yield linea
+
+
+# ═══════════════════════════════════════════════
+#  ESTADÍSTICAS Y PERFILADO
+# ═══════════════════════════════════════════════
+
+class EstadisticasKruskal:
+    """
+    Contadores opcionales de una corrida de Kruskal.
+    Si no se pasa un objeto de estos, Kruskal usa su camino rápido
+    sin ninguna medición.
+
+        finds            : llamadas a find
+        recorrido_total  : saltos de padre acumulados en todos los finds
+        recorrido_max    : camino más largo recorrido en un find
+        uniones          : aristas aceptadas (uniones hechas)
+        ciclos           : aristas rechazadas por formar ciclo
+        tiempos          : dict fase → segundos ('orden', 'bucle', 'render')
+        pico_memoria     : bytes (sólo con `perfilar(..., memoria=True)`)
+        perfil           : texto de cProfile (sólo con `perfilar(..., cprofile=True)`)
+    """
+
+    def __init__(self):
+        self.finds           = 0
+        self.recorrido_total = 0
+        self.recorrido_max   = 0
+        self.uniones         = 0
+        self.ciclos          = 0
+        self.tiempos         = {}
+        self.pico_memoria    = None
+        self.perfil          = None
+
+    @property
+    def examinadas(self):
+        """Aristas revisadas antes de terminar (aceptadas + rechazadas)."""
+        return self.uniones + self.ciclos
+
+    def anotar_find(self, largo):
+        self.finds += 1
+        self.recorrido_total += largo
+        if largo > self.recorrido_max:
+            self.recorrido_max = largo
+
+    @contextmanager
+    def fase(self, nombre):
+        """Acumula el tiempo de pared del bloque en `tiempos[nombre]`."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + time.perf_counter() - inicio
+
+    def como_dict(self):
+        return {
+            "finds": self.finds,
+            "recorrido_total": self.recorrido_total,
+            "recorrido_max": self.recorrido_max,
+            "uniones": self.uniones,
+            "ciclos": self.ciclos,
+            "examinadas": self.examinadas,
+            "tiempos": dict(self.tiempos),
+            "pico_memoria": self.pico_memoria,
+        }
+
+    def resumen(self):
+        """Una línea con lo esencial, para mostrar tras el cálculo."""
+        medio = self.recorrido_total / self.finds if self.finds else 0.0
+        tiempos = "  ".join(f"{k} {v * 1000:.2f}ms" for k, v in self.tiempos.items())
+        return (f"{self.examinadas} examinadas · {self.uniones} uniones · "
+                f"{self.ciclos} ciclos · {self.finds} finds "
+                f"(camino medio {medio:.2f}, máx {self.recorrido_max}) · {tiempos}")
+
+
+def perfilar(funcion, *args, stats=None, cprofile=True, memoria=True, **kwargs):
+    """
+    Ejecuta `funcion(*args, **kwargs)` bajo cProfile y/o tracemalloc.
+    Si se pasa `stats`, también se le entrega a la función (que debe
+    aceptar `stats=`, como `ejecutar_kruskal`) y ahí se guardan el pico
+    de memoria y las 20 funciones más costosas.
+    Devuelve el resultado de la función.
+    """
+    if stats is not None:
+        kwargs["stats"] = stats
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+
+    perfil = cProfile.Profile() if cprofile else None
+    if memoria:
+        tracemalloc.start()
+    try:
+        if perfil is not None:
+            perfil.enable()
+        resultado = funcion(*args, **kwargs)
+    finally:
+        if perfil is not None:
+            perfil.disable()
+        if memoria:
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    if stats is not None:
+        if memoria:
+            stats.pico_memoria = pico
+        if perfil is not None:
+            texto = io.StringIO()
+            pstats.Stats(perfil, stream=texto).sort_stats("cumulative").print_stats(20)
+            stats.perfil = texto.getvalue()
+    return resultado
+
 
 # ═══════════════════════════════════════════════
 #  ALGORITMO DE KRUSKAL
 # ═══════════════════════════════════════════════
 
-def ejecutar_kruskal(nodos, aristas, modo="min"):
+MIN_CUBETAS        = 10_000   # con menos cables no hay nada que ganar
+ARISTAS_POR_CUBETA = 50       # cubetas sólo si máx - mín + 1 ≤ E / 50 (benchmark_kruskal.py --orden)
+
+
+def ordenar_por_metros(aristas, modo="min", indice=2, rango=None):
+    """
+    Aristas en el orden de Kruskal: MIN ascendente, MAX descendente,
+    con los empates en su orden original en ambos modos.
+
+    Parámetros:
+        rango : (mínimo, máximo) de los pesos, sólo si quien llama
+                garantiza que todos son int (RedElectrica lo lleva al
+                día al agregar cables). Con muchos cables y pocos
+                valores distintos se ordena por cubetas en O(E + W),
+                W = máximo - mínimo + 1, sin revisar tipos cable por
+                cable; si no, `sorted` estable con `itemgetter`.
+    """
+    reverso = modo == "max"
+    if rango is not None and len(aristas) >= MIN_CUBETAS:
+        bajo, alto = rango
+        ancho = alto - bajo + 1
+        if ancho * ARISTAS_POR_CUBETA <= len(aristas):
+            cubetas = [[] for _ in range(ancho)]
+            agregar = [cubeta.append for cubeta in cubetas]
+            for arista in aristas:
+                agregar[arista[indice] - bajo](arista)
+            # MAX recorre las cubetas al revés sin invertir su contenido:
+            # los empates quedan en orden de llegada, como con sorted
+            return list(chain.from_iterable(reversed(cubetas) if reverso else cubetas))
+    return sorted(aristas, key=itemgetter(indice), reverse=reverso)
+
+
+def invertir_orden(ascendentes, peso=lambda x: x[2]):
+    """
+    Recorre hacia atrás una lista ordenada de forma ascendente y
+    estable, produciendo el orden descendente estable (el mismo que
+    `sorted(..., reverse=True)`): los grupos de empate salen del más
+    pesado al más liviano, pero cada grupo conserva su orden original.
+    """
+    fin = len(ascendentes)
+    while fin > 0:
+        inicio = fin - 1
+        w = peso(ascendentes[inicio])
+        while inicio > 0 and peso(ascendentes[inicio - 1]) == w:
+            inicio -= 1
+        yield from ascendentes[inicio:fin]
+        fin = inicio
+
+
+def ejecutar_kruskal(nodos, aristas, modo="min",
+                     verbosidad=Verbosidad.COMPLETO, al_paso=None, stats=None,
+                     meta=None, ordenadas=None, uf=None):
     """
     Algoritmo de Kruskal para Árbol de Expansión Mínima o Máxima.
 
     Parámetros:
-        nodos   : list[str]                  → nombres de los puntos
-        aristas : list[tuple(u, v, metros)]  → conexiones con costo
-        modo    : 'min' | 'max'
+        nodos      : list[str]                  → nombres de los puntos
+        aristas    : list[tuple(u, v, metros)]  → conexiones con costo
+        modo       : 'min' | 'max'
+        verbosidad : Verbosidad.NADA | RESUMEN | COMPLETO
+        al_paso    : callback(evento) opcional, recibe cada paso al vuelo
+        stats      : EstadisticasKruskal opcional a llenar con contadores
+        meta       : aristas a aceptar antes de parar (por defecto V-1)
+        ordenadas  : iterable opcional con `aristas` ya en el orden del
+                     modo (p. ej. el de la caché de RedElectrica); evita el sort
+        uf         : UnionFind opcional ya internado con `nodos`; se reinicia
+                     y se reutiliza en lugar de construir uno nuevo
 
     Retorna:
         mst   : list[tuple(u, v, metros)]  → aristas seleccionadas
         total : int                         → costo total
-        pasos : list[str]                   → log del proceso
+        pasos : RegistroPasos               → log del proceso (perezoso)
     """
 
-    pasos = []
-    uf    = UnionFind(nodos)
+    pasos   = RegistroPasos(al_paso)
+    if uf is None:
+        uf = UnionFind(nodos)
+    else:
+        uf.reiniciar()
+    resumen = verbosidad >= Verbosidad.RESUMEN
+    detalle = verbosidad >= Verbosidad.COMPLETO
 
     # ── 1. Ordenar aristas ──
     # MIN → ascendente (primero las más baratas)
     # MAX → descendente (primero las de mayor capacidad)
-    aristas_ord = sorted(aristas, key=lambda x: x[2], reverse=(modo == "max"))
+    if stats is not None:
+        inicio = time.perf_counter()
+    if ordenadas is None:
+        aristas_ord = ordenar_por_metros(aristas, modo)
+    elif detalle and not isinstance(ordenadas, list):
+        aristas_ord = list(ordenadas)
+    else:
+        aristas_ord = ordenadas
+    if stats is not None:
+        stats.tiempos["orden"] = stats.tiempos.get("orden", 0.0) + time.perf_counter() - inicio
+        inicio = time.perf_counter()
 
-    etiqueta = "MENOR costo (MIN)" if modo == "min" else "MAYOR capacidad (MAX)"
-    pasos.append(f"▶  Modo {etiqueta}")
-    pasos.append(f"   Aristas ordenadas ({len(aristas_ord)}):")
-    for u, v, m in aristas_ord:
-        pasos.append(f"      {u} ↔ {v}  =  {m} m")
-    pasos.append("")
+    if resumen:
+        pasos.registrar(Paso.INICIO, modo)
+        pasos.registrar(Paso.ORDEN, aristas_ord if detalle else len(aristas))
 
     # ── 2. Iterar aristas en orden ──
     mst   = []
     total = 0
-    meta  = len(nodos) - 1   # necesitamos exactamente V-1 aristas
+    if meta is None:
+        meta = len(nodos) - 1   # necesitamos exactamente V-1 aristas
+
+    ids        = uf.indice
+    rechazadas = 0
+    if stats is None:
+        unir = uf.union_id
+    else:
+        unir = lambda a, b: uf.union_id_medido(a, b, stats)
 
     for u, v, metros in aristas_ord:
         if len(mst) >= meta:
             break
 
-        if uf.union(u, v):
+        if unir(ids[u], ids[v]):
             # Aceptada: no forma ciclo
             mst.append((u, v, metros))
             total += metros
-            pasos.append(
-                f"   ✔  ACEPTADA  {u} ↔ {v}  ({metros} m)  "
-                f"— sin ciclo, se añade al árbol"
-            )
-        else:
+            if resumen:
+                pasos.registrar(Paso.ACEPTADA, u, v, metros)
+        elif detalle:
             # Rechazada: formaría ciclo
-            pasos.append(
-                f"   ✘  RECHAZADA {u} ↔ {v}  ({metros} m)  "
-                f"— formaría ciclo"
-            )
+            pasos.registrar(Paso.RECHAZADA, u, v, metros)
+        else:
+            rechazadas += 1
+
+    if resumen and not detalle:
+        pasos.registrar(Paso.RECHAZADAS, rechazadas)
+    if stats is not None:
+        stats.tiempos["bucle"] = stats.tiempos.get("bucle", 0.0) + time.perf_counter() - inicio
 
     return mst, total, pasos
 
 
+def componentes_conexas(nodos, aristas):
+    """
+    Componentes conexas de la red con una pasada de Union-Find.
+
+    Retorna:
+        grupos : list[list[str]]  → puntos de cada componente, en el
+                                    orden en que aparecen en `nodos`
+        zona   : dict[nombre] → índice de su componente en `grupos`
+    """
+    uf  = UnionFind(nodos)
+    ids = uf.indice
+    for u, v, _ in aristas:
+        uf.union_id(ids[u], ids[v])
+
+    grupos   = []
+    por_raiz = {}
+    zona     = {}
+    for nombre in uf.nombres:
+        raiz = uf.find_id(ids[nombre])
+        if raiz not in por_raiz:
+            por_raiz[raiz] = len(grupos)
+            grupos.append([])
+        zona[nombre] = por_raiz[raiz]
+        grupos[por_raiz[raiz]].append(nombre)
+    return grupos, zona
+
+
+def ejecutar_kruskal_bosque(nodos, aristas, modo="min",
+                            verbosidad=Verbosidad.COMPLETO, al_paso=None, stats=None,
+                            ordenadas=None, componentes=None, uf=None):
+    """
+    Bosque de expansión mínimo/máximo para redes no conexas
+    (p. ej. dos zonas de transformador sin cable de unión).
+
+    Calcula primero las componentes y corta Kruskal en cuanto acepta
+    V - componentes aristas, en lugar de recorrer todas las que quedan.
+    `ordenadas` y `uf` se pasan tal cual a `ejecutar_kruskal`; `componentes`
+    permite reutilizar un `componentes_conexas` ya calculado.
+
+    Retorna:
+        bosque : list[tuple(nodos, mst, total)]  → un árbol por componente
+        total  : int                              → costo total del bosque
+        pasos  : RegistroPasos                    → log del proceso
+    """
+    componentes = componentes or componentes_conexas(nodos, aristas)
+    grupos, zona = componentes
+    mst, total, pasos = ejecutar_kruskal(nodos, aristas, modo, verbosidad, al_paso,
+                                         stats, meta=len(zona) - len(grupos),
+                                         ordenadas=ordenadas, uf=uf)
+    return dividir_por_zona(mst, componentes), total, pasos
+
+
+def dividir_por_zona(mst, componentes):
+    """Reparte los cables de un bosque en (nodos, mst, total) por componente."""
+    grupos, zona = componentes
+    arboles = [[] for _ in grupos]
+    totales = [0] * len(grupos)
+    for u, v, metros in mst:
+        arboles[zona[u]].append((u, v, metros))
+        totales[zona[u]] += metros
+    return list(zip(grupos, arboles, totales))
+
+
+# ═══════════════════════════════════════════════
+#  MODELO DE LA RED
+# ═══════════════════════════════════════════════
+
+TIPOS_PUNTO = ("transformador", "casa", "edificio")
+
+
+def clave_cable(u, v):
+    """Clave canónica de un cable, independiente del sentido."""
+    return (u, v) if u <= v else (v, u)
+
+
+class RedElectrica:
+    """
+    Estado de la red con índices para que altas y consultas sean O(1).
+
+    Mantiene las estructuras de siempre (para pasarlas directo a
+    `ejecutar_kruskal`):
+        nodos   : list[str]
+        aristas : list[tuple(u, v, metros)]
+        tipos   : dict[nombre] → tipo
+
+    y además:
+        indice     : dict[nombre] → id entero (posición en `nodos`)
+        cables     : dict[(min(u,v), max(u,v))] → posición en `aristas`
+        por_tipo   : dict[tipo] → set de nombres
+        adyacencia : dict[nombre] → dict[vecino] → metros
+        coordenadas: dict[nombre] → (x, y) en metros (opcional por punto)
+        version    : contador que sube con cada edición
+        metros_enteros : True mientras todos los metros sean int
+        rango_metros   : (mín, máx) de los metros si son todos int, si no None
+
+    El orden de cables por metros se calcula una sola vez por versión
+    y sirve para ambos modos (MAX lo recorre hacia atrás); los
+    resultados de Kruskal se memorizan por modo hasta la próxima edición.
+    """
+
+    def __init__(self):
+        self.nodos      = []
+        self.aristas    = []
+        self.tipos      = {}
+        self.indice     = {}
+        self.cables     = {}
+        self.por_tipo   = {t: set() for t in TIPOS_PUNTO}
+        self.adyacencia = {}
+        self.coordenadas = {}
+        self.version    = 0
+        self.metros_enteros = True
+        self.rango_metros   = None
+        self._vistas    = {}   # vistas y resultados memorizados, por versión
+        self._uf        = None # Union-Find internado, reutilizado entre cálculos
+
+    @classmethod
+    def desde_listas(cls, nodos, aristas, tipos=None, coordenadas=None):
+        """Construye la red a partir de las listas sueltas clásicas."""
+        red = cls()
+        tipos = tipos or {}
+        coordenadas = coordenadas or {}
+        for n in nodos:
+            red.agregar_punto(n, tipos.get(n, "casa"), coordenadas.get(n))
+        for u, v, metros in aristas:
+            red.agregar_cable(u, v, metros)
+        return red
+
+    @classmethod
+    def desde_dict(cls, dato):
+        """
+        Construye la red desde su forma JSON:
+            {"nodos": [...], "tipos": {nombre: tipo}, "cables": [[u, v, metros], ...],
+             "coordenadas": {nombre: [x, y]}}   ← opcional
+
+        Lanza ValueError si la forma no es ésa (p. ej. un cable sin
+        metros o con metros que no son número), antes de armar nada.
+        """
+        def es_numero(x):
+            return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+        if not isinstance(dato, dict):
+            raise ValueError("La red debe ser un objeto con 'nodos' y 'cables'.")
+        nodos, cables = dato.get("nodos", []), dato.get("cables", [])
+        tipos, coordenadas = dato.get("tipos", {}), dato.get("coordenadas", {})
+        if not isinstance(nodos, list) or not all(isinstance(n, str) for n in nodos):
+            raise ValueError("'nodos' debe ser una lista de nombres (texto).")
+        if not isinstance(cables, list):
+            raise ValueError("'cables' debe ser una lista de [u, v, metros].")
+        for cable in cables:
+            if (not isinstance(cable, (list, tuple)) or len(cable) != 3
+                    or not isinstance(cable[0], str) or not isinstance(cable[1], str)
+                    or not es_numero(cable[2])):
+                raise ValueError(f"Cable inválido: {cable!r} (se espera [u, v, metros]).")
+        if not isinstance(tipos, dict):
+            raise ValueError("'tipos' debe ser un objeto {nombre: tipo}.")
+        if not isinstance(coordenadas, dict) or not all(
+                isinstance(xy, (list, tuple)) and len(xy) == 2 and all(map(es_numero, xy))
+                for xy in coordenadas.values()):
+            raise ValueError("'coordenadas' debe ser un objeto {nombre: [x, y]}.")
+        return cls.desde_listas(nodos, [tuple(cable) for cable in cables], tipos, coordenadas)
+
+    def como_dict(self):
+        """Forma JSON de la red (inversa de `desde_dict`)."""
+        dato = {
+            "nodos":  list(self.nodos),
+            "tipos":  dict(self.tipos),
+            "cables": [list(cable) for cable in self.aristas],
+        }
+        if self.coordenadas:
+            dato["coordenadas"] = {n: list(xy) for n, xy in self.coordenadas.items()}
+        return dato
+
+    def __contains__(self, nombre):
+        return nombre in self.indice
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def tiene_cable(self, u, v):
+        return clave_cable(u, v) in self.cables
+
+    def metros(self, u, v):
+        return self.aristas[self.cables[clave_cable(u, v)]][2]
+
+    # ── Ediciones ──
+    def agregar_punto(self, nombre, tipo="casa", coords=None):
+        if nombre in self.indice:
+            raise ValueError(f"'{nombre}' ya existe.")
+        if coords is not None:
+            self.coordenadas[nombre] = (float(coords[0]), float(coords[1]))
+        self.indice[nombre] = len(self.nodos)
+        self.nodos.append(nombre)
+        self.tipos[nombre] = tipo
+        self.por_tipo.setdefault(tipo, set()).add(nombre)
+        self.adyacencia[nombre] = {}
+        if self._uf is not None:
+            self._uf.agregar(nombre)
+        self.invalidar()
+
+    def agregar_cable(self, u, v, metros):
+        if u not in self.indice:
+            raise KeyError(f"'{u}' no existe.")
+        if v not in self.indice:
+            raise KeyError(f"'{v}' no existe.")
+        if u == v:
+            raise ValueError("Origen y destino iguales.")
+        clave = clave_cable(u, v)
+        if clave in self.cables:
+            raise ValueError("Ya existe un cable entre esos puntos.")
+        self.cables[clave] = len(self.aristas)
+        self.aristas.append((u, v, metros))
+        if self.metros_enteros and type(metros) is int:
+            bajo, alto = self.rango_metros or (metros, metros)
+            self.rango_metros = (min(bajo, metros), max(alto, metros))
+        else:
+            self.metros_enteros = False
+            self.rango_metros   = None
+        self.adyacencia[u][v] = metros
+        self.adyacencia[v][u] = metros
+        self.invalidar()
+
+    def invalidar(self):
+        """Marca la red como editada: descarta órdenes y resultados guardados."""
+        self.version += 1
+        self._vistas.clear()
+
+    # ── Vistas ordenadas (se recalculan sólo si la red cambió) ──
+    def _vista(self, nombre, calcular):
+        guardada = self._vistas.get(nombre)
+        if guardada is None or guardada[0] != self.version:
+            guardada = (self.version, calcular())
+            self._vistas[nombre] = guardada
+        return guardada[1]
+
+    def puntos_de_tipo(self, tipo):
+        """Nombres de un tipo, ordenados alfabéticamente."""
+        return self._vista(("tipo", tipo), lambda: sorted(self.por_tipo.get(tipo, ())))
+
+    def cables_por_metros(self):
+        """Cables ordenados de menor a mayor longitud (estable)."""
+        return self._vista("cables",
+                           lambda: ordenar_por_metros(self.aristas, rango=self.rango_metros))
+
+    def orden_para(self, modo):
+        """Iterable de cables en el orden de Kruskal para `modo`, sin volver a ordenar."""
+        ascendentes = self.cables_por_metros()
+        return invertir_orden(ascendentes) if modo == "max" else ascendentes
+
+    def componentes(self):
+        return self._vista("componentes", lambda: componentes_conexas(self.nodos, self.aristas))
+
+    def union_find(self):
+        """Union-Find con los nombres ya internados; sobrevive a las ediciones."""
+        if self._uf is None:
+            self._uf = UnionFind(self.nodos)
+        return self._uf
+
+    # ── Resultados memorizados ──
+    def resolver(self, modo="min", verbosidad=Verbosidad.NADA):
+        """`ejecutar_kruskal` memorizado: (mst, total, pasos) hasta la próxima edición."""
+        return self._vista(("kruskal", modo, verbosidad), lambda: ejecutar_kruskal(
+            self.nodos, self.aristas, modo, verbosidad, ordenadas=self.orden_para(modo),
+            uf=self.union_find()))
+
+    def resolver_bosque(self, modo="min", verbosidad=Verbosidad.NADA, stats=None,
+                        motor="kruskal"):
+        """
+        `ejecutar_kruskal_bosque` memorizado. `stats` sólo se llena
+        cuando de verdad se calcula (no en un acierto de la memoria).
+        motor: 'kruskal' | 'prim_denso' | 'prim_heap' (ver prim.py)
+        """
+        return self._vista(("bosque", modo, verbosidad, motor),
+                           lambda: self._calcular_bosque(modo, verbosidad, stats, motor))
+
+    def cuello_botella(self, modo="max"):
+        """Índice de eslabón más débil (cuello_botella.py) memorizado por modo."""
+        from cuello_botella import IndiceCuelloBotella
+        return self._vista(("cuello", modo), lambda: IndiceCuelloBotella.desde_red(self, modo))
+
+    def _calcular_bosque(self, modo, verbosidad, stats, motor):
+        if motor == "kruskal":
+            return ejecutar_kruskal_bosque(
+                self.nodos, self.aristas, modo, verbosidad, stats=stats,
+                ordenadas=self.orden_para(modo), componentes=self.componentes(),
+                uf=self.union_find())
+
+        from prim import resolver_con_motor
+        mst, total, pasos = resolver_con_motor(self.nodos, self.aristas, motor, modo,
+                                               verbosidad, stats=stats)
+        return dividir_por_zona(mst, self.componentes()), total, pasos
+
+
 # ═══════════════════════════════════════════════
 #  UTILIDADES DE TERMINAL
 # ═══════════════════════════════════════════════
 
+LIMITE_LOG = 400   # líneas del log de Kruskal que se muestran en pantalla
+
 def limpiar():
-    os.system("cls" if os.name == "nt" else "clear")
+    # Secuencia ANSI en lugar de lanzar `clear` en un subproceso; fuera de
+    # una terminal (tuberías, pruebas, servidor) no se escribe nada.
+    if sys.stdout.isatty():
+        print("\033[2J\033[H", end="", flush=True)
 
 def sep(ancho=52, color=Color.GRIS):
     print(c("  " + "─" * ancho, color))
@@ -171,6 +858,18 @@ def pedir_entero(msg, minimo=1):
         except ValueError:
             print(c("  ⚠  Ingresa un número entero.", Color.AMARILLO))
 
+def pedir_coordenadas(msg):
+    """Lee 'x,y' (en metros); cadena vacía → None."""
+    while True:
+        texto = input(msg).strip()
+        if not texto:
+            return None
+        try:
+            x, y = (float(t) for t in texto.replace(";", ",").split(","))
+            return x, y
+        except ValueError:
+            print(c("  ⚠  Escribe dos números separados por coma (ej: 120, 45.5).", Color.AMARILLO))
+
 def pedir_opcion(opciones):
     while True:
         op = input("  Opción: ").strip().lower()
@@ -178,9 +877,9 @@ def pedir_opcion(opciones):
             return op
         print(c("  ⚠  Opción no válida.", Color.AMARILLO))
 
-def listar_puntos(nodos, tipos):
-    for nombre in sorted(nodos):
-        tipo  = tipos.get(nombre, "casa")
+def listar_puntos(red):
+    for nombre in sorted(red.nodos):
+        tipo  = red.tipos.get(nombre, "casa")
         emoji = "🔌" if tipo == "transformador" else ("🏠" if tipo == "casa" else "🏢")
         print(f"    {emoji}  {c(nombre, Color.BLANCO)}")
 
@@ -227,7 +926,7 @@ def dibujar_arbol(mst, nodos, tipos, total, modo):
 #  MENÚS
 # ═══════════════════════════════════════════════
 
-def menu_agregar_punto(nodos, tipos):
+def menu_agregar_punto(red):
     sep()
     print(c("  ➕  AGREGAR PUNTO ELÉCTRICO", Color.AZUL, Color.NEGRITA))
     sep()
@@ -242,60 +941,131 @@ def menu_agregar_punto(nodos, tipos):
     nombre = input(c("  Nombre del punto (ej: Casa 5, Transf. A): ", Color.BLANCO)).strip()
     if not nombre:
         print(c("  ⚠  Nombre vacío.", Color.AMARILLO)); return
-    if nombre in nodos:
+    if nombre in red:
         print(c(f"  ⚠  '{nombre}' ya existe.", Color.AMARILLO)); return
 
-    nodos.append(nombre)
-    tipos[nombre] = tipo
+    coords = pedir_coordenadas(c("  Coordenadas x,y en metros (Enter para omitir): ", Color.BLANCO))
+    red.agregar_punto(nombre, tipo, coords)
     emoji = "🔌" if tipo == "transformador" else ("🏠" if tipo == "casa" else "🏢")
     print(c(f"\n  ✔  {emoji} '{nombre}' agregado como {tipo}.", Color.VERDE))
 
 
-def menu_agregar_cable(nodos, aristas, tipos):
+def menu_agregar_cable(red):
     sep()
     print(c("  🔧  AGREGAR CABLE (CONEXIÓN)", Color.AZUL, Color.NEGRITA))
     sep()
-    if len(nodos) < 2:
+    if len(red) < 2:
         print(c("  ⚠  Necesitas al menos 2 puntos.", Color.AMARILLO)); return
 
     print(c("  Puntos disponibles:", Color.BLANCO))
-    listar_puntos(nodos, tipos)
+    listar_puntos(red)
     print()
 
     origen  = input(c("  Desde: ", Color.BLANCO)).strip()
     destino = input(c("  Hasta: ", Color.BLANCO)).strip()
 
-    if origen not in nodos:
+    if origen not in red:
         print(c(f"  ⚠  '{origen}' no existe.", Color.ROJO)); return
-    if destino not in nodos:
+    if destino not in red:
         print(c(f"  ⚠  '{destino}' no existe.", Color.ROJO)); return
     if origen == destino:
         print(c("  ⚠  Origen y destino iguales.", Color.AMARILLO)); return
-    if any((a == origen and b == destino) or (a == destino and b == origen)
-           for a, b, _ in aristas):
+    if red.tiene_cable(origen, destino):
         print(c("  ⚠  Ya existe un cable entre esos puntos.", Color.AMARILLO)); return
 
     metros = pedir_entero(c("  Metros de cable: ", Color.BLANCO), minimo=1)
-    aristas.append((origen, destino, metros))
+    red.agregar_cable(origen, destino, metros)
     print(c(f"\n  ✔  Cable añadido: '{origen}' ↔ '{destino}'  ({metros} m)", Color.VERDE))
 
 
-def menu_calcular(nodos, aristas, tipos):
+def menu_generar_cables(red):
+    from geometria import agregar_cables_geometricos
+
+    sep()
+    print(c("  📐  GENERAR CABLES DESDE COORDENADAS", Color.AZUL, Color.NEGRITA))
+    sep()
+    if len(red.coordenadas) < 2:
+        print(c("  ⚠  Necesitas al menos 2 puntos con coordenadas.", Color.AMARILLO)); return
+
+    print(c(f"  {len(red.coordenadas)} puntos con coordenadas.", Color.BLANCO))
+    k = pedir_entero(c("  Vecinos más cercanos por punto (ej: 6): ", Color.BLANCO), minimo=1)
+    tope = pedir_entero(c("  Longitud máxima de cable en metros (0 = sin tope): ", Color.BLANCO),
+                        minimo=0)
+    nuevos = agregar_cables_geometricos(red, k=k, max_metros=tope or None)
+    print(c(f"\n  ✔  {nuevos} cables candidatos agregados.", Color.VERDE))
+
+
+def menu_archivo(red):
+    """Guardar o abrir la red. Retorna la red con la que se sigue trabajando."""
+    from red_binaria import cargar, guardar
+
+    sep()
+    print(c("  💾  GUARDAR / ABRIR RED", Color.AZUL, Color.NEGRITA))
+    sep()
+    print(f"  {c('1', Color.AMARILLO)} Guardar red y árboles (.kred binario, .json legible)")
+    print(f"  {c('2', Color.AMARILLO)} Abrir red desde archivo")
+    print()
+    op = pedir_opcion({"1", "2"})
+    ruta = input(c("  Archivo: ", Color.BLANCO)).strip()
+    if not ruta:
+        print(c("  ⚠  Sin nombre de archivo.", Color.AMARILLO)); return red
+
+    try:
+        if op == "1":
+            arboles = {modo: red.resolver(modo)[0] for modo in ("min", "max")} if red.aristas else {}
+            guardar(red, ruta, arboles)
+            print(c(f"\n  ✔  Guardado en '{ruta}': {len(red.nodos)} puntos, "
+                    f"{len(red.aristas)} cables.", Color.VERDE))
+            return red
+
+        nueva, arboles = cargar(ruta)
+    except (OSError, ValueError, KeyError) as e:
+        print(c(f"  ⚠  {e}", Color.ROJO)); return red
+    print(c(f"\n  ✔  Red cargada: {len(nueva.nodos)} puntos, {len(nueva.aristas)} cables.",
+            Color.VERDE))
+    from verificacion import verificar_arbol
+    for modo, mst in arboles.items():
+        print(c(f"     Árbol {etiqueta_modo(modo)} guardado: {len(mst)} cables, "
+                f"{sum(m for _, _, m in mst)} m", Color.GRIS))
+        for linea in verificar_arbol(nueva.nodos, nueva.aristas, mst, modo).lineas(maximo=20):
+            color = (Color.VERDE if linea.startswith("✔") else
+                     Color.ROJO if linea.startswith("✘") else Color.GRIS)
+            print(c(f"       {linea}", color))
+    return nueva
+
+
+def menu_calcular(red):
+    nodos, aristas, tipos = red.nodos, red.aristas, red.tipos
     sep()
     print(c("  ⚡  CALCULAR RED ELÉCTRICA ÓPTIMA", Color.AMARILLO, Color.NEGRITA))
     sep()
 
     if len(nodos) < 2:
         print(c("  ⚠  Necesitas al menos 2 puntos.", Color.AMARILLO)); return
+    if not aristas:
+        print(c("  ⚠  No hay cables en la red.", Color.AMARILLO)); return
     if len(aristas) < len(nodos) - 1:
         print(c(f"  ⚠  Faltan conexiones. Con {len(nodos)} puntos necesitas al menos "
-                f"{len(nodos)-1} cables.", Color.AMARILLO)); return
+                f"{len(nodos)-1} cables; se calculará un árbol por zona.", Color.AMARILLO))
 
     print(f"  {c('1', Color.AMARILLO)} 💰 Modo MIN — menor metros de cable (menor costo)")
     print(f"  {c('2', Color.AMARILLO)} ⚡ Modo MAX — mayor capacidad (cables más largos primero)")
     print(f"  {c('3', Color.AMARILLO)} 🔀 Ambos modos (comparar)")
+    print(f"  {c('4', Color.AMARILLO)} 📊 Tolerancia de precios por cable (sensibilidad)")
+    print(f"  {c('5', Color.AMARILLO)} 🔗 Eslabón más débil entre dos puntos (modo MAX)")
+    print(f"  {c('6', Color.AMARILLO)} 🧩 Planes alternativos (los k mejores árboles)")
+    print(f"  {c('7', Color.AMARILLO)} 🗺  Zonas de servicio por transformador")
     print()
-    op = pedir_opcion({"1", "2", "3"})
+    op = pedir_opcion({"1", "2", "3", "4", "5", "6", "7"})
+
+    if op == "4":
+        menu_sensibilidad(red); return
+    if op == "5":
+        menu_cuello_botella(red); return
+    if op == "6":
+        menu_alternativos(red); return
+    if op == "7":
+        menu_zonas(red); return
 
     modos = []
     if op == "1": modos = ["min"]
@@ -304,66 +1074,190 @@ def menu_calcular(nodos, aristas, tipos):
 
     for modo in modos:
         print()
-        mst, total, pasos = ejecutar_kruskal(nodos, aristas, modo)
+        verbosidad = Verbosidad.COMPLETO if len(aristas) <= LIMITE_LOG else Verbosidad.RESUMEN
+        stats = EstadisticasKruskal()
+        bosque, total, pasos = red.resolver_bosque(modo, verbosidad, stats=stats)
 
         # ── Log del proceso ──
-        color_log = Color.VERDE if modo == "min" else Color.AZUL
-        sep(52, color_log)
-        etiqueta = "MÍNIMO COSTO" if modo == "min" else "MÁXIMA CAPACIDAD"
-        print(c(f"  📋  PROCESO KRUSKAL — {etiqueta}", color_log, Color.NEGRITA))
-        sep(52, color_log)
-        for paso in pasos:
-            if "▶" in paso or "Aristas" in paso:
-                print(c("  " + paso, Color.BLANCO))
-            elif "✔" in paso:
-                print(c("  " + paso, Color.VERDE))
-            elif "✘" in paso:
-                print(c("  " + paso, Color.ROJO))
-            else:
-                print(c("  " + paso, Color.GRIS))
-        print()
+        with stats.fase("render"):
+            color_log = Color.VERDE if modo == "min" else Color.AZUL
+            sep(52, color_log)
+            etiqueta = "MÍNIMO COSTO" if modo == "min" else "MÁXIMA CAPACIDAD"
+            print(c(f"  📋  PROCESO KRUSKAL — {etiqueta}", color_log, Color.NEGRITA))
+            sep(52, color_log)
+            for paso in pasos.lineas(maximo=LIMITE_LOG):
+                if "▶" in paso or "Aristas" in paso or "Motor" in paso:
+                    print(c("  " + paso, Color.BLANCO))
+                elif "✔" in paso:
+                    print(c("  " + paso, Color.VERDE))
+                elif "✘" in paso:
+                    print(c("  " + paso, Color.ROJO))
+                else:
+                    print(c("  " + paso, Color.GRIS))
+            print()
 
-        # ── Resultado visual ──
-        if not mst:
-            print(c("  ⚠  No se pudo construir el árbol. Revisa las conexiones.", Color.ROJO))
+            # ── Resultado visual ──
+            if len(bosque) > 1:
+                print(c(f"  ⚠  La red tiene {len(bosque)} zonas sin conexión entre sí; "
+                        f"se muestra un árbol por zona.", Color.AMARILLO))
+                print()
+            for num, (nodos_zona, mst, total_zona) in enumerate(bosque, 1):
+                if len(bosque) > 1:
+                    print(c(f"  ▸ Zona {num}: {len(nodos_zona)} puntos", Color.BLANCO, Color.NEGRITA))
+                if not mst:
+                    print(c(f"    (punto aislado: {nodos_zona[0]})", Color.GRIS))
+                    print()
+                else:
+                    dibujar_arbol(mst, nodos_zona, tipos, total_zona, modo)
+            if len(bosque) > 1:
+                print(c(f"  Total de todas las zonas: {total} metros", Color.AMARILLO, Color.NEGRITA))
+                print()
+        if stats.examinadas or "bucle" in stats.tiempos:
+            print(c(f"  ⏱  {stats.resumen()}", Color.GRIS))
         else:
-            dibujar_arbol(mst, nodos, tipos, total, modo)
+            print(c("  ⏱  Resultado memorizado (la red no cambió desde el último cálculo).", Color.GRIS))
+        print()
 
         if len(modos) > 1 and modo == "min":
             input(c("  → Presiona Enter para ver el modo MAX...", Color.GRIS))
             print()
 
 
-def menu_ver_red(nodos, aristas, tipos):
+def menu_sensibilidad(red):
+    from sensibilidad import analizar_sensibilidad, lineas_tabla
+
+    print()
+    print(f"  {c('1', Color.AMARILLO)} 💰 Modo MIN    {c('2', Color.AMARILLO)} ⚡ Modo MAX")
+    modo = "min" if pedir_opcion({"1", "2"}) == "1" else "max"
+    filas = analizar_sensibilidad(red.nodos, red.aristas, modo)
+
+    color = Color.VERDE if modo == "min" else Color.AZUL
+    print()
+    sep(52, color)
+    print(c(f"  📊  SENSIBILIDAD — {etiqueta_modo(modo)}", color, Color.NEGRITA))
+    sep(52, color)
+    print(c("  Rango de precio de cada cable en el que el árbol óptimo no cambia", Color.GRIS))
+    print(c("  (primero los más frágiles; holgura 0 = empate con otro árbol óptimo).", Color.GRIS))
+    print()
+    for num, linea in enumerate(lineas_tabla(filas, modo, maximo=LIMITE_LOG)):
+        print(c("  " + linea, Color.BLANCO if num == 0 else Color.GRIS))
+    print()
+
+
+def menu_cuello_botella(red):
+    print()
+    print(c("  Puntos disponibles:", Color.GRIS))
+    listar_puntos(red)
+    print()
+    origen  = input(c("  Desde: ", Color.BLANCO)).strip()
+    destino = input(c("  Hasta: ", Color.BLANCO)).strip()
+    for nombre in (origen, destino):
+        if nombre not in red:
+            print(c(f"  ⚠  '{nombre}' no existe.", Color.ROJO)); return
+
+    cable = red.cuello_botella("max").consultar(origen, destino)
+    print()
+    if origen == destino:
+        print(c("  ⚠  Origen y destino iguales.", Color.AMARILLO))
+    elif cable is None:
+        print(c(f"  ⚠  '{origen}' y '{destino}' están en zonas sin conexión.", Color.AMARILLO))
+    else:
+        u, v, metros = cable
+        print(c("  🔗  Eslabón más débil en la red de máxima capacidad:", Color.AZUL, Color.NEGRITA))
+        print(f"    {c(u, Color.BLANCO)}  {c('━' * 6, Color.AZUL)}  "
+              f"{c(str(metros) + 'm', Color.AMARILLO)}  {c('━' * 6, Color.AZUL)}  {c(v, Color.BLANCO)}")
+        print(c("    Ningún otro camino entre ambos puntos tiene un eslabón mejor.", Color.GRIS))
+    print()
+
+
+def menu_alternativos(red):
+    from k_mejores import k_mejores_arboles
+
+    print()
+    print(f"  {c('1', Color.AMARILLO)} 💰 Modo MIN    {c('2', Color.AMARILLO)} ⚡ Modo MAX")
+    modo = "min" if pedir_opcion({"1", "2"}) == "1" else "max"
+    k = pedir_entero(c("  ¿Cuántos planes? (ej: 5): ", Color.BLANCO), minimo=1)
+
+    color = Color.VERDE if modo == "min" else Color.AZUL
+    print()
+    sep(52, color)
+    print(c(f"  🧩  PLANES ALTERNATIVOS — {etiqueta_modo(modo)}", color, Color.NEGRITA))
+    sep(52, color)
+    optimo = None
+    for num, (mst, total) in enumerate(k_mejores_arboles(red.nodos, red.aristas, k, modo), 1):
+        if optimo is None:
+            optimo = {clave_cable(u, v) for u, v, _ in mst}
+            print(c(f"  Plan {num}: {total} metros (óptimo)", Color.AMARILLO, Color.NEGRITA))
+            continue
+        claves = {clave_cable(u, v) for u, v, _ in mst}
+        print(c(f"  Plan {num}: {total} metros", Color.AMARILLO, Color.NEGRITA))
+        for u, v, m in mst:
+            if clave_cable(u, v) not in optimo:
+                print(c(f"    + {u} — {v} ({m}m)", Color.VERDE))
+        for u, v in sorted(optimo - claves):
+            print(c(f"    − {u} — {v} ({red.metros(u, v)}m)", Color.ROJO))
+    print()
+
+
+def menu_zonas(red):
+    from zonas import zonas_de_transformadores
+
+    transformadores, etiquetas, dendrograma = zonas_de_transformadores(
+        red.nodos, red.aristas, red.tipos)
+    print()
+    if not transformadores:
+        print(c("  ⚠  La red no tiene transformadores.", Color.AMARILLO)); return
+
+    sep(52, Color.VERDE)
+    print(c("  🗺  ZONAS DE SERVICIO (una por transformador)", Color.VERDE, Color.NEGRITA))
+    sep(52, Color.VERDE)
+    print(c("  Reparto con el menor cable total en que cada punto cuelga de un transformador.", Color.GRIS))
+    print()
+    zonas = [[] for _ in transformadores]
+    sueltos = []
+    for x, z in enumerate(etiquetas):
+        (zonas[z] if z >= 0 else sueltos).append(dendrograma.nombres[x])
+    for transformador, puntos in zip(transformadores, zonas):
+        print(c(f"  🔌 {transformador}", Color.AMARILLO, Color.NEGRITA) +
+              c(f"  ({len(puntos) - 1} puntos)", Color.GRIS))
+        for nombre in puntos:
+            if nombre != transformador:
+                print(f"      {c(nombre, Color.BLANCO)}")
+    if sueltos:
+        print(c(f"  ⚠  Sin transformador alcanzable: {', '.join(sueltos)}", Color.AMARILLO))
+    print()
+
+
+def menu_ver_red(red):
     sep()
     print(c("  📡  ESTADO DE LA RED ELÉCTRICA", Color.AZUL, Color.NEGRITA))
     sep()
 
-    if not nodos:
+    if not red.nodos:
         print(c("  (Red vacía)", Color.GRIS)); return
 
     # Puntos
-    transformadores = [n for n in nodos if tipos.get(n) == "transformador"]
-    casas           = [n for n in nodos if tipos.get(n) == "casa"]
-    edificios       = [n for n in nodos if tipos.get(n) == "edificio"]
+    transformadores = red.puntos_de_tipo("transformador")
+    casas           = red.puntos_de_tipo("casa")
+    edificios       = red.puntos_de_tipo("edificio")
 
     print(c(f"\n  🔌 Transformadores ({len(transformadores)}):", Color.AMARILLO, Color.NEGRITA))
-    for t in sorted(transformadores):
+    for t in transformadores:
         print(f"    🔌  {c(t, Color.BLANCO)}")
 
     print(c(f"\n  🏠 Casas ({len(casas)}):", Color.BLANCO, Color.NEGRITA))
-    for casa in sorted(casas):
+    for casa in casas:
         print(f"    🏠  {c(casa, Color.BLANCO)}")
 
     if edificios:
         print(c(f"\n  🏢 Edificios/Locales ({len(edificios)}):", Color.BLANCO, Color.NEGRITA))
-        for ed in sorted(edificios):
+        for ed in edificios:
             print(f"    🏢  {c(ed, Color.BLANCO)}")
 
     # Cables
-    print(c(f"\n  🔧 Cables posibles ({len(aristas)}):", Color.AZUL, Color.NEGRITA))
-    if aristas:
-        for u, v, m in sorted(aristas, key=lambda x: x[2]):
+    print(c(f"\n  🔧 Cables posibles ({len(red.aristas)}):", Color.AZUL, Color.NEGRITA))
+    if red.aristas:
+        for u, v, m in red.cables_por_metros():
             print(f"    {c(u, Color.BLANCO)} ↔ {c(v, Color.BLANCO)}  "
                   f"{c(str(m)+'m', Color.AMARILLO)}")
     else:
@@ -381,13 +1275,8 @@ def cargar_ejemplo():
     6 casas y 2 locales comerciales.
     Los metros representan la distancia de cableado entre puntos.
     """
-    nodos = []
-    tipos = {}
-    aristas = []
-
-    def agregar(nombre, tipo):
-        nodos.append(nombre)
-        tipos[nombre] = tipo
+    red = RedElectrica()
+    agregar = red.agregar_punto
 
     # Fuentes de energía
     agregar("Transf. Norte",  "transformador")
@@ -422,9 +1311,9 @@ def cargar_ejemplo():
         ("Transf. Norte", "Transf. Sur",   60),
     ]
     for u, v, m in cables:
-        aristas.append((u, v, m))
+        red.agregar_cable(u, v, m)
 
-    return nodos, aristas, tipos
+    return red
 
 
 # ═══════════════════════════════════════════════
@@ -432,9 +1321,7 @@ def cargar_ejemplo():
 # ═══════════════════════════════════════════════
 
 def main():
-    nodos   = []
-    aristas = []
-    tipos   = {}
+    red = RedElectrica()
 
     limpiar()
     encabezado()
@@ -443,8 +1330,8 @@ def main():
     print(f"  {c('s', Color.AMARILLO)} Sí    {c('n', Color.AMARILLO)} No, empezar vacío")
     print()
     if input("  → ").strip().lower() == "s":
-        nodos, aristas, tipos = cargar_ejemplo()
-        print(c(f"  ✔  Fraccionamiento cargado: {len(nodos)} puntos, {len(aristas)} cables.", Color.VERDE))
+        red = cargar_ejemplo()
+        print(c(f"  ✔  Fraccionamiento cargado: {len(red.nodos)} puntos, {len(red.aristas)} cables.", Color.VERDE))
 
     while True:
         print()
@@ -452,31 +1339,40 @@ def main():
         print(c("  MENÚ PRINCIPAL", Color.AMARILLO, Color.NEGRITA))
         sep(52, Color.AMARILLO)
         print(f"  {c('1', Color.AMARILLO)} Agregar punto eléctrico   "
-              f"{c(f'({len(nodos)} en red)', Color.GRIS)}")
+              f"{c(f'({len(red.nodos)} en red)', Color.GRIS)}")
         print(f"  {c('2', Color.AMARILLO)} Agregar cable (conexión)  "
-              f"{c(f'({len(aristas)} cables)', Color.GRIS)}")
+              f"{c(f'({len(red.aristas)} cables)', Color.GRIS)}")
         print(f"  {c('3', Color.AMARILLO)} {c('⚡ Calcular red óptima', Color.AMARILLO, Color.NEGRITA)}")
         print(f"  {c('4', Color.AMARILLO)} Ver estado de la red")
+        print(f"  {c('5', Color.AMARILLO)} Generar cables desde coordenadas  "
+              f"{c(f'({len(red.coordenadas)} con x,y)', Color.GRIS)}")
+        print(f"  {c('6', Color.AMARILLO)} Guardar / abrir red")
         print(f"  {c('0', Color.AMARILLO)} Salir")
         print()
 
-        op = pedir_opcion({"1", "2", "3", "4", "0"})
+        op = pedir_opcion({"1", "2", "3", "4", "5", "6", "0"})
 
         if op == "1":
-            menu_agregar_punto(nodos, tipos)
+            menu_agregar_punto(red)
 
         elif op == "2":
-            menu_agregar_cable(nodos, aristas, tipos)
+            menu_agregar_cable(red)
 
         elif op == "3":
             print()
-            menu_calcular(nodos, aristas, tipos)
+            menu_calcular(red)
             input(c("\n  Presiona Enter para continuar...", Color.GRIS))
 
         elif op == "4":
-            menu_ver_red(nodos, aristas, tipos)
+            menu_ver_red(red)
             input(c("  Presiona Enter para continuar...", Color.GRIS))
 
+        elif op == "5":
+            menu_generar_cables(red)
+
+        elif op == "6":
+            red = menu_archivo(red)
+
         elif op == "0":
             print(c("\n  ⚡  ¡Red apagada! Hasta luego.\n", Color.AMARILLO))
             sys.exit(0)
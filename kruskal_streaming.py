@@ -0,0 +1,244 @@
+"""
+═══════════════════════════════════════════════
+Kruskal fuera de memoria — ingesta por flujo
+Lee cables desde CSV o JSON-lines en bloques, ordena cada
+bloque, lo vuelca a un archivo temporal (una "corrida") y
+mezcla las corridas (k-way merge) directo en el bucle de Kruskal.
+
+La memoria queda acotada por el número de puntos (Union-Find)
+y el tamaño de bloque, no por el número de cables.
+═══════════════════════════════════════════════
+"""
+
+import csv
+import heapq
+import json
+import os
+import pickle
+import tempfile
+from itertools import islice
+
+from kruskal_red_electrica import Paso, RegistroPasos, UnionFind, Verbosidad
+
+
+TAM_BLOQUE = 500_000   # cables por corrida ordenada
+TAM_LOTE   = 4_096     # cables por registro pickle dentro de una corrida
+
+
+# ═══════════════════════════════════════════════
+#  LECTURA DE CABLES
+# ═══════════════════════════════════════════════
+
+def _metros(valor):
+    """Convierte el campo de metros a int si es entero, si no a float."""
+    if isinstance(valor, (int, float)):
+        return valor
+    try:
+        return int(valor)
+    except ValueError:
+        return float(valor)
+
+
+def _cables_csv(archivo):
+    """
+    Filas `origen,destino,metros`. Si la primera fila no tiene metros
+    numéricos se toma como encabezado y se ignora.
+    """
+    lector = csv.reader(archivo)
+    for fila in lector:
+        if not fila or fila[0].startswith("#"):
+            continue
+        try:
+            metros = _metros(fila[2])
+        except (ValueError, IndexError):
+            if lector.line_num == 1:
+                continue  # encabezado
+            raise ValueError(f"Línea {lector.line_num}: cable mal formado: {fila!r}")
+        yield fila[0], fila[1], metros
+
+
+def _cables_jsonl(archivo):
+    """
+    Una línea por cable: `["A", "B", 12]` o
+    `{"origen": "A", "destino": "B", "metros": 12}`.
+    """
+    for num, linea in enumerate(archivo, 1):
+        linea = linea.strip()
+        if not linea:
+            continue
+        dato = json.loads(linea)
+        if isinstance(dato, dict):
+            yield dato["origen"], dato["destino"], _metros(dato["metros"])
+        elif isinstance(dato, list) and len(dato) == 3:
+            yield dato[0], dato[1], _metros(dato[2])
+        else:
+            raise ValueError(f"Línea {num}: cable mal formado: {linea!r}")
+
+
+def leer_cables(ruta, formato=None):
+    """
+    Generador de cables `(u, v, metros)` leídos en flujo desde disco.
+
+    formato : 'csv' | 'jsonl' | None (se deduce de la extensión)
+    """
+    if formato is None:
+        ext = os.path.splitext(ruta)[1].lower()
+        formato = "jsonl" if ext in (".jsonl", ".ndjson", ".json") else "csv"
+
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        if formato == "csv":
+            yield from _cables_csv(archivo)
+        elif formato == "jsonl":
+            yield from _cables_jsonl(archivo)
+        else:
+            raise ValueError(f"Formato desconocido: {formato!r}")
+
+
+def en_bloques(cables, tam=TAM_BLOQUE):
+    """Agrupa un iterable de cables en listas de a lo más `tam`."""
+    cables = iter(cables)
+    while True:
+        bloque = list(islice(cables, tam))
+        if not bloque:
+            return
+        yield bloque
+
+
+# ═══════════════════════════════════════════════
+#  ORDENAMIENTO EXTERNO
+# ═══════════════════════════════════════════════
+
+def _escribir_corrida(bloque, dir_tmp):
+    """Vuelca un bloque ya ordenado a un archivo temporal."""
+    fd, ruta = tempfile.mkstemp(prefix="kruskal_run_", suffix=".pkl", dir=dir_tmp)
+    with os.fdopen(fd, "wb") as f:
+        for i in range(0, len(bloque), TAM_LOTE):
+            pickle.dump(bloque[i:i + TAM_LOTE], f, protocol=pickle.HIGHEST_PROTOCOL)
+    return ruta
+
+
+def _leer_corrida(ruta):
+    """Lee una corrida de vuelta, lote por lote."""
+    with open(ruta, "rb") as f:
+        while True:
+            try:
+                lote = pickle.load(f)
+            except EOFError:
+                return
+            yield from lote
+
+
+class OrdenExterno:
+    """
+    Ordena un flujo de cables por metros sin cargarlo entero en memoria.
+
+    Uso:
+        with OrdenExterno(leer_cables("red.csv"), modo="min") as orden:
+            for u, v, m in orden:
+                ...
+
+    Mientras vuelca las corridas registra los puntos vistos en
+    `orden.nodos` (en orden de aparición). Los empates conservan el
+    orden de entrada, igual que `sorted` en `ejecutar_kruskal`.
+    """
+
+    def __init__(self, cables, modo="min", tam_bloque=TAM_BLOQUE, dir_tmp=None):
+        self.cables     = cables
+        self.modo       = modo
+        self.tam_bloque = tam_bloque
+        self.dir_tmp    = dir_tmp
+        self.corridas   = []
+        self.nodos      = {}   # dict ordenado usado como conjunto
+        self.total      = 0
+
+    def __enter__(self):
+        invertir = self.modo == "max"
+        try:
+            for bloque in en_bloques(self.cables, self.tam_bloque):
+                for u, v, _ in bloque:
+                    self.nodos[u] = None
+                    self.nodos[v] = None
+                self.total += len(bloque)
+                bloque.sort(key=lambda x: x[2], reverse=invertir)
+                self.corridas.append(_escribir_corrida(bloque, self.dir_tmp))
+        except BaseException:
+            self._limpiar()
+            raise
+        return self
+
+    def __iter__(self):
+        return heapq.merge(*(_leer_corrida(r) for r in self.corridas),
+                           key=lambda x: x[2], reverse=self.modo == "max")
+
+    def __exit__(self, *exc):
+        self._limpiar()
+
+    def _limpiar(self):
+        for ruta in self.corridas:
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+        self.corridas = []
+
+
+# ═══════════════════════════════════════════════
+#  ALGORITMO DE KRUSKAL (en flujo)
+# ═══════════════════════════════════════════════
+
+def ejecutar_kruskal_streaming(cables, modo="min", nodos=None,
+                               tam_bloque=TAM_BLOQUE, dir_tmp=None,
+                               verbosidad=Verbosidad.RESUMEN, al_paso=None):
+    """
+    Kruskal sobre un flujo de cables con ordenamiento externo.
+
+    Parámetros:
+        cables     : ruta a CSV/JSON-lines, o iterable de (u, v, metros)
+        modo       : 'min' | 'max'
+        nodos      : list[str] opcional (incluye puntos aislados)
+        tam_bloque : cables por corrida ordenada en memoria
+        verbosidad, al_paso : como en `ejecutar_kruskal`
+
+    Retorna el mismo contrato que `ejecutar_kruskal`. Por defecto el
+    log es de nivel RESUMEN para que su tamaño dependa de V y no de E;
+    en COMPLETO se registra cada rechazo, pero nunca la lista ordenada
+    entera (para eso haría falta tenerla en memoria).
+    """
+    if isinstance(cables, (str, os.PathLike)):
+        cables = leer_cables(cables)
+
+    with OrdenExterno(cables, modo, tam_bloque, dir_tmp) as orden:
+        uf = UnionFind(nodos if nodos is not None else ())
+        for n in orden.nodos:
+            uf.agregar(n)
+        orden.nodos = None   # liberar; el Union-Find ya los tiene
+
+        pasos   = RegistroPasos(al_paso)
+        resumen = verbosidad >= Verbosidad.RESUMEN
+        detalle = verbosidad >= Verbosidad.COMPLETO
+        if resumen:
+            pasos.registrar(Paso.INICIO, modo)
+            pasos.registrar(Paso.ORDEN, orden.total)
+
+        mst        = []
+        total      = 0
+        rechazadas = 0
+        meta       = len(uf) - 1
+        ids        = uf.indice
+
+        for u, v, metros in orden:
+            if len(mst) >= meta:
+                break
+            if uf.union_id(ids[u], ids[v]):
+                mst.append((u, v, metros))
+                total += metros
+                if resumen:
+                    pasos.registrar(Paso.ACEPTADA, u, v, metros)
+            elif detalle:
+                pasos.registrar(Paso.RECHAZADA, u, v, metros)
+            else:
+                rechazadas += 1
+
+    if resumen and not detalle:
+        pasos.registrar(Paso.RECHAZADAS, rechazadas)
+    return mst, total, pasos
@@ -0,0 +1,185 @@
+"""
+═══════════════════════════════════════════════
+Resolución por lotes de variantes de fraccionamiento
+Resuelve muchas redes (MIN y/o MAX) en un pool de procesos y
+devuelve los resultados en el orden en que van terminando.
+
+Entrada:
+  • un directorio con un archivo .json por red, o
+  • un flujo JSON-lines (archivo o '-' para stdin), una red por línea
+
+Cada red:
+  {"nombre": "Variante 7",
+   "nodos":  ["Transf. Norte", "Casa 1", ...],
+   "tipos":  {"Transf. Norte": "transformador", ...},
+   "cables": [["Transf. Norte", "Casa 1", 30], ...]}
+
+Uso:
+  python lote_escenarios.py variantes/ --modos min max --workers 8
+  cat variantes.jsonl | python lote_escenarios.py - --salida resultados.jsonl
+═══════════════════════════════════════════════
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import count, islice
+
+from kruskal_red_electrica import RedElectrica, Verbosidad, ejecutar_kruskal
+
+
+# ═══════════════════════════════════════════════
+#  LECTURA DE ESCENARIOS
+# ═══════════════════════════════════════════════
+
+def leer_escenarios(entrada):
+    """
+    Generador de redes (dicts) desde un directorio, un archivo
+    JSON-lines, '-' (stdin) o un iterable de dicts ya cargados.
+    Las redes sin "nombre" reciben el del archivo o su número de línea.
+    Una línea o archivo que no es un objeto JSON se entrega como
+    {"nombre": ..., "error": ...} para que el lote siga.
+    """
+    if not isinstance(entrada, (str, os.PathLike)):
+        yield from entrada
+        return
+
+    if entrada == "-":
+        yield from _leer_jsonl(sys.stdin, "stdin")
+    elif os.path.isdir(entrada):
+        for archivo in sorted(os.listdir(entrada)):
+            if not archivo.endswith(".json"):
+                continue
+            with open(os.path.join(entrada, archivo), encoding="utf-8") as f:
+                yield _escenario(f.read(), os.path.splitext(archivo)[0])
+    else:
+        with open(entrada, encoding="utf-8") as f:
+            yield from _leer_jsonl(f, os.path.basename(entrada))
+
+
+def _leer_jsonl(archivo, origen):
+    for num, linea in enumerate(archivo, 1):
+        if linea.strip():
+            yield _escenario(linea, f"{origen}:{num}")
+
+
+def _escenario(texto, nombre):
+    """Texto JSON de una red → dict con "nombre", o registro de error."""
+    try:
+        dato = json.loads(texto)
+    except json.JSONDecodeError as e:
+        return {"nombre": nombre, "error": f"JSON inválido: {e}"}
+    if not isinstance(dato, dict):
+        return {"nombre": nombre, "error": "La red debe ser un objeto JSON."}
+    dato.setdefault("nombre", nombre)
+    return dato
+
+
+# ═══════════════════════════════════════════════
+#  NÚCLEO POR RED (corre dentro de cada proceso)
+# ═══════════════════════════════════════════════
+
+def resolver_red(dato, modos=("min", "max")):
+    """
+    Resuelve una red con `ejecutar_kruskal` en cada modo pedido.
+    Retorna una lista de dicts (uno por modo) listos para JSON; si la
+    red es inválida (forma rechazada por `desde_dict`, punto repetido,
+    cable a un punto que no existe), un único dict con la clave
+    "error": una red mala no tumba el trozo ni el lote. Cualquier otra
+    excepción es un error del programa y sí se propaga.
+    """
+    if not isinstance(dato, dict):
+        return [{"nombre": None, "error": "La red debe ser un objeto JSON."}]
+    nombre = dato.get("nombre")
+    if "error" in dato:   # ya llegó inválida de `leer_escenarios`
+        return [{"nombre": nombre, "error": dato["error"]}]
+
+    try:
+        red = RedElectrica.desde_dict(dato)
+        resultados = []
+        for modo in modos:
+            mst, total, _ = ejecutar_kruskal(red.nodos, red.aristas, modo, Verbosidad.NADA)
+            resultados.append({
+                "nombre": nombre,
+                "modo":   modo,
+                "total":  total,
+                "conexa": len(mst) == len(red.nodos) - 1,
+                "cables": [list(cable) for cable in mst],
+            })
+    except (KeyError, TypeError, ValueError) as e:
+        mensaje = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+        return [{"nombre": nombre, "error": mensaje}]
+    return resultados
+
+
+def _resolver_trozo(trozo, modos):
+    return [r for dato in trozo for r in resolver_red(dato, modos)]
+
+
+# ═══════════════════════════════════════════════
+#  DESPACHO EN POOL
+# ═══════════════════════════════════════════════
+
+def resolver_lote(escenarios, modos=("min", "max"), workers=None, tam_trozo=8):
+    """
+    Resuelve todas las redes en un pool de procesos.
+
+    Las redes se mandan en trozos de `tam_trozo` (menos viajes entre
+    procesos) y se mantienen a lo más 2·workers trozos en vuelo, así
+    que una entrada enorme no se carga entera en memoria. Es un
+    generador: entrega cada resultado en cuanto su trozo termina; los
+    trozos que terminan juntos salen en el orden de la entrada, así
+    que con un solo worker el orden es exactamente el de la entrada.
+    """
+    workers    = workers or os.cpu_count() or 1
+    escenarios = iter(leer_escenarios(escenarios))
+    modos      = tuple(modos)
+
+    with ProcessPoolExecutor(workers) as pool:
+        en_vuelo = {}   # futuro → número de trozo
+        enviados = count()
+
+        def enviar():
+            trozo = list(islice(escenarios, tam_trozo))
+            if trozo:
+                en_vuelo[pool.submit(_resolver_trozo, trozo, modos)] = next(enviados)
+            return bool(trozo)
+
+        while len(en_vuelo) < 2 * workers and enviar():
+            pass
+
+        while en_vuelo:
+            listos, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+            for futuro in sorted(listos, key=en_vuelo.get):
+                del en_vuelo[futuro]
+                yield from futuro.result()
+                enviar()
+
+
+# ═══════════════════════════════════════════════
+#  PROGRAMA PRINCIPAL
+# ═══════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolución por lotes de redes eléctricas")
+    parser.add_argument("entrada", help="directorio de .json, archivo JSON-lines o '-' (stdin)")
+    parser.add_argument("--modos", nargs="+", default=["min", "max"], choices=["min", "max"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--trozo", type=int, default=8, help="redes por tarea del pool")
+    parser.add_argument("--salida", help="archivo JSON-lines (por defecto, stdout)")
+    args = parser.parse_args(argv)
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        for resultado in resolver_lote(args.entrada, args.modos, args.workers, args.trozo):
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            salida.flush()
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+
+if __name__ == "__main__":
+    main()
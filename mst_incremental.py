@@ -0,0 +1,352 @@
+"""
+═══════════════════════════════════════════════
+Árbol de expansión incremental
+Mantiene el árbol (MIN o MAX) vivo mientras se editan cables,
+sin volver a correr Kruskal sobre toda la red.
+
+Alta de cable → propiedad del ciclo: se busca el peor cable del
+               camino en el árbol entre sus extremos y se cambia
+               si el nuevo es mejor.
+Baja de cable → propiedad del corte: si era del árbol se busca el
+               mejor cable que cruce el corte como reemplazo.
+
+Cada edición cuesta lo que mide el camino o el lado menor del
+corte, no O(E log E): el árbol guarda un puntero al padre por
+nodo, y el camino entre dos puntos se arma subiendo desde ambos
+extremos a la vez hasta encontrarse (su ancestro común). Enlazar
+re-enraíza el lado que llega antes a su raíz; cortar es O(1).
+
+Cambios de precio en lote (`cambiar_precios`): un cable de fuera
+que mejora se prueba contra el ciclo; uno del árbol que empeora
+busca reemplazo en el corte; los otros dos casos no mueven el
+árbol. Si el lote toca más de FRACCION_RESOLVER de los cables,
+sale más barato volver a correr Kruskal completo.
+═══════════════════════════════════════════════
+"""
+
+from collections import deque
+
+from kruskal_red_electrica import Verbosidad, clave_cable, ejecutar_kruskal
+
+
+FRACCION_RESOLVER = 0.10   # lotes que tocan más de esta fracción de cables → Kruskal completo
+
+
+class ArbolIncremental:
+    """
+    Árbol (o bosque, si la red no es conexa) de expansión mínima o
+    máxima que se actualiza con cada alta o baja de cable.
+
+    Atributos:
+        modo   : 'min' | 'max'
+        cables : dict[(u, v)] → metros   — todos los cables candidatos
+        vecinos: dict[nodo] → dict[nodo] → metros  (todos los cables)
+        arbol  : dict[nodo] → dict[nodo] → metros  (sólo cables del árbol)
+        padre  : dict[nodo] → nodo | None  (raíz de cada componente: None)
+        total  : suma de metros del árbol
+    """
+
+    def __init__(self, nodos, aristas, modo="min"):
+        self.modo    = modo
+        self.cables  = {}
+        self.vecinos = {n: {} for n in nodos}
+        self.arbol   = {n: {} for n in nodos}
+        self.total   = 0
+
+        for u, v, metros in aristas:
+            self.cables[clave_cable(u, v)] = metros
+            self.vecinos[u][v] = metros
+            self.vecinos[v][u] = metros
+
+        mst, total, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+        for u, v, metros in mst:
+            self.arbol[u][v] = metros
+            self.arbol[v][u] = metros
+        self.total = total
+        self._enraizar()
+
+    # ── Comparación según el modo ──
+    def _mejor(self, a, b):
+        """True si un cable de a metros es estrictamente preferible a uno de b."""
+        return a < b if self.modo == "min" else a > b
+
+    # ── Consultas ──
+    @property
+    def mst(self):
+        """Cables del árbol como lista de (u, v, metros)."""
+        return [(u, v, m) for u, vecinos in self.arbol.items()
+                for v, m in vecinos.items() if u <= v]
+
+    def en_arbol(self, u, v):
+        return v in self.arbol.get(u, ())
+
+    def camino(self, origen, destino):
+        """
+        Camino en el árbol entre dos puntos como lista de nodos,
+        o None si están en componentes distintas.
+
+        Sube por los padres desde los dos extremos, un paso cada uno,
+        hasta que uno pisa un nodo que el otro ya visitó: el ancestro
+        común. Cuesta O(largo del camino); sólo si están en componentes
+        distintas recorre hasta las dos raíces.
+        """
+        if origen == destino:
+            return [origen]
+        subidas = ([origen], [destino])
+        vistos  = ({origen: 0}, {destino: 0})   # nodo → posición en su subida
+        padre   = self.padre
+        while True:
+            avanzo = False
+            for lado in (0, 1):
+                x = padre[subidas[lado][-1]]
+                if x is None:
+                    continue
+                avanzo = True
+                otro = vistos[1 - lado].get(x)
+                if otro is not None:
+                    if lado == 0:
+                        return subidas[0] + subidas[1][otro::-1]
+                    return subidas[0][:otro + 1] + subidas[1][::-1]
+                vistos[lado][x] = len(subidas[lado])
+                subidas[lado].append(x)
+            if not avanzo:
+                return None
+
+    # ── Ediciones ──
+    def agregar_punto(self, nombre):
+        self.vecinos.setdefault(nombre, {})
+        self.arbol.setdefault(nombre, {})
+        self.padre.setdefault(nombre, None)
+
+    def agregar_cable(self, u, v, metros):
+        """
+        Agrega un cable candidato y repara el árbol.
+        Retorna (entra, sale): cables (u, v, metros) que entraron y
+        salieron del árbol, o None en cada lado si no hubo cambio.
+        """
+        if u == v:
+            raise ValueError("Origen y destino iguales.")
+        clave = clave_cable(u, v)
+        if clave in self.cables:
+            raise ValueError(f"Ya existe un cable entre '{u}' y '{v}'.")
+        self.agregar_punto(u)
+        self.agregar_punto(v)
+        self.cables[clave] = metros
+        self.vecinos[u][v] = metros
+        self.vecinos[v][u] = metros
+
+        ruta = self.camino(u, v)
+        if ruta is None:
+            # Une dos componentes: entra sin desplazar a nadie
+            self._enlazar(u, v, metros)
+            return (u, v, metros), None
+
+        # Propiedad del ciclo: peor cable del camino
+        peor = None
+        for a, b in zip(ruta, ruta[1:]):
+            m = self.arbol[a][b]
+            if peor is None or self._mejor(peor[2], m):
+                peor = (a, b, m)
+
+        if not self._mejor(metros, peor[2]):
+            return None, None
+        self._cortar(peor[0], peor[1])
+        self._enlazar(u, v, metros)
+        return (u, v, metros), peor
+
+    def quitar_cable(self, u, v):
+        """
+        Elimina un cable candidato. Si era del árbol busca el mejor
+        reemplazo que cruce el corte. Retorna (entra, sale) como
+        `agregar_cable`.
+        """
+        clave = clave_cable(u, v)
+        if clave not in self.cables:
+            raise KeyError(f"No existe un cable entre '{u}' y '{v}'.")
+        metros = self.cables.pop(clave)
+        del self.vecinos[u][v]
+        del self.vecinos[v][u]
+
+        if not self.en_arbol(u, v):
+            return None, None
+
+        self._cortar(u, v)
+        reemplazo = self.mejor_cruce(u, v)
+        if reemplazo is not None:
+            self._enlazar(*reemplazo)
+        return reemplazo, (u, v, metros)
+
+    def cambiar_metros(self, u, v, metros):
+        """Cambia el precio de un cable (baja + alta). Retorna los cambios del árbol."""
+        entra_1, sale_1 = self.quitar_cable(u, v)
+        entra_2, sale_2 = self.agregar_cable(u, v, metros)
+        return [c for c in (entra_1, entra_2) if c], [c for c in (sale_1, sale_2) if c]
+
+    def cambiar_precios(self, cambios, fraccion=FRACCION_RESOLVER):
+        """
+        Aplica un lote de cambios de precio [(u, v, metros_nuevos), ...]
+        y repara el árbol. Si algún cable no existe no se aplica nada.
+
+        Retorna (entran, salen): cables que entraron y salieron del
+        árbol en neto (un cable que sale y vuelve a entrar no se
+        reporta), con sus metros nuevos / anteriores.
+        """
+        cambios = list(cambios)
+        for u, v, _ in cambios:
+            if clave_cable(u, v) not in self.cables:
+                raise KeyError(f"No existe un cable entre '{u}' y '{v}'.")
+
+        if len(cambios) > fraccion * len(self.cables):
+            return self._resolver_todo(cambios)
+
+        entran, salen = {}, {}
+        previos = {}   # metros antes del lote de cada cable que cambia
+
+        def anotar(cable, destino, contrario):
+            clave = clave_cable(cable[0], cable[1])
+            if contrario.pop(clave, None) is None:
+                destino[clave] = cable
+
+        for u, v, metros in cambios:
+            previos.setdefault(clave_cable(u, v), self.cables[clave_cable(u, v)])
+            entra, sale = self._repreciar(u, v, metros)
+            if sale:
+                anotar(sale, salen, entran)
+            if entra:
+                anotar(entra, entran, salen)
+
+        # Un cable puede entrar o salir antes de que el lote le cambie el precio
+        return ([(u, v, self.cables[clave]) for clave, (u, v, _) in entran.items()],
+                [(u, v, previos.get(clave, m)) for clave, (u, v, m) in salen.items()])
+
+    def _repreciar(self, u, v, metros):
+        """Cambia el precio de un cable existente. Retorna (entra, sale) o (None, None)."""
+        clave = clave_cable(u, v)
+        anterior = self.cables[clave]
+        self.cables[clave] = metros
+        self.vecinos[u][v] = metros
+        self.vecinos[v][u] = metros
+
+        if self.en_arbol(u, v):
+            self._cortar(u, v)
+            if not self._mejor(anterior, metros):
+                # Mejoró (o quedó igual): sigue siendo el mejor cruce de su corte
+                self._enlazar(u, v, metros)
+                return None, None
+            # Empeoró: propiedad del corte (el propio cable compite con su precio nuevo)
+            mejor = self.mejor_cruce(u, v)
+            if not self._mejor(mejor[2], metros):
+                self._enlazar(u, v, metros)
+                return None, None
+            self._enlazar(*mejor)
+            return mejor, (u, v, anterior)
+
+        if not self._mejor(metros, anterior):
+            return None, None
+        # Fuera del árbol y mejoró: propiedad del ciclo
+        ruta = self.camino(u, v)
+        peor = None
+        for a, b in zip(ruta, ruta[1:]):
+            m = self.arbol[a][b]
+            if peor is None or self._mejor(peor[2], m):
+                peor = (a, b, m)
+        if not self._mejor(metros, peor[2]):
+            return None, None
+        self._cortar(peor[0], peor[1])
+        self._enlazar(u, v, metros)
+        return (u, v, metros), peor
+
+    def _resolver_todo(self, cambios):
+        """Aplica el lote completo y vuelve a correr Kruskal; reporta la diferencia."""
+        antes = {clave_cable(u, v): (u, v, m) for u, v, m in self.mst}
+        for u, v, metros in cambios:
+            self.cables[clave_cable(u, v)] = metros
+            self.vecinos[u][v] = metros
+            self.vecinos[v][u] = metros
+
+        aristas = [(u, v, m) for (u, v), m in self.cables.items()]
+        mst, total, _ = ejecutar_kruskal(list(self.vecinos), aristas, self.modo, Verbosidad.NADA)
+        self.arbol = {n: {} for n in self.vecinos}
+        for u, v, metros in mst:
+            self.arbol[u][v] = metros
+            self.arbol[v][u] = metros
+        self.total = total
+        self._enraizar()
+
+        despues = {clave_cable(u, v): (u, v, m) for u, v, m in mst}
+        return ([c for k, c in despues.items() if k not in antes],
+                [c for k, c in antes.items() if k not in despues])
+
+    # ── Propiedad del corte ──
+    def _lado_menor(self, a, b):
+        """
+        Explora en paralelo las dos mitades del árbol (ya cortado)
+        y devuelve el conjunto de nodos de la mitad más chica.
+        """
+        vistos = ({a}, {b})
+        colas  = (deque([a]), deque([b]))
+        while True:
+            for lado in (0, 1):
+                cola = colas[lado]
+                if not cola:
+                    return vistos[lado]
+                x = cola.popleft()
+                for y in self.arbol[x]:
+                    if y not in vistos[lado]:
+                        vistos[lado].add(y)
+                        cola.append(y)
+
+    def mejor_cruce(self, a, b):
+        """Mejor cable candidato entre las dos mitades separadas de a y b."""
+        lado   = self._lado_menor(a, b)
+        mejor  = None
+        for x in lado:
+            for y, m in self.vecinos[x].items():
+                if y not in lado and (mejor is None or self._mejor(m, mejor[2])):
+                    mejor = (x, y, m)
+        return mejor
+
+    # ── Primitivas del árbol ──
+    def _enraizar(self):
+        """Recalcula los punteros al padre con un BFS por componente (O(V))."""
+        self.padre = dict.fromkeys(self.arbol)
+        for raiz in self.arbol:
+            if self.padre[raiz] is not None:
+                continue
+            cola = deque([raiz])
+            while cola:
+                x = cola.popleft()
+                for y in self.arbol[x]:
+                    if y != raiz and self.padre[y] is None:
+                        self.padre[y] = x
+                        cola.append(y)
+
+    def _enlazar(self, u, v, metros):
+        """
+        Une dos componentes con el cable u—v. Re-enraíza la que tiene
+        su extremo más cerca de la raíz (se sube desde ambos a la vez),
+        así el costo es el menor de los dos caminos a la raíz.
+        """
+        self.arbol[u][v] = metros
+        self.arbol[v][u] = metros
+        self.total += metros
+
+        padre = self.padre
+        x, y = u, v
+        while padre[x] is not None and padre[y] is not None:
+            x, y = padre[x], padre[y]
+        hijo, nuevo_padre = (u, v) if padre[x] is None else (v, u)
+
+        # Invierte los punteros del camino hijo → raíz y lo cuelga del otro extremo
+        previo, x = nuevo_padre, hijo
+        while x is not None:
+            padre[x], previo, x = previo, x, padre[x]
+
+    def _cortar(self, u, v):
+        metros = self.arbol[u].pop(v)
+        del self.arbol[v][u]
+        self.total -= metros
+        if self.padre[u] == v:
+            self.padre[u] = None
+        else:
+            self.padre[v] = None
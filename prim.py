@@ -0,0 +1,197 @@
+"""
+═══════════════════════════════════════════════
+Motores Prim (explícitos)
+Alternativas a Kruskal que se piden por nombre:
+
+  prim_denso  → O(V²) sobre una matriz de distancias NumPy,
+                vectorizado por paso; conviene cuando la matriz
+                ya existe (el bucle tarda ~0.04s con V=1500)
+  prim_heap   → O(E log V) con heapq sobre listas de adyacencia
+  resolver_con_motor → despacho por nombre ('kruskal' | 'prim_denso'
+                | 'prim_heap') con el contrato de `ejecutar_kruskal`
+
+No hay selección automática: con la red como lista de cables Kruskal
+gana en todas las densidades medidas (`benchmark_kruskal.py --motores`),
+porque pasar las tuplas a arreglos ya cuesta lo que su sort.
+
+Todos devuelven (mst, total, pasos) como `ejecutar_kruskal`, en
+modo MIN o MAX, y si la red no es conexa devuelven un bosque.
+El costo total coincide con Kruskal; con empates de metros el
+conjunto de cables elegido puede diferir (ambos son óptimos).
+═══════════════════════════════════════════════
+"""
+
+import heapq
+import time
+
+try:
+    import numpy as np
+    from kruskal_numpy import aristas_a_arreglos
+except ImportError:   # sin NumPy no hay motor denso; el resto funciona igual
+    np = None
+
+from kruskal_red_electrica import (Paso, RegistroPasos, Verbosidad,
+                                   ejecutar_kruskal)
+
+
+def _pasos_prim(motor, modo, mst, verbosidad, al_paso):
+    pasos = RegistroPasos(al_paso)
+    if verbosidad >= Verbosidad.RESUMEN:
+        pasos.registrar(Paso.INICIO, modo)
+        pasos.registrar(Paso.MOTOR, motor)
+        for u, v, m in mst:
+            pasos.registrar(Paso.ACEPTADA, u, v, m)
+    return pasos
+
+
+# ═══════════════════════════════════════════════
+#  PRIM DENSO (matriz)
+# ═══════════════════════════════════════════════
+
+def matriz_desde_aristas(nodos, aristas, modo="min"):
+    """
+    Matriz V×V de metros a partir de la lista de cables.
+
+    Retorna:
+        nombres : list[str]
+        W       : np.ndarray V×V con los metros (0 donde no hay cable)
+        existe  : np.ndarray V×V bool, True donde hay cable
+    Si hay cables repetidos entre dos puntos se queda el mejor del modo.
+    """
+    nombres, u, v, w = aristas_a_arreglos(nodos, aristas)
+    V = len(nombres)
+    a, b = np.minimum(u, v), np.maximum(u, v)   # cada par en el triángulo superior
+    W = np.zeros((V, V), dtype=w.dtype if len(w) else np.int64)
+    existe = np.zeros((V, V), dtype=bool)
+    W[a, b] = w
+    existe[a, b] = True
+
+    # Con pares repetidos la asignación deja uno cualquiera: se corrige
+    # sólo donde quedó un cable peor que alguno de los del par
+    mejor = np.minimum if modo == "min" else np.maximum
+    repetidos = mejor(w, W[a, b]) != W[a, b]
+    if repetidos.any():
+        mejor.at(W, (a[repetidos], b[repetidos]), w[repetidos])
+
+    W[b, a] = W[a, b]
+    existe[b, a] = True
+    return nombres, W, existe
+
+
+def prim_denso(nombres, W, modo="min", existe=None,
+               verbosidad=Verbosidad.RESUMEN, al_paso=None):
+    """
+    Prim O(V²) vectorizado: cada paso elige con un argmin sobre el
+    arreglo de mejores conexiones y lo actualiza con una fila de W.
+
+    Parámetros:
+        nombres : list[str]            → id → nombre
+        W       : matriz V×V de metros (NaN = sin cable si `existe` es None)
+        existe  : matriz V×V bool opcional de cables presentes
+    """
+    W = np.asarray(W)
+    V = len(nombres)
+    if existe is None:
+        existe = ~np.isnan(W) if W.dtype.kind == "f" else np.ones((V, V), dtype=bool)
+        np.fill_diagonal(existe, False)
+
+    # Se pasa a float antes de negar: en MAX, -W daría la vuelta con pesos sin signo
+    pesos = W.astype(np.float64)
+    costo = np.where(existe, pesos if modo == "min" else -pesos, np.inf)
+
+    en_arbol = np.zeros(V, dtype=bool)
+    mejor    = np.full(V, np.inf)
+    padre    = np.full(V, -1, dtype=np.int64)
+    mst      = []
+
+    for _ in range(V):
+        candidatos = np.where(en_arbol, np.inf, mejor)
+        x = int(np.argmin(candidatos))
+        if candidatos[x] == np.inf:
+            # Componente nueva: se arranca desde el primer punto libre
+            x = int(np.argmin(en_arbol))
+            padre[x] = -1
+        en_arbol[x] = True
+        if padre[x] >= 0:
+            p = int(padre[x])
+            mst.append((nombres[p], nombres[x], W[p, x].item()))
+
+        mejora = ~en_arbol & (costo[x] < mejor)
+        mejor[mejora] = costo[x][mejora]
+        padre[mejora] = x
+
+    total = sum(m for _, _, m in mst)
+    return mst, total, _pasos_prim("Prim denso O(V²)", modo, mst, verbosidad, al_paso)
+
+
+# ═══════════════════════════════════════════════
+#  PRIM CON HEAP (listas de adyacencia)
+# ═══════════════════════════════════════════════
+
+def prim_heap(nodos, aristas, modo="min", verbosidad=Verbosidad.RESUMEN, al_paso=None):
+    """Prim O(E log V) con heapq; arranca de nuevo en cada componente."""
+    signo = 1 if modo == "min" else -1
+    adyacencia = {n: [] for n in nodos}
+    for u, v, m in aristas:
+        adyacencia[u].append((v, m))
+        adyacencia[v].append((u, m))
+
+    visitados = set()
+    mst   = []
+    turno = 0   # desempate estable dentro del heap
+    for inicio in adyacencia:
+        if inicio in visitados:
+            continue
+        visitados.add(inicio)
+        heap = []
+        for v, m in adyacencia[inicio]:
+            heap.append((signo * m, turno, inicio, v, m))
+            turno += 1
+        heapq.heapify(heap)
+        while heap:
+            _, _, u, v, m = heapq.heappop(heap)
+            if v in visitados:
+                continue
+            visitados.add(v)
+            mst.append((u, v, m))
+            for x, mx in adyacencia[v]:
+                if x not in visitados:
+                    heapq.heappush(heap, (signo * mx, turno, v, x, mx))
+                    turno += 1
+
+    total = sum(m for _, _, m in mst)
+    return mst, total, _pasos_prim("Prim con heap O(E log V)", modo, mst, verbosidad, al_paso)
+
+
+# ═══════════════════════════════════════════════
+#  DESPACHO POR NOMBRE
+# ═══════════════════════════════════════════════
+
+MOTORES = ("kruskal", "prim_denso", "prim_heap")
+
+
+def resolver_con_motor(nodos, aristas, motor="kruskal", modo="min",
+                       verbosidad=Verbosidad.RESUMEN, al_paso=None, stats=None):
+    """
+    Resuelve con el motor indicado. Retorna (mst, total, pasos) igual
+    que `ejecutar_kruskal`; con un motor Prim, `stats` sólo recibe el
+    tiempo total (en "bucle") y las uniones.
+    """
+    if motor == "kruskal":
+        return ejecutar_kruskal(nodos, aristas, modo, verbosidad, al_paso, stats)
+
+    inicio = time.perf_counter()
+    if motor == "prim_denso":
+        if np is None:
+            raise ImportError("El motor prim_denso necesita NumPy.")
+        nombres, W, existe = matriz_desde_aristas(nodos, aristas, modo)
+        resultado = prim_denso(nombres, W, modo, existe, verbosidad, al_paso)
+    elif motor == "prim_heap":
+        resultado = prim_heap(nodos, aristas, modo, verbosidad, al_paso)
+    else:
+        raise ValueError(f"Motor desconocido: {motor!r} (opciones: {', '.join(MOTORES)})")
+
+    if stats is not None:
+        stats.tiempos["bucle"] = stats.tiempos.get("bucle", 0.0) + time.perf_counter() - inicio
+        stats.uniones += len(resultado[0])
+    return resultado
@@ -0,0 +1,321 @@
+"""
+═══════════════════════════════════════════════
+Persistencia de redes y árboles calculados
+Formato binario columnar (.kred) pensado para abrirse con `mmap`:
+cada columna es un arreglo contiguo que NumPy lee tal cual, sin
+parsear nada, así que reabrir una red de millones de cables toma
+milisegundos y varios procesos comparten las mismas páginas.
+
+  Encabezado (64 bytes, little-endian)
+    magia 'KRED' · versión · tipo de metros ('i' int64 | 'f' float64)
+    banderas · V · E · bytes de nombres · K tipos · bytes de tipos
+    cables en árbol MIN · cables en árbol MAX
+  Secciones (cada una alineada a 8 bytes), en este orden:
+    nombres      int64[V+1] desplazamientos + UTF-8 concatenado
+    tabla tipos  int64[K+1] desplazamientos + UTF-8 concatenado
+    tipos        uint8[V]   → posición en la tabla de tipos
+    u, v         int32[E]   → ids de los extremos
+    metros       int64[E] | float64[E]
+    coordenadas  float64[V×2] (NaN = punto sin x,y)    ← opcional
+    arbol min    int32[T]  posiciones de cables del árbol ← opcional
+    arbol max    int32[T]                                ← opcional
+
+Para redes chicas también hay exportación JSON (la forma de
+`RedElectrica.como_dict` más los árboles calculados).
+═══════════════════════════════════════════════
+"""
+
+import json
+import math
+import os
+import struct
+
+import numpy as np
+
+from kruskal_red_electrica import RedElectrica, clave_cable
+
+
+MAGIA      = b"KRED"
+VERSION    = 1
+ENCABEZADO = struct.Struct("<4sHccQQQQQQQ")   # 64 bytes
+
+CON_COORDENADAS = 0x01
+CON_ARBOL_MIN   = 0x02
+CON_ARBOL_MAX   = 0x04
+
+MODOS = ("min", "max")
+BANDERA_ARBOL = {"min": CON_ARBOL_MIN, "max": CON_ARBOL_MAX}
+
+
+def _relleno(n):
+    return -n % 8
+
+
+def _tabla(cadenas):
+    """(desplazamientos int64[n+1], bytes UTF-8 concatenados) de una lista de cadenas."""
+    codificadas = [s.encode("utf-8") for s in cadenas]
+    desplaz = np.zeros(len(codificadas) + 1, dtype="<i8")
+    np.cumsum(np.fromiter(map(len, codificadas), dtype=np.int64, count=len(codificadas)),
+              out=desplaz[1:])
+    return desplaz, b"".join(codificadas)
+
+
+class TablaNombres:
+    """
+    Secuencia de cadenas leída de una tabla del archivo: cada nombre
+    se decodifica al pedirlo, así que abrir no cuesta O(V).
+    """
+
+    def __init__(self, desplaz, datos):
+        self.desplaz = desplaz
+        self.datos   = datos
+
+    def __len__(self):
+        return len(self.desplaz) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        a, b = int(self.desplaz[i]), int(self.desplaz[i + 1])
+        return self.datos[a:b].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+# ═══════════════════════════════════════════════
+#  ESCRITURA
+# ═══════════════════════════════════════════════
+
+def guardar_arreglos(ruta, nombres, u, v, metros, tipos=None, coordenadas=None, arboles=None):
+    """
+    Escribe una red ya en forma de arreglos (como la devuelve
+    `kruskal_numpy.aristas_a_arreglos`) sin pasar por RedElectrica.
+
+    Parámetros:
+        nombres     : list[str]             → id → nombre
+        u, v        : array-like de ids     → extremos de cada cable
+        metros      : array-like            → metros (enteros o reales)
+        tipos       : list[str] por id (None = todos 'casa')
+        coordenadas : array-like V×2 (NaN = sin x,y) o None
+        arboles     : dict[modo] → array-like de posiciones de cables
+    """
+    V, E = len(nombres), len(u)
+    if V >= 2**31:
+        raise ValueError("El formato usa ids int32: máximo 2^31-1 puntos.")
+    metros = np.asarray(metros)
+    if metros.dtype.kind in "iub":
+        tipo_metros, metros = b"i", metros.astype("<i8", copy=False)
+    else:
+        tipo_metros, metros = b"f", metros.astype("<f8", copy=False)
+
+    tipos = tipos if tipos is not None else ["casa"] * V
+    tabla_tipos = list(dict.fromkeys(tipos))
+    codigo = {t: i for i, t in enumerate(tabla_tipos)}
+    if len(tabla_tipos) > 256:
+        raise ValueError("El formato admite a lo más 256 tipos de punto.")
+
+    arboles = {m: np.asarray(p, dtype="<i4") for m, p in (arboles or {}).items()}
+    banderas = sum(BANDERA_ARBOL[m] for m in arboles)
+    if coordenadas is not None:
+        banderas |= CON_COORDENADAS
+
+    desplaz_n, datos_n = _tabla(nombres)
+    desplaz_t, datos_t = _tabla(tabla_tipos)
+
+    secciones = [
+        desplaz_n, datos_n,
+        desplaz_t, datos_t,
+        np.fromiter((codigo[t] for t in tipos), dtype=np.uint8, count=V),
+        np.asarray(u, dtype="<i4"),
+        np.asarray(v, dtype="<i4"),
+        metros,
+    ]
+    if coordenadas is not None:
+        secciones.append(np.asarray(coordenadas, dtype="<f8").reshape(V, 2))
+    secciones += [arboles[m] for m in MODOS if m in arboles]
+
+    with open(ruta, "wb") as f:
+        f.write(ENCABEZADO.pack(MAGIA, VERSION, tipo_metros, bytes([banderas]),
+                                V, E, len(datos_n), len(tabla_tipos), len(datos_t),
+                                len(arboles.get("min", ())), len(arboles.get("max", ()))))
+        for seccion in secciones:
+            datos = seccion if isinstance(seccion, bytes) else np.ascontiguousarray(seccion).tobytes()
+            f.write(datos)
+            f.write(bytes(_relleno(len(datos))))
+
+
+def _posiciones_arbol(red, mst):
+    return [red.cables[clave_cable(u, v)] for u, v, _ in mst]
+
+
+def guardar_red(red, ruta, arboles=None):
+    """
+    Guarda una RedElectrica en formato binario.
+    `arboles` es un dict opcional modo → mst (lista de cables, como
+    lo devuelve `ejecutar_kruskal`) a guardar junto con la red.
+    """
+    indice = red.indice
+    E = len(red.aristas)
+    u = np.fromiter((indice[a] for a, _, _ in red.aristas), dtype=np.int32, count=E)
+    v = np.fromiter((indice[b] for _, b, _ in red.aristas), dtype=np.int32, count=E)
+    metros = np.array([m for _, _, m in red.aristas]) if E else np.zeros(0, dtype=np.int64)
+
+    coordenadas = None
+    if red.coordenadas:
+        coordenadas = np.array([red.coordenadas.get(n, (math.nan, math.nan))
+                                for n in red.nodos], dtype=np.float64)
+
+    guardar_arreglos(ruta, red.nodos, u, v, metros,
+                     tipos=[red.tipos.get(n, "casa") for n in red.nodos],
+                     coordenadas=coordenadas,
+                     arboles={m: _posiciones_arbol(red, mst) for m, mst in (arboles or {}).items()})
+
+
+# ═══════════════════════════════════════════════
+#  LECTURA (mmap)
+# ═══════════════════════════════════════════════
+
+class RedBinaria:
+    """
+    Red abierta desde un archivo .kred. Todas las columnas son vistas
+    de NumPy sobre el mismo `np.memmap` de sólo lectura: nada se copia
+    hasta que se usa.
+
+    Atributos:
+        nombres     : TablaNombres      → id → nombre
+        tipos       : uint8[V]          → código de tipo (ver `tabla_tipos`)
+        tabla_tipos : list[str]
+        u, v        : int32[E]
+        metros      : int64[E] | float64[E]
+        coordenadas : float64[V×2] o None
+        arboles     : dict[modo] → int32[T] posiciones de cables del árbol
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        if os.path.getsize(ruta) < ENCABEZADO.size:   # np.memmap no abre archivos vacíos
+            raise ValueError(f"Archivo .kred truncado: '{ruta}' no alcanza el encabezado "
+                             f"de {ENCABEZADO.size} bytes.")
+        base = np.memmap(ruta, dtype=np.uint8, mode="r")
+        (magia, version, tipo_metros, banderas, V, E, bytes_n, K, bytes_t,
+         t_min, t_max) = ENCABEZADO.unpack(base[:ENCABEZADO.size].tobytes())
+        if magia != MAGIA:
+            raise ValueError(f"'{ruta}' no es un archivo de red (magia {magia!r}).")
+        if version != VERSION:
+            raise ValueError(f"'{ruta}': versión de formato no soportada ({version}).")
+        if tipo_metros not in (b"i", b"f"):
+            raise ValueError(f"'{ruta}': tipo de metros desconocido ({tipo_metros!r}).")
+        banderas = banderas[0]
+
+        # Tamaño que piden las cuentas del encabezado, antes de crear vistas:
+        # un archivo cortado daría columnas más cortas sin ningún error.
+        tamanos = [8 * (V + 1), bytes_n, 8 * (K + 1), bytes_t, V, 4 * E, 4 * E, 8 * E]
+        if banderas & CON_COORDENADAS:
+            tamanos.append(16 * V)
+        tamanos += [4 * t for modo, t in (("min", t_min), ("max", t_max))
+                    if banderas & BANDERA_ARBOL[modo]]
+        esperado = ENCABEZADO.size + sum(t + _relleno(t) for t in tamanos)
+        if len(base) < esperado:
+            raise ValueError(f"Archivo .kred truncado: '{ruta}' tiene {len(base)} bytes "
+                             f"y su encabezado pide {esperado}.")
+
+        pos = ENCABEZADO.size
+
+        def tomar(dtype, n):
+            nonlocal pos
+            tam  = np.dtype(dtype).itemsize * n
+            vista = base[pos:pos + tam].view(dtype)
+            pos += tam + _relleno(tam)
+            return vista
+
+        self.nombres     = TablaNombres(tomar("<i8", V + 1), tomar(np.uint8, bytes_n))
+        self.tabla_tipos = list(TablaNombres(tomar("<i8", K + 1), tomar(np.uint8, bytes_t)))
+        self.tipos       = tomar(np.uint8, V)
+        self.u           = tomar("<i4", E)
+        self.v           = tomar("<i4", E)
+        self.metros      = tomar("<i8" if tipo_metros == b"i" else "<f8", E)
+        self.coordenadas = tomar("<f8", 2 * V).reshape(V, 2) if banderas & CON_COORDENADAS else None
+        self.arboles = {}
+        for modo, t in (("min", t_min), ("max", t_max)):
+            if banderas & BANDERA_ARBOL[modo]:
+                self.arboles[modo] = tomar("<i4", t)
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def mst(self, modo="min"):
+        """Árbol guardado como lista de (u, v, metros) con nombres."""
+        pos = self.arboles[modo]
+        return [(self.nombres[a], self.nombres[b], m)
+                for a, b, m in zip(self.u[pos].tolist(), self.v[pos].tolist(),
+                                   self.metros[pos].tolist())]
+
+    def resolver(self, modo="min", **kwargs):
+        """Kruskal vectorizado directo sobre las columnas mapeadas."""
+        from kruskal_numpy import ejecutar_kruskal_numpy
+        return ejecutar_kruskal_numpy(self.nombres, self.u, self.v, self.metros, modo, **kwargs)
+
+    def a_red(self):
+        """Carga todo a una RedElectrica editable (O(V + E) en Python)."""
+        nombres = list(self.nombres)
+        tipos   = {n: self.tabla_tipos[t] for n, t in zip(nombres, self.tipos.tolist())}
+        aristas = [(nombres[a], nombres[b], m)
+                   for a, b, m in zip(self.u.tolist(), self.v.tolist(), self.metros.tolist())]
+        coordenadas = {}
+        if self.coordenadas is not None:
+            coordenadas = {n: (x, y) for n, (x, y) in zip(nombres, self.coordenadas.tolist())
+                           if not (math.isnan(x) or math.isnan(y))}
+        return RedElectrica.desde_listas(nombres, aristas, tipos, coordenadas)
+
+
+def abrir_red(ruta):
+    """Abre un archivo .kred con mmap (ver `RedBinaria`)."""
+    return RedBinaria(ruta)
+
+
+# ═══════════════════════════════════════════════
+#  JSON (redes chicas)
+# ═══════════════════════════════════════════════
+
+def exportar_json(red, ruta, arboles=None):
+    """
+    Escribe la red en JSON legible (forma de `como_dict`), más
+    "arboles": {modo: [[u, v, metros], ...]} si se pasan.
+    """
+    dato = red.como_dict()
+    if arboles:
+        dato["arboles"] = {m: [list(c) for c in mst] for m, mst in arboles.items()}
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(dato, f, ensure_ascii=False, indent=2)
+
+
+def importar_json(ruta):
+    """Lee un JSON de `exportar_json`. Retorna (red, arboles)."""
+    with open(ruta, encoding="utf-8") as f:
+        dato = json.load(f)
+    arboles = {m: [tuple(c) for c in mst] for m, mst in dato.get("arboles", {}).items()}
+    return RedElectrica.desde_dict(dato), arboles
+
+
+# ═══════════════════════════════════════════════
+#  GUARDAR / CARGAR SEGÚN EXTENSIÓN
+# ═══════════════════════════════════════════════
+
+def guardar(red, ruta, arboles=None):
+    """'.json' → JSON; cualquier otra extensión → binario .kred."""
+    if str(ruta).lower().endswith(".json"):
+        exportar_json(red, ruta, arboles)
+    else:
+        guardar_red(red, ruta, arboles)
+
+
+def cargar(ruta):
+    """Inversa de `guardar`. Retorna (red, arboles)."""
+    if str(ruta).lower().endswith(".json"):
+        return importar_json(ruta)
+    binaria = abrir_red(ruta)
+    return binaria.a_red(), {m: binaria.mst(m) for m in binaria.arboles}
@@ -0,0 +1,199 @@
+"""
+═══════════════════════════════════════════════
+Sensibilidad de precios por cable
+¿Cuánto puede cambiar el precio (metros) de cada cable antes de que
+cambie la red óptima? Se responde para TODOS los cables a la vez,
+sin volver a correr Kruskal por cable (eso sería O(E² log E)).
+
+  Cable fuera del árbol → el peor cable del camino en el árbol entre
+                          sus extremos (propiedad del ciclo): mientras
+                          no lo mejore, sigue fuera.
+  Cable del árbol       → el mejor cable de fuera cuyo camino lo cubre
+                          (propiedad del corte): mientras no lo empeore
+                          al reemplazo, sigue dentro.
+
+El árbol se arma una vez y se preprocesa con saltos binarios (LCA)
+que guardan el peor metraje de cada salto: O(E log V) en total.
+═══════════════════════════════════════════════
+"""
+
+from collections import deque
+
+from kruskal_red_electrica import UnionFind
+
+
+# ═══════════════════════════════════════════════
+#  ÁRBOL CON SALTOS BINARIOS (LCA + peor cable)
+# ═══════════════════════════════════════════════
+
+class ArbolLCA:
+    """
+    Bosque enraizado con tablas de saltos binarios.
+
+    arriba[k][x] es el ancestro 2^k de x y peor[k][x] el peor metraje
+    en ese tramo ('peor' = el más largo en MIN, el más corto en MAX).
+    Las raíces apuntan a sí mismas y su tramo vale `neutro` (-∞ en MIN,
+    +∞ en MAX), así max/min nativos combinan sin casos especiales.
+
+    Atributos:
+        padre, prof, peso_padre, cable_padre : list por id de nodo
+        (cable_padre = posición en `aristas` del cable hacia el padre)
+    """
+
+    def __init__(self, V, cables_arbol, aristas, indice, modo="min"):
+        self.modo     = modo
+        self.neutro   = float("-inf") if modo == "min" else float("inf")
+        self._peor_de = max if modo == "min" else min
+
+        vecinos = [[] for _ in range(V)]
+        for i in cables_arbol:
+            a, b = indice[aristas[i][0]], indice[aristas[i][1]]
+            vecinos[a].append((b, i))
+            vecinos[b].append((a, i))
+
+        self.padre       = list(range(V))
+        self.prof        = [0] * V
+        self.peso_padre  = [self.neutro] * V
+        self.cable_padre = [-1] * V
+        visto = [False] * V
+        for raiz in range(V):
+            if visto[raiz]:
+                continue
+            visto[raiz] = True
+            cola = deque([raiz])
+            while cola:
+                x = cola.popleft()
+                for y, i in vecinos[x]:
+                    if not visto[y]:
+                        visto[y] = True
+                        self.padre[y]       = x
+                        self.prof[y]        = self.prof[x] + 1
+                        self.peso_padre[y]  = aristas[i][2]
+                        self.cable_padre[y] = i
+                        cola.append(y)
+
+        self.arriba = [self.padre]
+        self.peor   = [self.peso_padre]
+        for _ in range(max(1, max(self.prof, default=0).bit_length()) - 1):
+            salto, peor = self.arriba[-1], self.peor[-1]
+            self.arriba.append([salto[s] for s in salto])
+            self.peor.append(list(map(self._peor_de, peor, [peor[s] for s in salto])))
+
+    def lca_peor(self, a, b):
+        """
+        (ancestro común, peor metraje del camino a—b). Mismo árbol
+        requerido; si a == b el peor es `neutro`.
+        """
+        arriba, peor, prof, peor_de = self.arriba, self.peor, self.prof, self._peor_de
+        resultado = self.neutro
+        if prof[a] < prof[b]:
+            a, b = b, a
+        diferencia = prof[a] - prof[b]
+        k = 0
+        while diferencia:
+            if diferencia & 1:
+                resultado = peor_de(resultado, peor[k][a])
+                a = arriba[k][a]
+            diferencia >>= 1
+            k += 1
+        if a == b:
+            return a, resultado
+        for k in range(len(arriba) - 1, -1, -1):
+            if arriba[k][a] != arriba[k][b]:
+                resultado = peor_de(resultado, peor[k][a], peor[k][b])
+                a, b = arriba[k][a], arriba[k][b]
+        resultado = peor_de(resultado, self.peso_padre[a], self.peso_padre[b])
+        return self.padre[a], resultado
+
+
+# ═══════════════════════════════════════════════
+#  ANÁLISIS
+# ═══════════════════════════════════════════════
+
+def analizar_sensibilidad(nodos, aristas, modo="min"):
+    """
+    Rango de precio de cada cable dentro del cual el árbol óptimo no cambia.
+
+    Retorna una lista alineada con `aristas` de tuplas
+        (u, v, metros, en_arbol, limite)
+    donde `limite` es:
+        en el árbol, MIN → precio máximo que aguanta (el reemplazo más barato)
+        en el árbol, MAX → precio mínimo que aguanta (el reemplazo más largo)
+        fuera,       MIN → precio por debajo del cual entraría (peor del camino)
+        fuera,       MAX → precio por encima del cual entraría
+    o None si no tiene tope (cable puente sin reemplazo). En el límite
+    exacto hay empate: ambos árboles son óptimos.
+
+    El árbol es el mismo que elige `ejecutar_kruskal` (mismo orden de empates).
+    """
+    uf = UnionFind(nodos)
+    indice = uf.indice
+    V = len(uf)
+    orden = sorted(range(len(aristas)), key=lambda i: aristas[i][2], reverse=(modo == "max"))
+
+    en_arbol = [False] * len(aristas)
+    for i in orden:
+        u, v, _ = aristas[i]
+        if uf.union_id(indice[u], indice[v]):
+            en_arbol[i] = True
+
+    arbol = ArbolLCA(V, [i for i in orden if en_arbol[i]], aristas, indice, modo)
+    limite = [None] * len(aristas)
+
+    # Cables del árbol: cada cable de fuera, del mejor al peor, se asigna como
+    # reemplazo a los cables del camino que aún no tienen uno. `siguiente`
+    # salta los ya asignados (Union-Find hacia la raíz), así cada cable del
+    # árbol se toca una sola vez.
+    siguiente = list(range(V))
+
+    def libre(x):
+        while siguiente[x] != x:
+            siguiente[x] = siguiente[siguiente[x]]
+            x = siguiente[x]
+        return x
+
+    for i in orden:
+        if en_arbol[i]:
+            continue
+        u, v, metros = aristas[i]
+        a, b = indice[u], indice[v]
+        ancestro, peor = arbol.lca_peor(a, b)
+        limite[i] = None if peor == arbol.neutro else peor
+        for x in (a, b):
+            x = libre(x)
+            while arbol.prof[x] > arbol.prof[ancestro]:
+                limite[arbol.cable_padre[x]] = metros
+                siguiente[x] = arbol.padre[x]
+                x = libre(x)
+
+    return [(u, v, m, en_arbol[i], limite[i]) for i, (u, v, m) in enumerate(aristas)]
+
+
+def holgura(fila):
+    """Cuántos metros puede moverse el precio en la dirección peligrosa (None = sin tope)."""
+    _, _, metros, _, limite = fila
+    return None if limite is None else abs(limite - metros)
+
+
+def lineas_tabla(filas, modo="min", maximo=None):
+    """
+    Genera las líneas de texto de la tabla de sensibilidad, de los
+    cables más frágiles (menor holgura) a los más holgados.
+    """
+    ordenadas = sorted(filas, key=lambda f: (holgura(f) is None, holgura(f) or 0))
+    ancho = max((len(f"{u} — {v}") for u, v, *_ in ordenadas), default=5)
+    yield f"{'Cable':<{ancho}}  {'Metros':>7}  {'Estado':<7}  {'No cambia el árbol si':<24}  Holgura"
+    for num, fila in enumerate(ordenadas):
+        if maximo is not None and num >= maximo:
+            yield f"… y {len(ordenadas) - maximo} cables más"
+            return
+        u, v, metros, dentro, limite = fila
+        if limite is None:
+            rango = "cualquier precio"
+        elif dentro:
+            rango = f"precio {'≤' if modo == 'min' else '≥'} {limite}"
+        else:
+            rango = f"precio {'≥' if modo == 'min' else '≤'} {limite}"
+        h = holgura(fila)
+        yield (f"{f'{u} — {v}':<{ancho}}  {metros:>7}  {'árbol' if dentro else 'fuera':<7}  "
+               f"{rango:<24}  {'∞' if h is None else h}")
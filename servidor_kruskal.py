@@ -0,0 +1,348 @@
+"""
+═══════════════════════════════════════════════
+Línea de comandos y servidor JSON-lines
+Sin menú ni `input()`: para scripts, otras herramientas y servicios.
+
+  resolver → resuelve una red guardada (.kred o .json) y escribe el
+             resultado en JSON; un solo proceso por llamada.
+  servir   → proceso de larga vida que atiende peticiones JSON-lines
+             por stdin/stdout o por un socket Unix local. Las redes
+             cargadas se quedan en memoria con su orden de cables,
+             su Union-Find internado y sus resultados memorizados
+             (RedElectrica), así que cada petición sólo paga el
+             cálculo, sin arrancar Python ni importar módulos.
+
+Petición (una por línea):
+  {"id": 1, "op": "cargar", "red": "palmas", "archivo": "palmas.kred"}
+  {"id": 2, "op": "resolver", "red": "palmas", "modo": "max"}
+  {"id": 3, "op": "cuello", "red": "palmas", "pares": [["Transf. Norte", "Casa 4"]]}
+Respuesta: {"id": ..., "ok": true, ...} o {"id": ..., "ok": false, "error": "..."}
+
+Operaciones: ping, cargar (dato | archivo | ejemplo), redes, descargar,
+agregar_punto, agregar_cable, resolver, cuello, sensibilidad, zonas,
+verificar, guardar.
+
+Uso:
+  python servidor_kruskal.py resolver red.kred --modos min max
+  python servidor_kruskal.py servir < peticiones.jsonl
+  python servidor_kruskal.py servir --socket /tmp/kruskal.sock
+═══════════════════════════════════════════════
+"""
+
+import argparse
+import json
+import math
+import os
+import socketserver
+import stat
+import sys
+import threading
+
+from kruskal_red_electrica import RedElectrica, Verbosidad, cargar_ejemplo
+
+
+# ═══════════════════════════════════════════════
+#  ESTADO Y OPERACIONES
+# ═══════════════════════════════════════════════
+
+def _cables(mst):
+    return [list(cable) for cable in mst]
+
+
+def _metros(valor):
+    """Metros de un cable recibido por JSON: número real finito ≥ 1."""
+    if (isinstance(valor, bool) or not isinstance(valor, (int, float))
+            or not math.isfinite(valor) or valor < 1):
+        raise ValueError(f"Metros inválidos: {valor!r} (se espera un número ≥ 1).")
+    return valor
+
+
+def _coordenadas(valor):
+    if valor is None:
+        return None
+    if (not isinstance(valor, (list, tuple)) or len(valor) != 2
+            or not all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in valor)):
+        raise ValueError(f"Coordenadas inválidas: {valor!r} (se espera [x, y]).")
+    return valor
+
+
+class ServidorKruskal:
+    """
+    Redes cargadas por nombre y el despacho de peticiones.
+    `atender(peticion)` recibe un dict y devuelve el dict de respuesta;
+    nunca lanza: cualquier error de una petición vuelve como
+    {"ok": false, "error": ...} y el servidor sigue atendiendo.
+    Es seguro llamarlo desde varios hilos (un candado por servidor).
+    """
+
+    def __init__(self):
+        self.redes    = {}
+        self._cache   = {}   # (red, clave) → (versión, valor) para índices fuera de RedElectrica
+        self._candado = threading.Lock()
+        self.operaciones = {
+            "ping":          self.op_ping,
+            "cargar":        self.op_cargar,
+            "redes":         self.op_redes,
+            "descargar":     self.op_descargar,
+            "agregar_punto": self.op_agregar_punto,
+            "agregar_cable": self.op_agregar_cable,
+            "resolver":      self.op_resolver,
+            "cuello":        self.op_cuello,
+            "sensibilidad":  self.op_sensibilidad,
+            "zonas":         self.op_zonas,
+            "verificar":     self.op_verificar,
+            "guardar":       self.op_guardar,
+        }
+
+    def atender(self, peticion):
+        respuesta = {"id": peticion.get("id")} if isinstance(peticion, dict) else {"id": None}
+        try:
+            if not isinstance(peticion, dict):
+                raise ValueError("La petición debe ser un objeto JSON.")
+            operacion = self.operaciones.get(peticion.get("op"))
+            if operacion is None:
+                raise ValueError(f"Operación desconocida: {peticion.get('op')!r}")
+            with self._candado:
+                respuesta.update(operacion(peticion))
+            respuesta["ok"] = True
+        except (KeyError, ValueError, TypeError, OSError, ImportError) as e:
+            respuesta["ok"] = False
+            respuesta["error"] = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+        except Exception as e:   # petición mal formada que llegó más lejos: no tumba el servidor
+            respuesta["ok"] = False
+            respuesta["error"] = f"{type(e).__name__}: {e}"
+        return respuesta
+
+    def atender_linea(self, linea):
+        """Una línea JSON → una línea JSON (sin salto final)."""
+        try:
+            peticion = json.loads(linea)
+        except json.JSONDecodeError as e:
+            return json.dumps({"id": None, "ok": False, "error": f"JSON inválido: {e}"},
+                              ensure_ascii=False)
+        return json.dumps(self.atender(peticion), ensure_ascii=False)
+
+    # ── Auxiliares ──
+    def _red(self, peticion):
+        nombre = peticion.get("red", "red")
+        if nombre not in self.redes:
+            raise KeyError(f"No hay una red cargada llamada '{nombre}'.")
+        return nombre, self.redes[nombre]
+
+    def _memo(self, nombre, red, clave, calcular):
+        guardada = self._cache.get((nombre, clave))
+        if guardada is None or guardada[0] != red.version:
+            guardada = (red.version, calcular())
+            self._cache[(nombre, clave)] = guardada
+        return guardada[1]
+
+    @staticmethod
+    def _modo(peticion, defecto="min"):
+        modo = peticion.get("modo", defecto)
+        if modo not in ("min", "max"):
+            raise ValueError(f"Modo desconocido: {modo!r}")
+        return modo
+
+    # ── Operaciones ──
+    def op_ping(self, peticion):
+        return {"redes": len(self.redes)}
+
+    def op_cargar(self, peticion):
+        nombre = peticion.get("red", "red")
+        if "dato" in peticion:
+            dato = peticion["dato"]
+            if not isinstance(dato, dict):
+                raise ValueError("'dato' debe ser un objeto con 'nodos' y 'cables'.")
+            for cable in dato.get("cables", []):
+                if not isinstance(cable, (list, tuple)) or len(cable) != 3:
+                    raise ValueError(f"Cable inválido: {cable!r} (se espera [u, v, metros]).")
+                _metros(cable[2])
+            red = RedElectrica.desde_dict(dato)
+        elif "archivo" in peticion:
+            from red_binaria import cargar
+            red, _ = cargar(peticion["archivo"])
+        elif peticion.get("ejemplo"):
+            red = cargar_ejemplo()
+        else:
+            raise ValueError("'cargar' necesita 'dato', 'archivo' o 'ejemplo'.")
+        self.redes[nombre] = red
+        self._cache = {k: v for k, v in self._cache.items() if k[0] != nombre}
+        return {"red": nombre, "puntos": len(red.nodos), "cables": len(red.aristas)}
+
+    def op_redes(self, peticion):
+        return {"redes": {n: {"puntos": len(r.nodos), "cables": len(r.aristas),
+                              "version": r.version}
+                          for n, r in self.redes.items()}}
+
+    def op_descargar(self, peticion):
+        nombre, _ = self._red(peticion)
+        del self.redes[nombre]
+        self._cache = {k: v for k, v in self._cache.items() if k[0] != nombre}
+        return {"red": nombre}
+
+    def op_agregar_punto(self, peticion):
+        _, red = self._red(peticion)
+        red.agregar_punto(peticion["nombre"], peticion.get("tipo", "casa"),
+                          _coordenadas(peticion.get("coords")))
+        return {"puntos": len(red.nodos)}
+
+    def op_agregar_cable(self, peticion):
+        _, red = self._red(peticion)
+        red.agregar_cable(peticion["u"], peticion["v"], _metros(peticion["metros"]))
+        return {"cables": len(red.aristas)}
+
+    def op_resolver(self, peticion):
+        _, red = self._red(peticion)
+        modo = self._modo(peticion)
+        bosque, total, _ = red.resolver_bosque(modo, Verbosidad.NADA,
+                                               motor=peticion.get("motor", "kruskal"))
+        return {
+            "modo":   modo,
+            "total":  total,
+            "conexa": len(bosque) <= 1,
+            "zonas":  len(bosque),
+            "cables": [cable for _, mst, _ in bosque for cable in _cables(mst)],
+        }
+
+    def op_cuello(self, peticion):
+        _, red = self._red(peticion)
+        indice = red.cuello_botella(self._modo(peticion, "max"))
+        return {"cables": [list(c) if c else None
+                           for c in indice.consultar_lote([tuple(p) for p in peticion["pares"]])]}
+
+    def op_sensibilidad(self, peticion):
+        from sensibilidad import analizar_sensibilidad
+        nombre, red = self._red(peticion)
+        modo = self._modo(peticion)
+        filas = self._memo(nombre, red, ("sensibilidad", modo),
+                           lambda: analizar_sensibilidad(red.nodos, red.aristas, modo))
+        return {"cables": [{"u": u, "v": v, "metros": m, "en_arbol": dentro, "limite": limite}
+                           for u, v, m, dentro, limite in filas]}
+
+    def op_zonas(self, peticion):
+        from zonas import Dendrograma, zonas_de_transformadores
+        nombre, red = self._red(peticion)
+        modo = self._modo(peticion)
+        if peticion.get("transformadores"):
+            transformadores, etiquetas, dendrograma = self._memo(
+                nombre, red, ("transformadores", modo),
+                lambda: zonas_de_transformadores(red.nodos, red.aristas, red.tipos, modo))
+            return {"zonas": {n: (transformadores[z] if z >= 0 else None)
+                              for n, z in zip(dendrograma.nombres, etiquetas)}}
+
+        dendrograma = self._memo(nombre, red, ("dendrograma", modo),
+                                 lambda: Dendrograma(red.nodos, red.aristas, modo))
+        if "k" in peticion:
+            etiquetas = dendrograma.zonas(int(peticion["k"]))
+        elif "t" in peticion:
+            etiquetas = dendrograma.zonas_umbral(peticion["t"])
+        else:
+            raise ValueError("'zonas' necesita 'k', 't' o 'transformadores'.")
+        return {"zonas": dendrograma.por_nombre(etiquetas)}
+
+    def op_verificar(self, peticion):
+        from verificacion import verificar_arbol
+        _, red = self._red(peticion)
+        modo = self._modo(peticion)
+        resultado = verificar_arbol(red.nodos, red.aristas,
+                                    [tuple(c) for c in peticion["arbol"]], modo)
+        return {"optimo": resultado.optimo, "es_arbol": resultado.es_arbol,
+                "violaciones": [list(v) for v in resultado.violaciones],
+                "reporte": list(resultado.lineas())}
+
+    def op_guardar(self, peticion):
+        from red_binaria import guardar
+        _, red = self._red(peticion)
+        arboles = {m: red.resolver(m)[0] for m in ("min", "max")} if red.aristas else {}
+        guardar(red, peticion["archivo"], arboles)
+        return {"archivo": peticion["archivo"]}
+
+
+# ═══════════════════════════════════════════════
+#  TRANSPORTES
+# ═══════════════════════════════════════════════
+
+def servir_flujo(servidor, entrada=sys.stdin, salida=sys.stdout):
+    """Atiende JSON-lines de `entrada` hasta EOF, una respuesta por línea."""
+    for linea in entrada:
+        if linea.strip():
+            salida.write(servidor.atender_linea(linea) + "\n")
+            salida.flush()
+
+
+def servir_socket(servidor, ruta):
+    """Atiende conexiones en un socket Unix; cada conexión es un flujo JSON-lines."""
+
+    class Manejador(socketserver.StreamRequestHandler):
+        def handle(self):
+            for linea in self.rfile:
+                if linea.strip():
+                    respuesta = servidor.atender_linea(linea.decode("utf-8"))
+                    self.wfile.write(respuesta.encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+    # Sólo se borra un socket viejo (de una corrida que no limpió); nunca otro archivo
+    if os.path.lexists(ruta):
+        if not stat.S_ISSOCK(os.lstat(ruta).st_mode):
+            raise FileExistsError(f"'{ruta}' existe y no es un socket.")
+        os.unlink(ruta)
+    with socketserver.ThreadingUnixStreamServer(ruta, Manejador) as unix:
+        unix.daemon_threads = True
+        try:
+            unix.serve_forever()
+        finally:
+            os.unlink(ruta)
+
+
+def _precargar():
+    """Importa de una vez los módulos opcionales para que ninguna petición los pague."""
+    for modulo in ("red_binaria", "prim", "cuello_botella", "sensibilidad", "zonas",
+                   "verificacion"):
+        try:
+            __import__(modulo)
+        except ImportError:   # p. ej. sin NumPy: esas operaciones responderán con error
+            pass
+
+
+# ═══════════════════════════════════════════════
+#  PROGRAMA PRINCIPAL
+# ═══════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kruskal sin menú: comando y servidor JSON-lines")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_resolver = sub.add_parser("resolver", help="resuelve una red guardada y escribe JSON")
+    p_resolver.add_argument("archivo", help="red .kred o .json ('ejemplo' = Las Palmas)")
+    p_resolver.add_argument("--modos", nargs="+", default=["min"], choices=["min", "max"])
+
+    p_servir = sub.add_parser("servir", help="servidor JSON-lines de larga vida")
+    p_servir.add_argument("--socket", help="ruta de socket Unix (por defecto, stdin/stdout)")
+
+    args = parser.parse_args(argv)
+    servidor = ServidorKruskal()
+
+    if args.comando == "resolver":
+        carga = ({"op": "cargar", "ejemplo": True} if args.archivo == "ejemplo" else
+                 {"op": "cargar", "archivo": args.archivo})
+        respuestas = [servidor.atender(carga)]
+        if respuestas[0]["ok"]:
+            respuestas = [servidor.atender({"op": "resolver", "modo": m}) for m in args.modos]
+        for respuesta in respuestas:
+            print(json.dumps(respuesta, ensure_ascii=False))
+        return 0 if all(r["ok"] for r in respuestas) else 1
+
+    _precargar()
+    if args.socket:
+        try:
+            servir_socket(servidor, args.socket)
+        except FileExistsError as e:
+            print(e, file=sys.stderr)
+            return 1
+    else:
+        servir_flujo(servidor)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Índice de cuellos de botella: el eslabón más débil entre a y b debe
+ser el mejor umbral t con el que a y b quedan conectados usando sólo
+cables de al menos t metros (MAX) o de a lo más t metros (MIN).
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from cuello_botella import IndiceCuelloBotella
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal
+
+
+def _conectados(nodos, cables, a, b):
+    vecinos = {n: [] for n in nodos}
+    for u, v, _ in cables:
+        vecinos[u].append(v)
+        vecinos[v].append(u)
+    vistos, pila = {a}, [a]
+    while pila:
+        for y in vecinos[pila.pop()]:
+            if y not in vistos:
+                vistos.add(y)
+                pila.append(y)
+    return b in vistos
+
+
+def _eslabon_bruto(nodos, aristas, a, b, modo):
+    """Metros del eslabón más débil entre a y b, o None si no hay camino."""
+    if a == b or not _conectados(nodos, aristas, a, b):
+        return None
+    umbrales = sorted({m for _, _, m in aristas}, reverse=(modo == "max"))
+    for t in umbrales:
+        usables = [c for c in aristas if (c[2] >= t if modo == "max" else c[2] <= t)]
+        if _conectados(nodos, usables, a, b):
+            return t
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_consultas_igual_que_fuerza_bruta(modo, red_al_azar):
+    rng = random.Random(18)
+    for _ in range(200):
+        V = rng.randint(1, 8)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, V * (V - 1) // 2), max_metros=15)
+        mst, _, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+        indice = IndiceCuelloBotella(nodos, mst, modo)
+
+        pares = [(a, b) for a in nodos for b in nodos]
+        esperado = [_eslabon_bruto(nodos, aristas, a, b, modo) for a, b in pares]
+        uno_a_uno = [indice.consultar(a, b) for a, b in pares]
+        assert [c and c[2] for c in uno_a_uno] == esperado
+        assert all(c is None or c in mst for c in uno_a_uno)
+        assert indice.consultar_lote(pares) == uno_a_uno
+
+        pa = [indice.posicion[a] for a, _ in pares]
+        pb = [indice.posicion[b] for _, b in pares]
+        metros, _ = indice.metros_lote_ids(pa, pb)
+        assert [None if np.isnan(m) else m for m in metros.tolist()] == esperado
+
+
+def test_rechaza_cables_con_ciclo():
+    with pytest.raises(ValueError):
+        IndiceCuelloBotella(["a", "b", "c"], [("a", "b", 1), ("b", "c", 2), ("a", "c", 3)])
@@ -0,0 +1,122 @@
+"""
+Cables candidatos desde coordenadas contra distancias calculadas a
+mano: el árbol k-d debe dar las k distancias más cortas (con puntos
+repetidos y con k ≥ V), knn debe elegir exactamente k vecinos por
+punto, y el tope `max_metros` sólo quita los cables largos.
+"""
+
+import math
+import random
+from itertools import combinations
+
+import pytest
+
+from geometria import ArbolKD, _pares_knn, cables_candidatos
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal
+
+
+def _puntos(rng, V, repetidos=False):
+    puntos = [(rng.randint(0, 40), rng.randint(0, 40)) for _ in range(V)]
+    if repetidos and V >= 2:
+        for _ in range(V // 3):
+            puntos[rng.randrange(V)] = puntos[rng.randrange(V)]
+    return puntos
+
+
+@pytest.mark.parametrize("repetidos", [False, True])
+def test_vecinos_igual_que_fuerza_bruta(repetidos):
+    rng = random.Random(13)
+    for _ in range(200):
+        V = rng.randint(1, 30)
+        puntos = _puntos(rng, V, repetidos)
+        arbol = ArbolKD(puntos)
+        for q in puntos[:5] + [(rng.uniform(-5, 45), rng.uniform(-5, 45))]:
+            bruto = sorted(math.dist(q, p) for p in puntos)
+            for k in (1, 3, V - 1, V, V + 4):
+                vecinos = arbol.vecinos(q, k)
+                assert len(vecinos) == min(k, V)
+                assert len({i for _, i in vecinos}) == len(vecinos)
+                assert [d for d, _ in vecinos] == pytest.approx(bruto[:k])
+                assert all(d == pytest.approx(math.dist(q, puntos[i])) for d, i in vecinos)
+
+
+@pytest.mark.parametrize("repetidos", [False, True])
+def test_pares_knn_son_exactamente_k_por_punto(repetidos):
+    rng = random.Random(133)
+    for _ in range(80):
+        V = rng.randint(1, 25)
+        puntos = _puntos(rng, V, repetidos)
+        for k in (1, 2, 4, V, V + 3):
+            por_punto = {}
+            for i, j, d in _pares_knn(puntos, k):
+                assert j != i and d == pytest.approx(math.dist(puntos[i], puntos[j]))
+                por_punto.setdefault(i, []).append(j)
+            for i, q in enumerate(puntos):
+                elegidos = por_punto.get(i, [])
+                assert len(elegidos) == len(set(elegidos)) == min(k, V - 1)
+                bruto = sorted(math.dist(q, p) for j, p in enumerate(puntos) if j != i)
+                assert sorted(math.dist(q, puntos[j]) for j in elegidos) == \
+                    pytest.approx(bruto[:k])
+
+
+@pytest.mark.parametrize("repetidos", [False, True])
+def test_knn_une_cada_punto_con_sus_k_vecinos(repetidos):
+    rng = random.Random(130)
+    for _ in range(80):
+        V = rng.randint(1, 25)
+        puntos = _puntos(rng, V, repetidos)
+        coordenadas = {f"p{i}": xy for i, xy in enumerate(puntos)}
+        for k in (1, 2, 4, V, V + 3):
+            cables = cables_candidatos(coordenadas, k=k, redondear=False)
+            pares = {frozenset((u, v)) for u, v, _ in cables}
+            assert len(pares) == len(cables)
+            assert all(m == pytest.approx(math.dist(coordenadas[u], coordenadas[v]))
+                       for u, v, m in cables)
+
+            kk = min(k, V - 1)
+            for n, q in coordenadas.items():
+                otros = sorted(math.dist(q, p) for m, p in coordenadas.items() if m != n)
+                if kk <= 0:
+                    continue
+                radio = otros[kk - 1]
+                propios = [m for u, v, m in cables if n in (u, v)]
+                # Todo lo estrictamente más cerca que el k-ésimo vecino está unido
+                assert sum(1 for d in otros if d < radio) <= \
+                       sum(1 for m in propios if m < radio)
+                assert sum(1 for m in propios if m <= radio) >= kk
+            if k >= V - 1:
+                assert len(cables) == V * (V - 1) // 2
+
+
+def test_max_metros_solo_quita_los_largos():
+    rng = random.Random(131)
+    for _ in range(100):
+        coordenadas = {f"p{i}": xy for i, xy in enumerate(_puntos(rng, rng.randint(2, 20)))}
+        todos = cables_candidatos(coordenadas, k=5, redondear=False)
+        for tope in (0, 5, 12.5, 30, 100):
+            filtrados = cables_candidatos(coordenadas, k=5, max_metros=tope, redondear=False)
+            assert filtrados == [c for c in todos if c[2] <= tope]
+        redondeados = cables_candidatos(coordenadas, k=5, max_metros=12.5)
+        assert all(isinstance(m, int) and m >= 1 for _, _, m in redondeados)
+        assert len(redondeados) == len([c for c in todos if c[2] <= 12.5])
+
+
+def test_metodo_desconocido():
+    with pytest.raises(ValueError):
+        cables_candidatos({"a": (0, 0), "b": (1, 1)}, metodo="voronoi")
+
+
+def test_delaunay_contiene_el_arbol_minimo_euclidiano():
+    pytest.importorskip("scipy")
+    rng = random.Random(132)
+    for _ in range(50):
+        V = rng.randint(3, 40)
+        coordenadas = {f"p{i}": (rng.uniform(0, 100), rng.uniform(0, 100)) for i in range(V)}
+        nodos = list(coordenadas)
+        completos = [(u, v, math.dist(coordenadas[u], coordenadas[v]))
+                     for u, v in combinations(nodos, 2)]
+        delaunay = cables_candidatos(coordenadas, metodo="delaunay", redondear=False)
+        assert len(delaunay) <= 3 * V
+        _, total, _ = ejecutar_kruskal(nodos, delaunay, "min", Verbosidad.NADA)
+        _, optimo, _ = ejecutar_kruskal(nodos, completos, "min", Verbosidad.NADA)
+        assert total == pytest.approx(optimo)
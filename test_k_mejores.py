@@ -0,0 +1,57 @@
+"""
+k mejores árboles: se enumeran a mano todos los subconjuntos de cables
+que forman un bosque de expansión y sus totales ordenados deben ser
+exactamente los que entrega el generador.
+"""
+
+import random
+from itertools import combinations, islice
+
+import pytest
+
+from k_mejores import k_mejores_arboles
+from kruskal_red_electrica import UnionFind, Verbosidad, ejecutar_kruskal
+
+
+def _es_bosque(nodos, cables):
+    uf = UnionFind(nodos)
+    return all(uf.union(u, v) for u, v, _ in cables)
+
+
+def _totales_bruto(nodos, aristas, modo):
+    tamano = len(ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[0])
+    totales = [sum(m for _, _, m in cables) for cables in combinations(aristas, tamano)
+               if _es_bosque(nodos, cables)]
+    return sorted(totales, reverse=(modo == "max"))
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_todos_los_arboles_en_orden(modo, red_al_azar):
+    rng = random.Random(22)
+    for _ in range(120):
+        V = rng.randint(1, 6)
+        E = rng.randint(0, min(9, V * (V - 1) // 2))
+        nodos, aristas = red_al_azar(rng, V, E, max_metros=6)
+        arboles = list(k_mejores_arboles(nodos, aristas, modo=modo))
+
+        assert [total for _, total in arboles] == _totales_bruto(nodos, aristas, modo)
+        assert arboles[0] == ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[:2]
+        vistos = set()
+        for mst, total in arboles:
+            assert _es_bosque(nodos, mst)
+            assert sum(m for _, _, m in mst) == total
+            clave = frozenset(mst)
+            assert clave not in vistos
+            vistos.add(clave)
+
+
+@pytest.mark.parametrize("k", [1, 2, 5])
+def test_k_fijo_es_prefijo_de_la_lista_completa(k, red_al_azar):
+    rng = random.Random(k)
+    for _ in range(60):
+        V = rng.randint(2, 6)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(1, V * (V - 1) // 2), max_metros=6)
+        completos = [total for _, total in k_mejores_arboles(nodos, aristas)]
+        con_k = [total for _, total in k_mejores_arboles(nodos, aristas, k=k)]
+        assert con_k == completos[:k]
+        assert [t for _, t in islice(k_mejores_arboles(nodos, aristas), k)] == con_k
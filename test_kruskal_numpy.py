@@ -0,0 +1,42 @@
+"""
+Motor NumPy: misma secuencia de cables aceptados y mismo total que
+`ejecutar_kruskal`, con bloques de todos los tamaños (1, uno que no
+divide E, el de por defecto) y muchos empates, que es donde importa
+que el argsort sea estable.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from kruskal_numpy import aristas_a_arreglos, ejecutar_kruskal_numpy
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_misma_secuencia_que_kruskal(modo, red_al_azar):
+    rng = random.Random(2)
+    for _ in range(150):
+        V = rng.randint(1, 12)
+        max_metros = rng.choice([1, 3, 50])   # 1 y 3: casi todo empata
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, 40), max_metros, multiples=True)
+        esperado = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[:2]
+        nombres, u, v, w = aristas_a_arreglos(nodos, aristas)
+        E = len(aristas)
+        no_divide = next((b for b in (7, 5, 3) if E % b), 7)
+        for bloque in (1, no_divide, None):
+            mst, total, _ = ejecutar_kruskal_numpy(nombres, u, v, w, modo, bloque=bloque,
+                                                   verbosidad=Verbosidad.NADA)
+            assert (mst, total) == esperado
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_pesos_sin_signo(modo, red_al_azar):
+    rng = random.Random(3)
+    for _ in range(50):
+        nodos, aristas = red_al_azar(rng, 8, 20, max_metros=4, multiples=True)
+        nombres, u, v, w = aristas_a_arreglos(nodos, aristas)
+        mst, total, _ = ejecutar_kruskal_numpy(nombres, u, v, w.astype(np.uint16), modo,
+                                               bloque=3, verbosidad=Verbosidad.NADA)
+        assert (mst, total) == ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[:2]
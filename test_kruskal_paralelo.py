@@ -0,0 +1,43 @@
+"""
+Filter-Kruskal multinúcleo: con los umbrales bajados para que se
+parta, se filtre y se use el pool de verdad, los cables aceptados
+(en orden) y el total deben ser los de `ejecutar_kruskal`.
+"""
+
+import random
+
+import pytest
+
+import kruskal_paralelo
+from kruskal_paralelo import ejecutar_kruskal_paralelo
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_igual_que_serial_con_empates(modo, red_al_azar, monkeypatch):
+    monkeypatch.setattr(kruskal_paralelo, "UMBRAL_BASE", 50)
+    rng = random.Random(6)
+    for max_metros in (1, 2, 5, 1000):       # de todo empatado a casi sin empates
+        for _ in range(3):
+            V = rng.randint(20, 120)
+            nodos, aristas = red_al_azar(rng, V, rng.randint(300, 1500), max_metros,
+                                         multiples=True)
+            esperado = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[:2]
+            mst, total, _ = ejecutar_kruskal_paralelo(nodos, aristas, modo, workers=2,
+                                                      umbral=0, verbosidad=Verbosidad.NADA)
+            assert (mst, total) == esperado
+
+
+def test_usa_el_pool_al_bajar_el_umbral(red_al_azar, monkeypatch):
+    monkeypatch.setattr(kruskal_paralelo, "UMBRAL_BASE", 50)
+    llamadas = []
+    original = kruskal_paralelo._FilterKruskal._en_paralelo
+
+    def contar(self, tarea, cand, *extra):
+        llamadas.append(tarea.__name__)
+        return original(self, tarea, cand, *extra)
+
+    monkeypatch.setattr(kruskal_paralelo._FilterKruskal, "_en_paralelo", contar)
+    nodos, aristas = red_al_azar(random.Random(7), 60, 800, 100, multiples=True)
+    ejecutar_kruskal_paralelo(nodos, aristas, workers=2, umbral=0, verbosidad=Verbosidad.NADA)
+    assert "_tarea_particion" in llamadas and "_tarea_filtro" in llamadas
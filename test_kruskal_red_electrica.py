@@ -0,0 +1,77 @@
+"""
+Núcleo: orden de cables (cubetas contra sorted), RedElectrica
+llevando al día el rango de metros enteros que habilita las cubetas,
+y el log perezoso de pasos comportándose como su lista de líneas.
+"""
+
+import random
+
+import pytest
+
+import kruskal_red_electrica as kre
+from kruskal_red_electrica import (Paso, RedElectrica, RegistroPasos, Verbosidad,
+                                   ejecutar_kruskal, ordenar_por_metros)
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_cubetas_igual_que_sorted_con_empates(modo, monkeypatch):
+    monkeypatch.setattr(kre, "MIN_CUBETAS", 1)
+    monkeypatch.setattr(kre, "ARISTAS_POR_CUBETA", 1)
+    rng = random.Random(19)
+    for _ in range(200):
+        W = rng.randint(1, 8)
+        aristas = [(f"u{i}", f"v{rng.randrange(5)}", rng.randint(3, 2 + W))
+                   for i in range(rng.randint(1, 60))]
+        bajo = min(m for _, _, m in aristas)
+        alto = max(m for _, _, m in aristas)
+        esperado = sorted(aristas, key=lambda a: a[2], reverse=(modo == "max"))
+        assert ordenar_por_metros(aristas, modo, rango=(bajo, alto)) == esperado
+        assert ordenar_por_metros(aristas, modo) == esperado
+
+
+def test_indice_distinto_de_metros(monkeypatch):
+    monkeypatch.setattr(kre, "MIN_CUBETAS", 1)
+    pares = [(i, m) for i, m in enumerate([3, 1, 2, 1, 3, 2])]
+    assert ordenar_por_metros(pares, "max", indice=1, rango=(1, 3)) == \
+           sorted(pares, key=lambda p: p[1], reverse=True)
+
+
+def test_red_lleva_el_rango_de_metros_enteros():
+    red = RedElectrica.desde_listas(["a", "b", "c", "d"], [("a", "b", 7), ("b", "c", 3)])
+    assert red.metros_enteros and red.rango_metros == (3, 7)
+    red.agregar_cable("c", "d", 12.5)
+    assert not red.metros_enteros and red.rango_metros is None
+    assert [m for _, _, m in red.cables_por_metros()] == [3, 7, 12.5]
+
+
+def _registro(rng):
+    nodos = [f"p{i}" for i in range(8)]
+    aristas = [(u, v, rng.randint(1, 9)) for u in nodos for v in nodos if u < v]
+    pasos = ejecutar_kruskal(nodos, aristas, "min", Verbosidad.COMPLETO)[2]
+    pasos.registrar(Paso.MOTOR, "prueba")
+    return pasos
+
+
+def test_registro_se_indexa_como_su_lista():
+    pasos = _registro(random.Random(4))
+    lista = list(pasos)
+    assert len(pasos) == len(lista)
+    assert [pasos[i] for i in range(-len(lista), len(lista))] == lista + lista
+    assert pasos[3:20:4] == lista[3:20:4]
+    with pytest.raises(IndexError):
+        pasos[len(lista)]
+    pasos.registrar(Paso.RECHAZADAS, 3)           # eventos nuevos tras indexar
+    assert pasos[-1] == list(pasos)[-1] and len(pasos) == len(lista) + 1
+
+
+@pytest.mark.parametrize("cada", [1, 2, 3, 7])
+@pytest.mark.parametrize("maximo", [0, 1, 5, 40, None])
+def test_lineas_omitidas_cuentan_el_muestreo(cada, maximo):
+    pasos = _registro(random.Random(40))
+    muestreadas = list(pasos)[::cada]
+    salida = list(pasos.lineas(maximo=maximo, cada=cada))
+    if maximo is None or maximo >= len(muestreadas):
+        assert salida == muestreadas
+    else:
+        assert salida[:-1] == muestreadas[:maximo]
+        assert salida[-1] == f"   … {len(muestreadas) - maximo} líneas más omitidas"
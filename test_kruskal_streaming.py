@@ -0,0 +1,71 @@
+"""
+Kruskal en flujo: con corridas de pocos cables para que se vuelquen
+varias a disco y se mezclen, el resultado desde CSV y desde JSON-lines
+debe ser el de `ejecutar_kruskal` en memoria, y al terminar no debe
+quedar ningún archivo de corrida.
+"""
+
+import csv
+import json
+import random
+
+import pytest
+
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal
+from kruskal_streaming import OrdenExterno, ejecutar_kruskal_streaming
+
+
+def _escribir_csv(ruta, aristas):
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(["origen", "destino", "metros"])
+        escritor.writerows(aristas)
+
+
+def _escribir_jsonl(ruta, aristas):
+    with open(ruta, "w", encoding="utf-8") as f:
+        for i, (u, v, m) in enumerate(aristas):
+            # Alterna las dos formas de línea que acepta el lector
+            dato = [u, v, m] if i % 2 else {"origen": u, "destino": v, "metros": m}
+            f.write(json.dumps(dato) + "\n")
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+@pytest.mark.parametrize("formato", ["csv", "jsonl"])
+def test_igual_que_en_memoria(modo, formato, red_al_azar, tmp_path):
+    rng = random.Random(3)
+    corridas = tmp_path / "corridas"
+    corridas.mkdir()
+    for num in range(25):
+        V = rng.randint(1, 15)
+        max_metros = rng.choice([3, 40])
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, 60), max_metros, multiples=True)
+        ruta = tmp_path / f"red{num}.{formato}"
+        (_escribir_csv if formato == "csv" else _escribir_jsonl)(ruta, aristas)
+
+        mst, total, _ = ejecutar_kruskal_streaming(str(ruta), modo, nodos=nodos, tam_bloque=4,
+                                                   dir_tmp=str(corridas),
+                                                   verbosidad=Verbosidad.NADA)
+        assert (mst, total) == ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[:2]
+        assert list(corridas.iterdir()) == []
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_orden_externo_estable_y_limpio(modo, red_al_azar, tmp_path):
+    nodos, aristas = red_al_azar(random.Random(4), 10, 50, max_metros=3, multiples=True)
+    with OrdenExterno(iter(aristas), modo, tam_bloque=6, dir_tmp=str(tmp_path)) as orden:
+        assert len(orden.corridas) == 9
+        assert len(list(tmp_path.iterdir())) == 9
+        assert list(orden) == sorted(aristas, key=lambda a: a[2], reverse=(modo == "max"))
+        assert list(orden.nodos) == list(dict.fromkeys(n for a in aristas for n in a[:2]))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_linea_mala_no_deja_corridas(tmp_path):
+    ruta = tmp_path / "red.csv"
+    ruta.write_text("a,b,1\nb,c,2\nc,d,3\nd,e,4\nsolo,dos\n", encoding="utf-8")
+    corridas = tmp_path / "corridas"
+    corridas.mkdir()
+    with pytest.raises(ValueError):
+        ejecutar_kruskal_streaming(str(ruta), tam_bloque=2, dir_tmp=str(corridas))
+    assert list(corridas.iterdir()) == []
@@ -0,0 +1,87 @@
+"""
+Lote de escenarios: una línea o una red mal formada vuelve como un
+registro con "error" y el lote sigue; las buenas dan lo mismo que
+Kruskal. Con un solo worker los resultados salen en el orden de la
+entrada.
+"""
+
+import json
+
+import pytest
+
+from kruskal_red_electrica import RedElectrica, Verbosidad, ejecutar_kruskal
+from lote_escenarios import leer_escenarios, resolver_lote, resolver_red
+
+BUENA = {"nodos": ["a", "b", "c"], "cables": [["a", "b", 2], ["b", "c", 3], ["a", "c", 9]]}
+
+
+@pytest.mark.parametrize("dato", [
+    [1, 2],
+    {"nodos": "abc"},
+    {"nodos": ["a", 2]},
+    {"nodos": ["a", "b"], "cables": {"a": "b"}},
+    {"nodos": ["a", "b"], "cables": [["a", "b"]]},
+    {"nodos": ["a", "b"], "cables": [["a", "b", "diez"]]},
+    {"nodos": ["a", "b"], "cables": [["a", "b", True]]},
+    {"nodos": ["a", "b"], "cables": [["a", 1, 3]]},
+    {"nodos": ["a", "b"], "cables": [["a", "z", 3]]},
+    {"nodos": ["a", "a"]},
+    {"nodos": ["a"], "tipos": ["casa"]},
+    {"nodos": ["a"], "coordenadas": {"a": []}},
+])
+def test_forma_invalida_es_un_registro_de_error(dato):
+    if isinstance(dato, dict):
+        dato = dict(dato, nombre="mala")
+        with pytest.raises((KeyError, ValueError)):
+            RedElectrica.desde_dict(dato)
+    resultados = resolver_red(dato)
+    assert len(resultados) == 1 and resultados[0]["error"]
+    assert resultados[0]["nombre"] == (dato.get("nombre") if isinstance(dato, dict) else None)
+
+
+def test_red_buena_igual_que_kruskal():
+    resultados = resolver_red(dict(BUENA, nombre="buena"))
+    for resultado, modo in zip(resultados, ("min", "max")):
+        mst, total, _ = ejecutar_kruskal(BUENA["nodos"], [tuple(c) for c in BUENA["cables"]],
+                                         modo, Verbosidad.NADA)
+        assert resultado == {"nombre": "buena", "modo": modo, "total": total,
+                             "conexa": True, "cables": [list(c) for c in mst]}
+
+
+def test_lineas_malas_en_jsonl(tmp_path):
+    archivo = tmp_path / "variantes.jsonl"
+    archivo.write_text("\n".join([json.dumps(BUENA), "{roto", "[1, 2]", "",
+                                  json.dumps(dict(BUENA, nombre="con nombre"))]) + "\n",
+                       encoding="utf-8")
+    escenarios = list(leer_escenarios(str(archivo)))
+    assert [e["nombre"] for e in escenarios] == \
+        ["variantes.jsonl:1", "variantes.jsonl:2", "variantes.jsonl:3", "con nombre"]
+    assert ["error" in e for e in escenarios] == [False, True, True, False]
+    assert escenarios[1]["error"].startswith("JSON inválido")
+
+
+def test_directorio_de_json(tmp_path):
+    (tmp_path / "b.json").write_text(json.dumps(BUENA), encoding="utf-8")
+    (tmp_path / "a.json").write_text("no es json", encoding="utf-8")
+    (tmp_path / "notas.txt").write_text("se ignora", encoding="utf-8")
+    escenarios = list(leer_escenarios(str(tmp_path)))
+    assert [(e["nombre"], "error" in e) for e in escenarios] == [("a", True), ("b", False)]
+
+
+def test_orden_de_la_entrada_con_un_worker(tmp_path):
+    escenarios = []
+    for i in range(23):
+        if i % 5 == 3:
+            escenarios.append({"nombre": f"r{i}", "nodos": ["a"], "cables": [["a", "b", 1]]})
+        else:
+            n = i % 4 + 2
+            nodos = [f"p{j}" for j in range(n)]
+            escenarios.append({"nombre": f"r{i}", "nodos": nodos,
+                               "cables": [[nodos[j], nodos[j + 1], i + j] for j in range(n - 1)]})
+    archivo = tmp_path / "lote.jsonl"
+    archivo.write_text("".join(json.dumps(e) + "\n" for e in escenarios), encoding="utf-8")
+
+    resultados = list(resolver_lote(str(archivo), modos=("min", "max"), workers=1, tam_trozo=2))
+    esperado = [r for e in escenarios for r in resolver_red(e)]
+    assert resultados == esperado
+    assert sum(1 for r in resultados if "error" in r) == 4
@@ -0,0 +1,127 @@
+"""
+Árbol incremental: tras cada alta, baja o cambio de precio el total
+debe ser el de Kruskal desde cero, y el árbol un bosque de expansión
+con los punteros al padre consistentes.
+"""
+
+import random
+
+import pytest
+
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal
+from mst_incremental import ArbolIncremental
+
+
+def _total_kruskal(arbol):
+    aristas = [(u, v, m) for (u, v), m in arbol.cables.items()]
+    return ejecutar_kruskal(list(arbol.vecinos), aristas, arbol.modo, Verbosidad.NADA)[1]
+
+
+def _revisar(arbol):
+    assert arbol.total == _total_kruskal(arbol)
+    assert arbol.total == sum(m for _, _, m in arbol.mst)
+    for u, vecinos in arbol.arbol.items():
+        for v, m in vecinos.items():
+            assert arbol.cables[tuple(sorted((u, v)))] == m
+    # Cada puntero al padre es un cable del árbol y subir siempre termina
+    aristas_padre = 0
+    for x, p in arbol.padre.items():
+        if p is not None:
+            assert arbol.en_arbol(x, p)
+            aristas_padre += 1
+        pasos = 0
+        while x is not None:
+            x = arbol.padre[x]
+            pasos += 1
+            assert pasos <= len(arbol.padre)
+    assert aristas_padre == len(arbol.mst)
+
+
+def _camino_bfs(arbol, a, b):
+    previo, frente = {a: None}, [a]
+    while frente:
+        siguiente = []
+        for x in frente:
+            for y in arbol.arbol[x]:
+                if y not in previo:
+                    previo[y] = x
+                    siguiente.append(y)
+        frente = siguiente
+    if b not in previo:
+        return None
+    ruta = [b]
+    while previo[ruta[-1]] is not None:
+        ruta.append(previo[ruta[-1]])
+    return ruta[::-1]
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_altas_y_bajas_igual_que_kruskal(modo, red_al_azar):
+    rng = random.Random(5)
+    for _ in range(150):
+        V = rng.randint(2, 9)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, V * (V - 1) // 2), max_metros=20)
+        arbol = ArbolIncremental(nodos, aristas, modo)
+        _revisar(arbol)
+        for _ in range(12):
+            u, v = rng.sample(nodos, 2)
+            if arbol.cables.get(tuple(sorted((u, v)))) is None:
+                arbol.agregar_cable(u, v, rng.randint(1, 20))
+            elif rng.random() < 0.5:
+                arbol.quitar_cable(u, v)
+            else:
+                arbol.cambiar_metros(u, v, rng.randint(1, 20))
+            _revisar(arbol)
+
+
+def test_camino_igual_que_bfs(red_al_azar):
+    rng = random.Random(11)
+    for _ in range(100):
+        V = rng.randint(1, 12)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, 2 * V), max_metros=20)
+        arbol = ArbolIncremental(nodos, aristas)
+        for a in nodos:
+            for b in nodos:
+                assert arbol.camino(a, b) == _camino_bfs(arbol, a, b)
+
+
+def test_cable_a_si_mismo_no_cambia_nada():
+    arbol = ArbolIncremental(["A", "B"], [("A", "B", 3)])
+    with pytest.raises(ValueError):
+        arbol.agregar_cable("A", "A", 1)
+    with pytest.raises(ValueError):
+        arbol.agregar_cable("C", "C", 1)
+    assert "A" not in arbol.vecinos["A"]
+    assert "C" not in arbol.vecinos
+    assert len(arbol.cables) == 1
+    _revisar(arbol)
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+@pytest.mark.parametrize("fraccion", [0.0, 1.0])   # siempre Kruskal completo / siempre incremental
+def test_cambiar_precios_igual_que_kruskal(modo, fraccion, red_al_azar):
+    rng = random.Random(20)
+    for _ in range(150):
+        V = rng.randint(2, 9)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(1, V * (V - 1) // 2), max_metros=20)
+        arbol = ArbolIncremental(nodos, aristas, modo)
+        for _ in range(4):
+            antes = {tuple(sorted((u, v))): m for u, v, m in arbol.mst}
+            claves = rng.sample(sorted(arbol.cables), rng.randint(1, len(arbol.cables)))
+            cambios = [(u, v, rng.randint(1, 20)) for u, v in claves]
+            entran, salen = arbol.cambiar_precios(cambios, fraccion=fraccion)
+            _revisar(arbol)
+
+            despues = {tuple(sorted((u, v))): m for u, v, m in arbol.mst}
+            assert {tuple(sorted(c[:2])) for c in entran} == despues.keys() - antes.keys()
+            assert {tuple(sorted(c[:2])) for c in salen} == antes.keys() - despues.keys()
+            assert all(despues[tuple(sorted(c[:2]))] == c[2] for c in entran)
+            assert all(antes[tuple(sorted(c[:2]))] == c[2] for c in salen)
+
+
+def test_cambiar_precios_cable_inexistente_no_aplica_nada():
+    arbol = ArbolIncremental(["A", "B", "C"], [("A", "B", 3), ("B", "C", 4)])
+    with pytest.raises(KeyError):
+        arbol.cambiar_precios([("A", "B", 9), ("A", "C", 1)])
+    assert arbol.cables[("A", "B")] == 3
+    _revisar(arbol)
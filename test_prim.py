@@ -0,0 +1,63 @@
+"""
+Motores Prim: mismo total que Kruskal en MIN y MAX, con redes no
+conexas (un árbol por zona), cables repetidos entre el mismo par y
+pesos sin signo en la matriz densa.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from kruskal_red_electrica import RedElectrica, Verbosidad, ejecutar_kruskal
+from prim import matriz_desde_aristas, prim_denso, prim_heap, resolver_con_motor
+
+
+def _es_bosque_de(nodos, aristas, mst):
+    existentes = {frozenset((u, v)): set() for u, v, _ in aristas}
+    for u, v, m in aristas:
+        existentes[frozenset((u, v))].add(m)
+    return all(m in existentes.get(frozenset((u, v)), ()) for u, v, m in mst)
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_totales_igual_que_kruskal(modo, red_al_azar):
+    rng = random.Random(14)
+    for _ in range(200):
+        V = rng.randint(1, 14)
+        max_metros, multiples = rng.choice([2, 30]), rng.random() < 0.5
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, 2 * V), max_metros, multiples)
+        kruskal, total, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+
+        nombres, W, existe = matriz_desde_aristas(nodos, aristas, modo)
+        for mst, suma, _ in (prim_denso(nombres, W, modo, existe, Verbosidad.NADA),
+                             prim_heap(nodos, aristas, modo, Verbosidad.NADA)):
+            assert suma == total
+            assert len(mst) == len(kruskal)       # también en redes no conexas
+            assert _es_bosque_de(nodos, aristas, mst)
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_matriz_sin_signo_y_con_nan(modo):
+    rng = random.Random(15)
+    for _ in range(50):
+        V = rng.randint(2, 10)
+        nodos = [f"p{i}" for i in range(V)]
+        aristas = [(nodos[i], nodos[j], rng.randint(1, 200))
+                   for i in range(V) for j in range(i + 1, V) if rng.random() < 0.6]
+        total = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[1]
+
+        nombres, W, existe = matriz_desde_aristas(nodos, aristas, modo)
+        assert prim_denso(nombres, W.astype(np.uint8), modo, existe,
+                          Verbosidad.NADA)[1] == total
+        con_nan = np.where(existe, W, np.nan)
+        assert prim_denso(nombres, con_nan, modo, verbosidad=Verbosidad.NADA)[1] == total
+
+
+def test_motor_por_nombre():
+    red = RedElectrica.desde_listas(["a", "b", "c"], [("a", "b", 2), ("b", "c", 5), ("a", "c", 3)])
+    for motor in ("kruskal", "prim_denso", "prim_heap"):
+        assert resolver_con_motor(red.nodos, red.aristas, motor, "min", Verbosidad.NADA)[1] == 5
+        assert red.resolver_bosque("max", motor=motor)[1] == 8
+    with pytest.raises(ValueError):
+        resolver_con_motor(red.nodos, red.aristas, "auto")
@@ -0,0 +1,92 @@
+"""
+Persistencia: guardar y volver a cargar (.kred y .json) debe dar la
+misma red y los mismos árboles; un .kred cortado, con otra magia o
+con otra versión se rechaza al abrirlo, no al leer una columna.
+"""
+
+import random
+
+import pytest
+
+from kruskal_red_electrica import RedElectrica
+from red_binaria import ENCABEZADO, abrir_red, cargar, guardar
+
+
+def _red(rng, metros_reales=False):
+    V = 12
+    nodos = [f"punto {i} ñ" for i in range(V)]          # nombres con UTF-8 de varios bytes
+    tipos = {n: rng.choice(["casa", "edificio", "transformador"]) for n in nodos}
+    coordenadas = {n: (rng.uniform(0, 100), rng.uniform(0, 100)) for n in nodos[::2]}
+    pares = [(nodos[i], nodos[j]) for i in range(V) for j in range(i + 1, V)]
+    aristas = [(u, v, rng.uniform(1, 50) if metros_reales else rng.randint(1, 50))
+               for u, v in rng.sample(pares, 30)]
+    return RedElectrica.desde_listas(nodos, aristas, tipos, coordenadas)
+
+
+def _archivo(tmp_path, rng, extension=".kred"):
+    red = _red(rng)
+    ruta = str(tmp_path / f"red{extension}")
+    guardar(red, ruta, {m: red.resolver(m)[0] for m in ("min", "max")})
+    return ruta
+
+
+@pytest.mark.parametrize("extension", [".kred", ".json"])
+@pytest.mark.parametrize("metros_reales", [False, True])
+def test_ida_y_vuelta(tmp_path, extension, metros_reales):
+    red = _red(random.Random(16), metros_reales)
+    arboles = {m: red.resolver(m)[0] for m in ("min", "max")}
+    ruta = str(tmp_path / f"red{extension}")
+    guardar(red, ruta, arboles)
+
+    leida, arboles_leidos = cargar(ruta)
+    assert leida.nodos == red.nodos
+    assert leida.aristas == red.aristas
+    assert leida.tipos == red.tipos
+    assert {n: tuple(xy) for n, xy in leida.coordenadas.items()} == red.coordenadas
+    assert arboles_leidos == arboles
+    for modo in ("min", "max"):
+        assert leida.resolver(modo)[1] == red.resolver(modo)[1]
+
+
+def test_red_binaria_resuelve_sobre_el_mmap(tmp_path):
+    red = _red(random.Random(160))
+    ruta = str(tmp_path / "red.kred")
+    guardar(red, ruta)
+    binaria = abrir_red(ruta)
+    assert binaria.arboles == {} and len(binaria) == len(red.nodos)
+    for modo in ("min", "max"):
+        assert binaria.resolver(modo)[1] == red.resolver(modo)[1]
+
+
+def test_red_vacia(tmp_path):
+    ruta = str(tmp_path / "vacia.kred")
+    guardar(RedElectrica(), ruta)
+    red, arboles = cargar(ruta)
+    assert (red.nodos, red.aristas, arboles) == ([], [], {})
+
+
+def test_archivo_truncado_se_rechaza_al_abrir(tmp_path):
+    ruta = _archivo(tmp_path, random.Random(161))
+    with open(ruta, "rb") as f:
+        completo = f.read()
+    cortado = str(tmp_path / "cortado.kred")
+    for largo in [0, 1, ENCABEZADO.size - 1, ENCABEZADO.size] + \
+                 list(range(ENCABEZADO.size + 1, len(completo), 7)) + [len(completo) - 1]:
+        with open(cortado, "wb") as f:
+            f.write(completo[:largo])
+        with pytest.raises(ValueError, match="truncado"):
+            abrir_red(cortado)
+
+
+@pytest.mark.parametrize("desde, reemplazo, mensaje", [
+    (0, b"NOPE", "no es un archivo de red"),
+    (4, (2).to_bytes(2, "little"), "versión"),
+    (6, b"x", "tipo de metros"),
+])
+def test_encabezado_invalido(tmp_path, desde, reemplazo, mensaje):
+    ruta = _archivo(tmp_path, random.Random(162))
+    with open(ruta, "r+b") as f:
+        f.seek(desde)
+        f.write(reemplazo)
+    with pytest.raises(ValueError, match=mensaje):
+        abrir_red(ruta)
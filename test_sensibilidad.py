@@ -0,0 +1,51 @@
+"""
+Sensibilidad de precios: con el precio de un cable justo en su límite
+el árbol actual sigue siendo óptimo; un metro más allá, ya no.
+"""
+
+import random
+
+import pytest
+
+from kruskal_red_electrica import Verbosidad, ejecutar_kruskal
+from sensibilidad import analizar_sensibilidad
+
+
+def _optimo(nodos, aristas, modo):
+    return ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)[1]
+
+
+def _con_precio(aristas, i, metros):
+    u, v, _ = aristas[i]
+    return aristas[:i] + [(u, v, metros)] + aristas[i + 1:]
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_limites_igual_que_fuerza_bruta(modo, red_al_azar):
+    rng = random.Random(17)
+    s = 1 if modo == "min" else -1          # "mejor" = menor en MIN, mayor en MAX
+    for _ in range(300):
+        V = rng.randint(2, 7)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(1, V * (V - 1) // 2), max_metros=12)
+        mst, total, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+        filas = analizar_sensibilidad(nodos, aristas, modo)
+
+        assert sorted(f[:3] for f in filas if f[3]) == sorted(mst)
+        for i, (_, _, metros, en_arbol, limite) in enumerate(filas):
+            if en_arbol:
+                if limite is None:
+                    # Puente: con cualquier precio sigue en el árbol
+                    peor = metros + s * 1000
+                    assert _optimo(nodos, _con_precio(aristas, i, peor), modo) == total + s * 1000
+                    continue
+                assert s * (limite - metros) >= 0
+                # En el límite el árbol actual empata; un metro peor, ya no es óptimo
+                assert _optimo(nodos, _con_precio(aristas, i, limite), modo) == total + limite - metros
+                mas_alla = limite + s
+                assert s * _optimo(nodos, _con_precio(aristas, i, mas_alla), modo) < \
+                       s * (total + mas_alla - metros)
+            else:
+                assert limite is not None
+                assert s * (metros - limite) >= 0
+                assert _optimo(nodos, _con_precio(aristas, i, limite), modo) == total
+                assert s * _optimo(nodos, _con_precio(aristas, i, limite - s), modo) < s * total
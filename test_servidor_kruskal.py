@@ -0,0 +1,148 @@
+"""
+Servidor JSON-lines: cada operación se llama directo con `atender` o
+`atender_linea`, sin proceso ni socket. Toda petición rota debe volver
+como {"ok": false, "error": ...} y dejar al servidor atendiendo.
+"""
+
+import json
+
+import pytest
+
+from kruskal_red_electrica import Verbosidad, cargar_ejemplo, ejecutar_kruskal
+from servidor_kruskal import ServidorKruskal
+
+TRIANGULO = {"nodos": ["a", "b", "c"], "tipos": {"a": "transformador"},
+             "cables": [["a", "b", 2], ["b", "c", 3], ["a", "c", 9]]}
+
+
+@pytest.fixture
+def servidor():
+    servidor = ServidorKruskal()
+    assert servidor.atender({"op": "cargar", "red": "tri", "dato": TRIANGULO})["ok"]
+    assert servidor.atender({"op": "cargar", "red": "palmas", "ejemplo": True})["ok"]
+    return servidor
+
+
+def _ok(servidor, **peticion):
+    respuesta = servidor.atender(dict(peticion, id=7))
+    assert respuesta["ok"], respuesta
+    assert respuesta["id"] == 7
+    return respuesta
+
+
+def _error(servidor, **peticion):
+    respuesta = servidor.atender(peticion)
+    assert respuesta["ok"] is False
+    assert isinstance(respuesta["error"], str) and respuesta["error"]
+    return respuesta["error"]
+
+
+def test_ping_redes_y_descargar(servidor):
+    assert _ok(servidor, op="ping")["redes"] == 2
+    redes = _ok(servidor, op="redes")["redes"]
+    assert redes["tri"] == {"puntos": 3, "cables": 3, "version": redes["tri"]["version"]}
+    assert _ok(servidor, op="descargar", red="tri")["red"] == "tri"
+    assert set(_ok(servidor, op="redes")["redes"]) == {"palmas"}
+    _error(servidor, op="resolver", red="tri")
+
+
+def test_cargar_pide_una_fuente_y_valida_cables(servidor):
+    _error(servidor, op="cargar")
+    _error(servidor, op="cargar", dato=[1, 2])
+    _error(servidor, op="cargar", dato={"nodos": ["a", "b"], "cables": [["a", "b"]]})
+    _error(servidor, op="cargar", dato={"nodos": ["a", "b"], "cables": [["a", "b", 0]]})
+    _error(servidor, op="cargar", dato={"nodos": ["a", "b"], "cables": [["a", "b", "diez"]]})
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_resolver_igual_que_kruskal(servidor, modo):
+    red = cargar_ejemplo()
+    mst, total, _ = ejecutar_kruskal(red.nodos, red.aristas, modo, Verbosidad.NADA)
+    respuesta = _ok(servidor, op="resolver", red="palmas", modo=modo)
+    assert (respuesta["modo"], respuesta["total"], respuesta["conexa"]) == (modo, total, True)
+    assert sorted(map(tuple, respuesta["cables"])) == sorted(mst)
+    for motor in ("prim_heap", "prim_denso"):
+        assert _ok(servidor, op="resolver", red="palmas", modo=modo, motor=motor)["total"] == total
+
+
+def test_agregar_punto_y_cable_cambian_el_resultado(servidor):
+    _ok(servidor, op="agregar_punto", red="tri", nombre="d", coords=[1, 2])
+    respuesta = _ok(servidor, op="resolver", red="tri")
+    assert (respuesta["total"], respuesta["zonas"], respuesta["conexa"]) == (5, 2, False)
+    assert _ok(servidor, op="agregar_cable", red="tri", u="c", v="d", metros=4)["cables"] == 4
+    assert _ok(servidor, op="resolver", red="tri")["total"] == 9
+    _error(servidor, op="agregar_cable", red="tri", u="a", v="d", metros=-1)
+    _error(servidor, op="agregar_cable", red="tri", u="a", v="d", metros=True)
+    _error(servidor, op="agregar_punto", red="tri", nombre="e", coords=[1])
+
+
+def test_cuello_por_defecto_en_max(servidor):
+    respuesta = _ok(servidor, op="cuello", red="tri", pares=[["a", "c"], ["a", "a"]])
+    assert respuesta["cables"] == [["a", "c", 9], None]
+    assert _ok(servidor, op="cuello", red="tri", pares=[["a", "b"]])["cables"] == [["b", "c", 3]]
+    respuesta = _ok(servidor, op="cuello", red="tri", modo="min", pares=[["a", "c"]])
+    assert respuesta["cables"] == [["b", "c", 3]]
+
+
+def test_sensibilidad(servidor):
+    filas = _ok(servidor, op="sensibilidad", red="tri")["cables"]
+    por_cable = {(f["u"], f["v"]): (f["en_arbol"], f["limite"]) for f in filas}
+    assert por_cable == {("a", "b"): (True, 9), ("b", "c"): (True, 9), ("a", "c"): (False, 3)}
+
+
+def test_zonas(servidor):
+    assert _ok(servidor, op="zonas", red="tri", k=2)["zonas"] == {"a": 0, "b": 0, "c": 1}
+    zonas = _ok(servidor, op="zonas", red="tri", t=2)["zonas"]
+    assert zonas["a"] == zonas["b"] != zonas["c"]
+    zonas = _ok(servidor, op="zonas", red="palmas", transformadores=True)["zonas"]
+    assert set(zonas.values()) <= {"Transf. Norte", "Transf. Sur"}
+    assert zonas["Transf. Norte"] == "Transf. Norte"
+    _error(servidor, op="zonas", red="tri")
+
+
+def test_verificar(servidor):
+    respuesta = _ok(servidor, op="verificar", red="tri", arbol=[["a", "b", 2], ["b", "c", 3]])
+    assert respuesta["optimo"] and respuesta["es_arbol"] and respuesta["reporte"]
+    respuesta = _ok(servidor, op="verificar", red="tri", arbol=[["a", "b", 2], ["a", "c", 9]])
+    assert respuesta["es_arbol"] and not respuesta["optimo"] and respuesta["violaciones"]
+
+
+@pytest.mark.parametrize("extension", [".kred", ".json"])
+def test_guardar_y_cargar_archivo(servidor, tmp_path, extension):
+    archivo = str(tmp_path / f"palmas{extension}")
+    assert _ok(servidor, op="guardar", red="palmas", archivo=archivo)["archivo"] == archivo
+    assert _ok(servidor, op="cargar", red="copia", archivo=archivo)["cables"] == \
+        len(cargar_ejemplo().aristas)
+    assert _ok(servidor, op="resolver", red="copia")["total"] == \
+        _ok(servidor, op="resolver", red="palmas")["total"]
+    _error(servidor, op="cargar", archivo=str(tmp_path / "no_existe.kred"))
+
+
+def test_red_desconocida(servidor):
+    for op in ("descargar", "agregar_punto", "agregar_cable", "resolver", "cuello",
+               "sensibilidad", "zonas", "verificar", "guardar"):
+        assert "nope" in _error(servidor, op=op, red="nope")
+
+
+@pytest.mark.parametrize("op", ["resolver", "cuello", "sensibilidad", "zonas", "verificar"])
+def test_modo_invalido(servidor, op):
+    peticion = {"pares": [["a", "c"]], "k": 2, "arbol": [["a", "b", 2], ["b", "c", 3]]}
+    assert "bogus" in _error(servidor, op=op, red="tri", modo="bogus", **peticion)
+
+
+def test_motor_y_operacion_desconocidos(servidor):
+    _error(servidor, op="resolver", red="tri", motor="auto")
+    assert "borrar_todo" in _error(servidor, op="borrar_todo")
+    _error(servidor)
+    respuesta = servidor.atender([1, 2, 3])
+    assert respuesta["ok"] is False and respuesta["id"] is None
+
+
+def test_atender_linea(servidor):
+    respuesta = json.loads(servidor.atender_linea('{"id": 3, "op": "ping"}'))
+    assert respuesta == {"id": 3, "ok": True, "redes": 2}
+    respuesta = json.loads(servidor.atender_linea('{"id": 3, "op": '))
+    assert respuesta["ok"] is False and respuesta["id"] is None
+    assert respuesta["error"].startswith("JSON inválido")
+    # Después de una línea rota el servidor sigue atendiendo
+    assert json.loads(servidor.atender_linea('{"op": "ping"}'))["ok"]
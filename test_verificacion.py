@@ -0,0 +1,70 @@
+"""
+Verificación de planes: un plan es árbol de expansión si sus cables
+existen, no cierran ciclos y dejan tantas zonas como la red; es
+óptimo si además su total es el de Kruskal. Se prueban árboles de
+Kruskal, árboles al azar y planes rotos.
+"""
+
+import random
+
+import pytest
+
+from kruskal_red_electrica import UnionFind, Verbosidad, ejecutar_kruskal
+from verificacion import verificar_arbol
+
+
+def _zonas(nodos, cables):
+    uf = UnionFind(nodos)
+    for u, v, _ in cables:
+        uf.union(u, v)
+    return sum(1 for x in range(len(uf)) if uf.find_id(x) == x)
+
+
+def _es_arbol_bruto(nodos, aristas, plan):
+    existentes = {frozenset((u, v)) for u, v, _ in aristas}
+    if any(frozenset((u, v)) not in existentes for u, v, _ in plan):
+        return False
+    return (len(plan) == len(nodos) - _zonas(nodos, aristas)
+            and _zonas(nodos, plan) == _zonas(nodos, aristas))
+
+
+def _planes(rng, nodos, aristas, modo):
+    mst, _, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+    yield mst
+    for _ in range(3):                      # árboles de expansión al azar
+        revueltas = aristas[:]
+        rng.shuffle(revueltas)
+        yield ejecutar_kruskal(nodos, revueltas, modo, Verbosidad.NADA,
+                               ordenadas=revueltas)[0]
+    if mst:
+        yield mst[1:]                                  # deja una zona suelta
+    fuera = [c for c in aristas if c not in mst]
+    if fuera:
+        yield mst + [rng.choice(fuera)]                # cierra un ciclo
+    if len(nodos) >= 2:
+        yield mst + [(nodos[0], "fantasma", 1)]        # cable inexistente
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_veredicto_igual_que_fuerza_bruta(modo, red_al_azar):
+    rng = random.Random(21)
+    for _ in range(300):
+        V = rng.randint(1, 8)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, V * (V - 1) // 2), max_metros=10)
+        _, optimo, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+        for plan in _planes(rng, nodos, aristas, modo):
+            resultado = verificar_arbol(nodos, aristas, plan, modo)
+            es_arbol = _es_arbol_bruto(nodos, aristas, plan)
+            assert resultado.es_arbol == es_arbol
+            assert resultado.optimo == (es_arbol and sum(m for _, _, m in plan) == optimo)
+            if resultado.es_arbol and not resultado.optimo:
+                assert resultado.violaciones
+            assert list(resultado.lineas())
+
+
+def test_metros_distintos_se_reportan_y_se_usan_los_de_la_red():
+    nodos = ["a", "b", "c"]
+    aristas = [("a", "b", 2), ("b", "c", 3), ("a", "c", 9)]
+    resultado = verificar_arbol(nodos, aristas, [("a", "b", 2), ("c", "b", 1)])
+    assert resultado.optimo
+    assert resultado.metros_distintos == [("c", "b", 1, 3)]
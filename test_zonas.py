@@ -0,0 +1,132 @@
+"""
+Zonificación por enlace simple contra definiciones directas: cortar
+en k zonas es quitar del árbol los k - 1 cables peores; cortar en t
+es quedarse con las componentes de los cables de a lo más t metros
+(al menos t en MAX); y la zona de cada casa es el transformador de
+su árbol en el mejor bosque con un transformador por árbol.
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from kruskal_red_electrica import UnionFind, Verbosidad, ejecutar_kruskal
+from zonas import Dendrograma, zonas_de_transformadores
+
+
+def _particion(nodos, cables):
+    """Componentes de `cables` sobre `nodos` como conjunto de conjuntos de nombres."""
+    uf = UnionFind(nodos)
+    for u, v, _ in cables:
+        uf.union(u, v)
+    grupos = {}
+    for n in nodos:
+        grupos.setdefault(uf.find(n), set()).add(n)
+    return {frozenset(g) for g in grupos.values()}
+
+
+def _particion_de(dendrograma, etiquetas):
+    return {frozenset(g) for g in dendrograma.grupos(etiquetas)}
+
+
+def _red_sin_empates(rng, V, E):
+    nodos = [f"p{i}" for i in range(V)]
+    pares = [(nodos[i], nodos[j]) for i in range(V) for j in range(i + 1, V)]
+    rng.shuffle(pares)
+    metros = rng.sample(range(1, 200), E)
+    return nodos, [(u, v, m) for (u, v), m in zip(pares[:E], metros)]
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_k_zonas_es_quitar_los_peores_cables_del_arbol(modo):
+    rng = random.Random(23)
+    for _ in range(200):
+        V = rng.randint(1, 9)
+        nodos, aristas = _red_sin_empates(rng, V, rng.randint(0, V * (V - 1) // 2))
+        mst, _, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+        # Del mejor al peor cable: quitar los últimos deja las zonas
+        mst = sorted(mst, key=lambda c: c[2], reverse=(modo == "max"))
+        componentes = V - len(mst)
+        dendrograma = Dendrograma(nodos, aristas, modo)
+        assert dendrograma.minimo_zonas == componentes
+        for k in range(0, V + 2):
+            quitar = max(0, min(k, V) - componentes)
+            esperado = _particion(nodos, mst[:len(mst) - quitar])
+            assert _particion_de(dendrograma, dendrograma.zonas(k)) == esperado
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_zonas_umbral_son_componentes_de_los_cables_que_pasan(modo, red_al_azar):
+    rng = random.Random(230)
+    for _ in range(200):
+        V = rng.randint(1, 9)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, V * (V - 1) // 2), max_metros=8)
+        dendrograma = Dendrograma(nodos, aristas, modo)
+        for t in range(0, 10):
+            pasan = [c for c in aristas if (c[2] <= t if modo == "min" else c[2] >= t)]
+            assert _particion_de(dendrograma, dendrograma.zonas_umbral(t)) == \
+                _particion(nodos, pasan)
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_enlace_monotono_y_con_los_metros_del_arbol(modo, red_al_azar):
+    rng = random.Random(231)
+    for _ in range(200):
+        V = rng.randint(1, 9)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, V * (V - 1) // 2), max_metros=8)
+        mst, _, _ = ejecutar_kruskal(nodos, aristas, modo, Verbosidad.NADA)
+        filas = Dendrograma(nodos, aristas, modo).enlace()
+
+        alturas = [f[2] for f in filas]
+        assert alturas == sorted(alturas, reverse=(modo == "max"))
+        assert sorted(alturas) == sorted(m for _, _, m in mst)
+        tamanos = {x: 1 for x in range(V)}
+        for i, (a, b, _, tamano) in enumerate(filas):
+            assert a != b and a < V + i and b < V + i
+            assert tamano == tamanos.pop(a) + tamanos.pop(b)   # cada grupo se usa una vez
+            tamanos[V + i] = tamano
+
+
+def _mejor_total_con_un_transformador_por_arbol(nodos, aristas, transformadores, modo):
+    """Fuerza bruta: todos los bosques máximos sin dos transformadores en un árbol."""
+    uf = UnionFind(nodos)
+    for t in transformadores[1:]:
+        uf.union(transformadores[0], t)
+    for u, v, _ in aristas:
+        uf.union(u, v)
+    componentes = sum(1 for x in range(len(uf)) if uf.find_id(x) == x)
+    tamano = len(nodos) - componentes - max(0, len(transformadores) - 1)
+
+    totales = []
+    for cables in combinations(aristas, tamano):
+        uf = UnionFind(nodos)
+        for t in transformadores[1:]:
+            uf.union(transformadores[0], t)
+        if all(uf.union(u, v) for u, v, _ in cables):
+            totales.append(sum(m for _, _, m in cables))
+    return min(totales) if modo == "min" else max(totales)
+
+
+@pytest.mark.parametrize("modo", ["min", "max"])
+def test_cada_casa_va_al_transformador_de_su_arbol(modo, red_al_azar):
+    rng = random.Random(232)
+    for _ in range(200):
+        V = rng.randint(1, 7)
+        nodos, aristas = red_al_azar(rng, V, rng.randint(0, min(10, V * (V - 1) // 2)),
+                                     max_metros=6)
+        tipos = {n: "transformador" for n in rng.sample(nodos, rng.randint(0, min(3, V)))}
+        transformadores, etiquetas, dendrograma = zonas_de_transformadores(
+            nodos, aristas, tipos, modo)
+        assert sorted(transformadores) == sorted(tipos)
+
+        bosque = [(dendrograma.nombres[a], dendrograma.nombres[b], m)
+                  for a, b, m in dendrograma.fusiones]
+        assert sum(m for _, _, m in bosque) == \
+            _mejor_total_con_un_transformador_por_arbol(nodos, aristas, transformadores, modo)
+
+        for arbol in _particion(nodos, bosque):
+            dentro = [t for t in transformadores if t in arbol]
+            assert len(dentro) <= 1
+            esperado = transformadores.index(dentro[0]) if dentro else -1
+            assert {etiquetas[dendrograma.indice[n]] for n in arbol} == {esperado}
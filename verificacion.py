@@ -0,0 +1,129 @@
+"""
+═══════════════════════════════════════════════
+Verificación de árboles propuestos
+¿El plan de cableado que mandó un contratista (u otra herramienta)
+es de verdad óptimo para los cables que tenemos? Se responde sin
+volver a resolver ni comparar contra nuestro árbol, así que los
+empates no confunden: cualquier árbol óptimo pasa.
+
+  1. Árbol de expansión → con `UnionFind`: cada cable existe en la
+                          red, ninguno cierra ciclo y se cubren todas
+                          las zonas conexas de la red.
+  2. Optimalidad        → propiedad del ciclo: ningún cable de fuera
+                          puede ser mejor que el peor cable del camino
+                          que une sus extremos en el árbol. Todas las
+                          consultas de peor-del-camino salen de una
+                          sola tabla de saltos binarios (sensibilidad.ArbolLCA),
+                          O(E log V) en total.
+═══════════════════════════════════════════════
+"""
+
+from kruskal_red_electrica import UnionFind, clave_cable
+from sensibilidad import ArbolLCA
+
+
+class ResultadoVerificacion:
+    """
+    Atributos:
+        modo          : 'min' | 'max'
+        inexistentes  : cables propuestos que no están en la red
+        metros_distintos : (u, v, metros propuestos, metros de la red)
+        ciclos        : cables propuestos que cierran un ciclo
+        zonas_de_mas  : cuántas zonas sueltas deja el árbol que la red sí conecta
+        violaciones   : (u, v, metros, peor del camino) de cada cable de fuera
+                        que mejoraría el árbol
+    """
+
+    def __init__(self, modo):
+        self.modo             = modo
+        self.inexistentes     = []
+        self.metros_distintos = []
+        self.ciclos           = []
+        self.zonas_de_mas     = 0
+        self.violaciones      = []
+
+    @property
+    def es_arbol(self):
+        """True si el plan es un árbol (o bosque) de expansión de la red."""
+        return not (self.inexistentes or self.ciclos or self.zonas_de_mas)
+
+    @property
+    def optimo(self):
+        return self.es_arbol and not self.violaciones
+
+    def __bool__(self):
+        return self.optimo
+
+    def lineas(self, maximo=None):
+        """Genera el reporte en texto."""
+        if self.optimo:
+            yield "✔  El plan es un árbol de expansión óptimo."
+            return
+        for u, v in self.inexistentes:
+            yield f"✘  Cable inexistente en la red: {u} — {v}"
+        for u, v, m in self.ciclos:
+            yield f"✘  Cierra un ciclo: {u} — {v} ({m}m)"
+        if self.zonas_de_mas:
+            yield f"✘  Deja {self.zonas_de_mas} zona(s) sin conectar"
+        for num, (u, v, m, peor) in enumerate(self.violaciones):
+            if maximo is not None and num >= maximo:
+                yield f"… y {len(self.violaciones) - maximo} violaciones más"
+                break
+            signo = "<" if self.modo == "min" else ">"
+            yield f"✘  {u} — {v} ({m}m) {signo} peor cable de su camino en el plan ({peor}m)"
+        for u, v, propuesto, real in self.metros_distintos:
+            yield f"·  {u} — {v}: el plan dice {propuesto}m, la red {real}m (se usa {real}m)"
+
+
+def verificar_arbol(nodos, aristas, arbol, modo="min"):
+    """
+    Verifica que `arbol` (lista de (u, v, metros)) sea un árbol de
+    expansión óptimo en `modo` para la red (nodos, aristas).
+
+    Los metros se toman de `aristas` (los del plan sólo se comparan y
+    se reportan si difieren). Si la red no es conexa, basta un árbol
+    por zona. La optimalidad sólo se revisa cuando el plan es un árbol.
+    """
+    resultado = ResultadoVerificacion(modo)
+    uf = UnionFind(nodos)
+    indice = uf.indice
+
+    # Cable de la red por par de puntos (si hay repetidos, el mejor del modo)
+    cable_de = {}
+    for i, (u, v, m) in enumerate(aristas):
+        clave = clave_cable(u, v)
+        j = cable_de.get(clave)
+        if j is None or (m < aristas[j][2] if modo == "min" else m > aristas[j][2]):
+            cable_de[clave] = i
+
+    # ── 1. ¿Es árbol de expansión? ──
+    en_arbol = set()
+    for u, v, m in arbol:
+        i = cable_de.get(clave_cable(u, v))
+        if i is None or u not in indice or v not in indice:
+            resultado.inexistentes.append((u, v))
+            continue
+        if m != aristas[i][2]:
+            resultado.metros_distintos.append((u, v, m, aristas[i][2]))
+        if not uf.union_id(indice[u], indice[v]):
+            resultado.ciclos.append((u, v, aristas[i][2]))
+            continue
+        en_arbol.add(i)
+
+    zonas_arbol = sum(1 for x in range(len(uf)) if uf.find_id(x) == x)
+    for u, v, _ in aristas:
+        uf.union_id(indice[u], indice[v])
+    zonas_red = sum(1 for x in range(len(uf)) if uf.find_id(x) == x)
+    resultado.zonas_de_mas = zonas_arbol - zonas_red
+    if not resultado.es_arbol:
+        return resultado
+
+    # ── 2. Propiedad del ciclo para cada cable de fuera ──
+    lca = ArbolLCA(len(uf), sorted(en_arbol), aristas, indice, modo)
+    for i, (u, v, m) in enumerate(aristas):
+        if i in en_arbol or u == v:
+            continue
+        _, peor = lca.lca_peor(indice[u], indice[v])
+        if m < peor if modo == "min" else m > peor:
+            resultado.violaciones.append((u, v, m, peor))
+    return resultado
@@ -0,0 +1,182 @@
+"""
+═══════════════════════════════════════════════
+Zonificación por enlace simple (single-linkage)
+Una sola pasada de Kruskal guarda el orden de las uniones: ese
+orden es el dendrograma completo. Cortarlo en k zonas es aplicar
+las primeras V - k uniones; cortarlo a una distancia t es aplicar
+las de metros ≤ t. Cada consulta es O(V), sin volver a resolver.
+
+Semillas: grupos de puntos que se unen antes de la pasada (costo 0)
+y nunca se separan. Con todos los transformadores como una sola
+semilla, cortar los enlaces virtuales entre ellos deja una zona
+por transformador: la asignación de menor cable total para servir
+cada casa desde algún transformador (`zonas_de_transformadores`).
+═══════════════════════════════════════════════
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+from kruskal_red_electrica import UnionFind, ordenar_por_metros
+
+
+def _etiquetar(V, uniones):
+    """Zona (0..) de cada id tras aplicar `uniones` [(a, b), ...], en orden de aparición."""
+    parent = array("l", range(V))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in uniones:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+
+    etiquetas = array("l", [0]) * V
+    zona_de   = {}
+    for x in range(V):
+        etiquetas[x] = zona_de.setdefault(find(x), len(zona_de))
+    return etiquetas
+
+
+class Dendrograma:
+    """
+    Dendrograma de enlace simple de la red en modo MIN (une primero
+    los puntos más cercanos) o MAX (primero los cables más largos).
+
+    Atributos:
+        nombres  : list[str]              → id → nombre
+        indice   : dict[nombre] → id
+        semillas : list[(a, b)]           → uniones previas (ids)
+        fusiones : list[(a, b, metros)]   → cables del árbol en orden de unión
+        zonas_iniciales : zonas antes de la primera fusión (V - uniones de semillas)
+        minimo_zonas    : zonas que quedan con todas las fusiones (componentes)
+    """
+
+    def __init__(self, nodos, aristas, modo="min", semillas=()):
+        self.modo = modo
+        uf = UnionFind(nodos)
+        self.nombres = uf.nombres
+        self.indice  = uf.indice
+        ids = self.indice
+
+        self.semillas = []
+        for grupo in semillas:
+            grupo = [ids[n] for n in grupo]
+            for x in grupo[1:]:
+                if uf.union_id(grupo[0], x):
+                    self.semillas.append((grupo[0], x))
+
+        self.fusiones = []
+        for u, v, metros in ordenar_por_metros(aristas, modo):
+            a, b = ids[u], ids[v]
+            if uf.union_id(a, b):
+                self.fusiones.append((a, b, metros))
+        self._metros = [m for _, _, m in self.fusiones]
+
+        V = len(self.nombres)
+        self.zonas_iniciales = V - len(self.semillas)
+        self.minimo_zonas    = self.zonas_iniciales - len(self.fusiones)
+
+    # ── Consultas ──
+    def zonas(self, k):
+        """
+        Etiqueta de zona por id de punto (array('l')) cortando en k zonas.
+        Si k es menor que las componentes de la red, quedan `minimo_zonas`.
+        """
+        n = min(len(self.fusiones), max(0, self.zonas_iniciales - k))
+        return self._aplicar(n)
+
+    def zonas_umbral(self, t):
+        """
+        Zonas uniendo sólo por cables de a lo más t metros (MIN) o de al
+        menos t metros (MAX).
+        """
+        if self.modo == "min":
+            n = bisect_right(self._metros, t)
+        else:
+            # _metros va de mayor a menor: contar los ≥ t
+            n = len(self._metros) - bisect_left(self._metros[::-1], t)
+        return self._aplicar(n)
+
+    def _aplicar(self, n):
+        uniones = self.semillas + [(a, b) for a, b, _ in self.fusiones[:n]]
+        return _etiquetar(len(self.nombres), uniones)
+
+    def grupos(self, etiquetas):
+        """Lista de zonas como listas de nombres a partir de unas etiquetas."""
+        zonas = [[] for _ in range(max(etiquetas, default=-1) + 1)]
+        for x, z in enumerate(etiquetas):
+            zonas[z].append(self.nombres[x])
+        return zonas
+
+    def por_nombre(self, etiquetas):
+        """dict[nombre] → zona."""
+        return dict(zip(self.nombres, etiquetas))
+
+    def enlace(self):
+        """
+        Dendrograma en formato de matriz de enlace de SciPy: una fila
+        [grupo_a, grupo_b, metros, tamaño] por fusión, con los grupos
+        0..V-1 para los puntos y V + i para el creado en la fila i
+        (las semillas cuentan como fusiones de 0 metros al principio).
+        """
+        V = len(self.nombres)
+        parent  = list(range(V))
+        grupo   = list(range(V))   # raíz → id de grupo en la matriz
+        tamano  = [1] * V
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        filas = []
+        todas = [(a, b, 0) for a, b in self.semillas] + self.fusiones
+        for a, b, metros in todas:
+            ra, rb = find(a), find(b)
+            filas.append([grupo[ra], grupo[rb], metros, tamano[ra] + tamano[rb]])
+            parent[rb] = ra
+            tamano[ra] += tamano[rb]
+            grupo[ra] = V + len(filas) - 1
+        return filas
+
+
+def zonas_de_transformadores(nodos, aristas, tipos, modo="min"):
+    """
+    Una zona por transformador: todos los transformadores se unen como
+    una semilla, se corre la pasada y luego cada punto queda con el
+    transformador al que lo conecta el árbol (sin los enlaces virtuales).
+
+    Retorna:
+        transformadores : list[str]       → zona i = transformadores[i]
+        etiquetas       : array('l')      → zona de cada id (-1 = sin transformador)
+        dendrograma     : Dendrograma     → para más consultas
+    """
+    transformadores = [n for n in dict.fromkeys(nodos) if tipos.get(n) == "transformador"]
+    dendrograma = Dendrograma(nodos, aristas, modo, semillas=[transformadores])
+
+    V = len(dendrograma.nombres)
+    vecinos = [[] for _ in range(V)]
+    for a, b, _ in dendrograma.fusiones:
+        vecinos[a].append(b)
+        vecinos[b].append(a)
+
+    etiquetas = array("l", [-1]) * V
+    cola = deque()
+    for z, nombre in enumerate(transformadores):
+        x = dendrograma.indice[nombre]
+        etiquetas[x] = z
+        cola.append(x)
+    while cola:
+        x = cola.popleft()
+        for y in vecinos[x]:
+            if etiquetas[y] == -1:
+                etiquetas[y] = etiquetas[x]
+                cola.append(y)
+    return transformadores, etiquetas, dendrograma